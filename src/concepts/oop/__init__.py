@@ -1,3 +1,20 @@
-from src.concepts.oop.super_method_understanding import SuperMethodConcept, testing_super_method_concept, var_gh
+import importlib
 
 __all__ = ["SuperMethodConcept", "testing_super_method_concept", "var_gh"]
+
+# The submodule (and the logging setup it pulls in) is only imported the
+# first time one of the exported names is accessed.
+_LAZY_ATTRS = {name: "src.concepts.oop.super_method_understanding" for name in __all__}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
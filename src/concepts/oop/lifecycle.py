@@ -0,0 +1,97 @@
+import atexit
+import logging
+import threading
+import time
+
+
+class LifecycleTracer:
+    """
+    Counts object constructions per class and logs periodic summaries.
+    `created(obj)` only bumps a counter in a thread-local dict, no lock and
+    no log record on the hot path. A daemon thread (started on the first
+    construction) emits one INFO summary record per class every `interval`
+    seconds, with the `class_name`, `count` and `rate_per_s` of the interval
+    as extras, so they reach the JSON pipeline as structured fields.
+    Individual creation records are only produced at DEBUG, and then only
+    for one construction out of `sample_every` per thread.
+    """
+
+    def __init__(self, logger: logging.Logger, interval: float = 10.0, sample_every: int = 1000):
+        self.logger = logger
+        self.interval = interval
+        self.sample_every = sample_every
+        self._local = threading.local()
+        self._all_counts = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._reported = {}
+        self._last_flush = time.monotonic()
+        self._flusher = None
+        self._stop_event = threading.Event()
+
+    def _counts(self) -> dict:
+        counts = self._local.__dict__.get("counts")
+        if counts is None:
+            counts = self._local.counts = {}
+            with self._lock:
+                self._all_counts.append(counts)
+                if self._flusher is None:
+                    self._start_flusher()
+        return counts
+
+    def created(self, obj, msg: str | None = None, *args) -> None:
+        """
+        Count the construction of `obj`; `msg % args` is the sampled DEBUG record.
+        """
+        counts = self._local.__dict__.get("counts") or self._counts()
+        cls = type(obj)
+        count = counts[cls] = counts.get(cls, 0) + 1
+        if msg is not None and (count - 1) % self.sample_every == 0 and self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(msg, *args, extra={"class_name": cls.__name__, "sampled_every": self.sample_every}, stacklevel=2)
+
+    def totals(self) -> dict[str, int]:
+        """Constructions per class name since the start, summed over all threads."""
+        with self._lock:
+            # dict() copies are atomic under the GIL, the owner threads keep counting
+            snapshots = [dict(counts) for counts in self._all_counts]
+        totals = {}
+        for snapshot in snapshots:
+            for cls, count in snapshot.items():
+                totals[cls.__name__] = totals.get(cls.__name__, 0) + count
+        return totals
+
+    def flush(self) -> None:
+        """Log one summary record per class constructed since the previous flush."""
+        with self._flush_lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        now = time.monotonic()
+        elapsed = max(now - self._last_flush, 1e-9)
+        self._last_flush = now
+        totals = self.totals()
+        for class_name, total in totals.items():
+            count = total - self._reported.get(class_name, 0)
+            if not count:
+                continue
+            self._reported[class_name] = total
+            self.logger.info(
+                "lifecycle summary: %d %s objects created in %.1f s",
+                count,
+                class_name,
+                elapsed,
+                extra={"class_name": class_name, "count": count, "rate_per_s": round(count / elapsed, 1), "interval_s": round(elapsed, 3)},
+            )
+
+    def _start_flusher(self) -> None:
+        self._flusher = threading.Thread(target=self._run, name="LifecycleTracer", daemon=True)
+        self._flusher.start()
+        atexit.register(self.stop)
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self.flush()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.flush()
@@ -1,11 +1,47 @@
 __all__ = ["Employee"]
 
+import functools
 import random
+import warnings
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 
-from rich.console import Console
+from src.helper.id_allocator import IdAllocator
 
-console = Console()
+# Shared by every employee class of the helper package, ids come from
+# per-thread blocks so creating employees never takes a global lock.
+EMPLOYEE_IDS = IdAllocator()
+
+
+@functools.cache
+def get_console():
+    """Create the rich console on first use, importing rich is the bulk of this module's import time."""
+    from rich.console import Console
+
+    return Console()
+
+
+def __getattr__(name):
+    # Keep `from src.helper.caller import console` working without paying for it at import
+    if name == "console":
+        return get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _EmployeeConfig(Mapping):
+    """Read-only stand-in for the former `Employee.CONFIG` counter dict, backed by `EMPLOYEE_IDS`."""
+
+    def __getitem__(self, key):
+        if key != "num_of_emp":
+            raise KeyError(key)
+        warnings.warn("Employee.CONFIG['num_of_emp'] is deprecated, use EMPLOYEE_IDS.issued", DeprecationWarning, stacklevel=2)
+        return EMPLOYEE_IDS.issued
+
+    def __iter__(self):
+        return iter(("num_of_emp",))
+
+    def __len__(self):
+        return 1
 
 
 # @dataclass(order=True, repr=False)
@@ -20,12 +56,11 @@ class Employee:
     emp_id: int = field(init=False, repr=True)
 
     # class attributes
-    CONFIG = {"num_of_emp": 0}
+    CONFIG = _EmployeeConfig()  # Deprecated, ids and the employee count now come from EMPLOYEE_IDS
 
     def __post_init__(self):
-        # Correct the method name and increment the number of employees
-        Employee.CONFIG["num_of_emp"] += 1
-        self.emp_id = Employee.CONFIG["num_of_emp"]
+        # Unique across threads (and across a process pool once EMPLOYEE_IDS.share() is used)
+        self.emp_id = EMPLOYEE_IDS.next_id()
 
     def __str__(self):
         # Use rich string formatting for better readability
@@ -33,6 +68,7 @@ class Employee:
 
     @classmethod
     def generate(cls):
+        console = get_console()
         for _ in range(10):
             emp = Employee(
                 first_name="Jack",
@@ -42,7 +78,7 @@ class Employee:
                 gender=random.choice(["male", "female"]),
             )
             console.log(str(emp))
-        console.log(f"Total number of employees generated: {cls.CONFIG['num_of_emp']}")
+        console.log(f"Total number of employees generated: {EMPLOYEE_IDS.issued}")
 
 
 if __name__ == "__main__":
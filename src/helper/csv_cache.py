@@ -0,0 +1,245 @@
+__all__ = ["CachedTable", "StringColumn", "load_cached"]
+
+import hashlib
+import json
+import os
+import random
+import shutil
+import tempfile
+import time
+from array import array
+
+import numpy as np
+
+from src.helper.csv_loader import WOMEN_IN_SCIENCE_SCHEMA, CsvSchema, load_batches, parse_bool
+
+CACHE_VERSION = 2
+META_FILE = "meta.json"
+
+# Storage dtype of each converter, everything else is stored as UTF-8 strings
+NUMERIC_KINDS = {int: "int64", float: "float64", parse_bool: "bool"}
+
+
+class StringColumn:
+    """
+    Variable width strings stored as one UTF-8 blob plus `n + 1` offsets.
+    Both arrays are memory mapped, a value is only decoded when accessed.
+    Missing cells are empty in the blob and False in `valid` (None when no
+    cell is missing), they read back as `None`.
+    """
+
+    def __init__(self, offsets: np.ndarray, data: np.ndarray, valid: np.ndarray | None = None):
+        self.offsets = offsets
+        self.data = data
+        self.valid = valid
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> str | None:
+        if self.valid is not None and not self.valid[i]:
+            return None
+        return self.data[self.offsets[i] : self.offsets[i + 1]].tobytes().decode("utf-8")
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def tolist(self) -> list[str]:
+        raw = self.data.tobytes()
+        offsets = self.offsets.tolist()
+        if raw.isascii():
+            # Byte offsets are character offsets, decode the blob once
+            text = raw.decode("ascii")
+            values = [text[start:stop] for start, stop in zip(offsets, offsets[1:])]
+        else:
+            values = [raw[start:stop].decode("utf-8") for start, stop in zip(offsets, offsets[1:])]
+        if self.valid is None:
+            return values
+        return [value if ok else None for value, ok in zip(values, self.valid.tolist())]
+
+
+class CachedTable:
+    """
+    Columns of a cached CSV: NumPy arrays (memory mapped) for numeric columns,
+    `StringColumn` otherwise. Numeric columns with missing cells are masked
+    arrays of their own dtype (`np.ma.MaskedArray`), masked where a cell was empty.
+    """
+
+    def __init__(self, header: list[str], columns: dict, n_rows: int):
+        self.header = header
+        self.columns = columns
+        self.n_rows = n_rows
+
+    def __len__(self) -> int:
+        return self.n_rows
+
+    def column(self, name: str):
+        return self.columns[name]
+
+
+def cache_path_for(path, cache_dir=None) -> str:
+    """`<file>.cache` next to the CSV, or a directory named after the CSV path inside `cache_dir`."""
+    path = os.path.abspath(path)
+    if cache_dir is None:
+        return f"{path}.cache"
+    key = hashlib.sha1(path.encode()).hexdigest()[:16]
+    return os.path.join(cache_dir, f"{os.path.basename(path)}-{key}.cache")
+
+
+def file_digest(path, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as file:
+        while chunk := file.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_meta(cache_path: str) -> dict | None:
+    try:
+        with open(os.path.join(cache_path, META_FILE)) as f_in:
+            meta = json.load(f_in)
+    except (OSError, ValueError):
+        return None
+    return meta if meta.get("version") == CACHE_VERSION else None
+
+
+def _write_meta(cache_path: str, meta: dict) -> None:
+    tmp_file = os.path.join(cache_path, f"{META_FILE}.tmp")
+    with open(tmp_file, "w") as f_out:
+        json.dump(meta, f_out, indent=2)
+    os.replace(tmp_file, os.path.join(cache_path, META_FILE))
+
+
+def build_cache(path, cache_path: str, schema: CsvSchema = WOMEN_IN_SCIENCE_SCHEMA) -> dict:
+    """
+    Parse the CSV once (streaming, see `csv_loader`) and write one `.npy` file per column.
+    Columns keep their type; a column with missing cells also gets a
+    `<i>.valid.npy` boolean mask (listed under `missing` in the metadata),
+    the missing cells themselves holding 0, False or an empty string.
+    """
+    stat = os.stat(path)
+    header, buffers, valids, n_rows = None, None, None, 0
+    for header, batch in load_batches(path, schema):
+        if buffers is None:
+            buffers = [(bytearray(), array("q", [0])) if schema.converters.get(name, str) not in NUMERIC_KINDS else [] for name in header]
+            valids = [bytearray() for _ in header]
+        n_rows += len(batch)
+        for buffer, valid, values in zip(buffers, valids, zip(*batch)):
+            valid.extend(value is not None for value in values)
+            if isinstance(buffer, tuple):
+                data, offsets = buffer
+                for value in values:
+                    data += ("" if value is None else value).encode("utf-8")
+                    offsets.append(len(data))
+            else:
+                buffer.extend(values)
+    if header is None:
+        raise ValueError(f"Empty dataset: {path}")
+
+    tmp_path = tempfile.mkdtemp(prefix=os.path.basename(cache_path) + ".", dir=os.path.dirname(cache_path))
+    columns = {}
+    missing = []
+    for i, (name, buffer, valid) in enumerate(zip(header, buffers, valids)):
+        valid = np.frombuffer(valid, dtype=bool)
+        if valid.all():
+            valid = None
+        else:
+            np.save(os.path.join(tmp_path, f"{i}.valid.npy"), valid)
+            missing.append(name)
+        if isinstance(buffer, tuple):
+            data, offsets = buffer
+            np.save(os.path.join(tmp_path, f"{i}.data.npy"), np.frombuffer(bytes(data), dtype=np.uint8))
+            np.save(os.path.join(tmp_path, f"{i}.offsets.npy"), np.frombuffer(offsets, dtype=np.int64))
+            columns[name] = "str"
+            continue
+        kind = NUMERIC_KINDS[schema.converters[name]]
+        if valid is not None:
+            buffer = [0 if value is None else value for value in buffer]
+        np.save(os.path.join(tmp_path, f"{i}.npy"), np.asarray(buffer, dtype=kind))
+        columns[name] = kind
+
+    meta = {
+        "version": CACHE_VERSION,
+        "source": os.path.abspath(path),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "digest": file_digest(path),
+        "header": header,
+        "n_rows": n_rows,
+        "columns": columns,
+        "missing": missing,
+    }
+    _write_meta(tmp_path, meta)
+    shutil.rmtree(cache_path, ignore_errors=True)
+    os.replace(tmp_path, cache_path)
+    return meta
+
+
+def map_cache(cache_path: str, meta: dict) -> CachedTable:
+    columns = {}
+    missing = set(meta["missing"])
+    for i, name in enumerate(meta["header"]):
+        valid = np.load(os.path.join(cache_path, f"{i}.valid.npy"), mmap_mode="r") if name in missing else None
+        if meta["columns"][name] == "str":
+            offsets = np.load(os.path.join(cache_path, f"{i}.offsets.npy"), mmap_mode="r")
+            data = np.load(os.path.join(cache_path, f"{i}.data.npy"), mmap_mode="r")
+            columns[name] = StringColumn(offsets, data, valid)
+        else:
+            values = np.load(os.path.join(cache_path, f"{i}.npy"), mmap_mode="r")
+            columns[name] = values if valid is None else np.ma.MaskedArray(values, mask=~valid)
+    return CachedTable(meta["header"], columns, meta["n_rows"])
+
+
+def load_cached(path, schema: CsvSchema = WOMEN_IN_SCIENCE_SCHEMA, cache_dir=None) -> CachedTable:
+    """
+    Load a CSV through its binary cache, building or rebuilding it when needed.
+    The cache is keyed by the source path (its location), size, mtime and a
+    content digest. A matching size and mtime maps the cache directly; when
+    only the mtime changed (e.g. a `touch`), the digest is recomputed and the
+    cache is kept if the content is the same.
+    """
+    cache_path = cache_path_for(path, cache_dir)
+    if cache_dir is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+    stat = os.stat(path)
+    meta = _read_meta(cache_path)
+    if meta is not None and meta["source"] == os.path.abspath(path) and meta["size"] == stat.st_size:
+        if meta["mtime_ns"] == stat.st_mtime_ns:
+            return map_cache(cache_path, meta)
+        if meta["digest"] == file_digest(path):
+            meta["mtime_ns"] = stat.st_mtime_ns
+            _write_meta(cache_path, meta)
+            return map_cache(cache_path, meta)
+    return map_cache(cache_path, build_cache(path, cache_path, schema))
+
+
+def benchmark_csv_cache(n: int = 1_000_000) -> None:
+    """Load time of a `n` row CSV shaped like `famous_women_in_science.csv`: text parse vs. cold cache build vs. warm mmap."""
+    from src.helper.caller import get_console
+
+    console = get_console()
+    rng = random.Random(0)
+    fields = ["math", "physics", "chemistry", "astronomy", "biology"]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "women_in_science.csv")
+        with open(path, "w") as f_out:
+            f_out.write("Name,Field,Born,Nobel Prize?\n")
+            for i in range(n):
+                f_out.write(f"Scientist {i},{rng.choice(fields)},{rng.randint(1800, 2000)},{rng.choice(['yes', 'no'])}\n")
+
+        start = time.perf_counter()
+        rows = sum(len(batch) for _, batch in load_batches(path))
+        console.log(f"[ INFO ] text parse:        {time.perf_counter() - start:8.3f} s ({rows:,} rows)")
+
+        start = time.perf_counter()
+        load_cached(path)
+        console.log(f"[ INFO ] cold (parse+build): {time.perf_counter() - start:8.3f} s")
+
+        start = time.perf_counter()
+        table = load_cached(path)
+        born = table.column("Born")
+        console.log(f"[ INFO ] warm mmap:         {time.perf_counter() - start:8.3f} s, mean Born: {born.mean():.1f}")
+
+
+if __name__ == "__main__":
+    benchmark_csv_cache()
@@ -0,0 +1,110 @@
+__all__ = ["CsvSchema", "WOMEN_IN_SCIENCE_SCHEMA", "parse_bool", "iter_blocks", "parse_block", "load_batches"]
+
+import csv
+import io
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+DEFAULT_CHUNK_SIZE = 1 << 20  # 1 MiB of raw text per block
+
+TRUE_VALUES = frozenset({"yes", "true", "1", "y"})
+FALSE_VALUES = frozenset({"no", "false", "0", "n"})
+
+
+def parse_bool(value: str) -> bool:
+    lowered = value.strip().lower()
+    if lowered in TRUE_VALUES:
+        return True
+    if lowered in FALSE_VALUES:
+        return False
+    raise ValueError(f"Not a boolean value: {value!r}")
+
+
+class CsvSchema:
+    """
+    Header-driven schema: maps column names to converters (`int`, `float`,
+    `parse_bool`, ...). Columns missing from the mapping are kept as `str`,
+    empty cells become `None`.
+    """
+
+    def __init__(self, converters: dict[str, callable]):
+        self.converters = dict(converters)
+
+    def bind(self, header: list[str]) -> list:
+        """Return the converters in the column order of a header."""
+        return [self.converters.get(name, str) for name in header]
+
+
+WOMEN_IN_SCIENCE_SCHEMA = CsvSchema({"Name": str, "Field": str, "Born": int, "Nobel Prize?": parse_bool})
+
+
+def iter_blocks(file, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Yield blocks of complete CSV records read in fixed-size chunks.
+    Args:
+        file (BinaryIO): File object positioned after the header.
+        chunk_size (int): Number of bytes read per call.
+    A block always ends on a record boundary: the tail after the last newline
+    is carried over to the next block, and so is a block that stops inside a
+    quoted field (odd number of quote characters).
+    """
+    carry = b""
+    while chunk := file.read(chunk_size):
+        data = carry + chunk
+        cut = data.rfind(b"\n") + 1
+        while cut and data.count(b'"', 0, cut) % 2:
+            cut = data.rfind(b"\n", 0, cut - 1) + 1
+        block, carry = data[:cut], data[cut:]
+        if block:
+            yield block
+    if carry:
+        yield carry
+
+
+def parse_block(block: bytes, converters: list, encoding: str = "utf-8") -> list[tuple]:
+    """Parse a block of CSV records into a batch of typed tuples."""
+    batch = []
+    append = batch.append
+    for row in csv.reader(io.StringIO(block.decode(encoding), newline="")):
+        if not row:
+            continue
+        append(tuple(None if value == "" else convert(value) for convert, value in zip(converters, row)))
+    return batch
+
+
+def read_header(file, encoding: str = "utf-8") -> list[str]:
+    return next(csv.reader([file.readline().decode(encoding)]))
+
+
+def load_batches(path: str | os.PathLike, schema: CsvSchema = WOMEN_IN_SCIENCE_SCHEMA, chunk_size: int = DEFAULT_CHUNK_SIZE, processes: int | None = None, encoding: str = "utf-8"):
+    """
+    Stream a CSV file as batches of typed rows.
+    Args:
+        path (str | PathLike): The CSV file, its first line is the header.
+        schema (CsvSchema): Converters for the header columns.
+        chunk_size (int): Bytes read per block, one block gives one batch.
+        processes (int | None): Parse the blocks in a process pool of that
+            size; at most `2 * processes` blocks are in flight at any time.
+    Yields:
+        tuple[list[str], list[tuple]]: The header and a batch of rows, in file order.
+    Memory stays bounded by the chunk size (times the number of in-flight
+    blocks), whatever the size of the file.
+    """
+    with open(path, "rb") as file:
+        header = read_header(file, encoding)
+        converters = schema.bind(header)
+        blocks = iter_blocks(file, chunk_size)
+        if not processes:
+            for block in blocks:
+                yield header, parse_block(block, converters, encoding)
+            return
+
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            pending = deque()
+            for block in blocks:
+                pending.append(pool.submit(parse_block, block, converters, encoding))
+                if len(pending) >= 2 * processes:
+                    yield header, pending.popleft().result()
+            while pending:
+                yield header, pending.popleft().result()
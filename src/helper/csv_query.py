@@ -0,0 +1,244 @@
+__all__ = ["Dataset", "QueryEngine"]
+
+import os
+
+import numpy as np
+
+from src.helper.csv_cache import load_cached
+from src.helper.csv_loader import WOMEN_IN_SCIENCE_SCHEMA, CsvSchema, load_batches
+
+
+def _as_array(values):
+    """
+    `(array, valid)` for a numeric or bool column, `valid` being None when no
+    cell is missing; None for the other columns (kept as lists).
+    """
+    if np.ma.isMaskedArray(values):
+        # Cached columns with missing cells (see `csv_cache`)
+        return np.ma.getdata(values), ~np.ma.getmaskarray(values)
+    if isinstance(values, np.ndarray):
+        return np.asarray(values), None
+    present = [value for value in values if value is not None]
+    if not present or not isinstance(present[0], (bool, int, float)):
+        return None
+    if len(present) == len(values):
+        return np.asarray(values), None
+    valid = np.fromiter((value is not None for value in values), dtype=bool, count=len(values))
+    present = np.asarray(present)
+    array = np.zeros(len(values), dtype=present.dtype)
+    array[valid] = present
+    return array, valid
+
+
+class Dataset:
+    """
+    Column-oriented, indexed copy of a CSV dataset.
+    - Categorical columns are dictionary encoded: `codes[column]` holds one
+      int32 code per row into `categories[column]`.
+    - Numeric and bool columns are plain NumPy arrays, other columns are kept
+      as Python lists (they are only materialized in results).
+    - Each column in `sorted_on` gets a sorted index (`argsort` order plus
+      the sorted values) answering range predicates with two `searchsorted`.
+    Missing cells (`None`) get their own category, the last one, in
+    categorical columns. Numeric and bool columns keep their dtype with a
+    filler value and a validity mask in `valid[column]`; missing values never
+    match a predicate (except `equals(column, None)`), sort last in the
+    sorted indexes and are decoded back to `None`.
+    """
+
+    def __init__(self, header: list[str], columns: dict, n_rows: int, categorical=(), sorted_on=()):
+        self.header = header
+        self.n_rows = n_rows
+        columns = dict(columns)
+
+        self.codes = {}
+        self.categories = {}
+        self.category_codes = {}
+        for name in categorical:
+            values = columns.pop(name)
+            values = values.tolist() if hasattr(values, "tolist") else values
+            values = np.asarray(values, dtype=object)
+            missing = np.fromiter((value is None for value in values), dtype=bool, count=len(values))
+            # None does not compare with the other values, it is given the code after the last category
+            categories, codes = np.unique(values[~missing], return_inverse=True)
+            self.categories[name] = categories.tolist() + ([None] if missing.any() else [])
+            self.category_codes[name] = {category: code for code, category in enumerate(self.categories[name])}
+            self.codes[name] = np.full(len(values), len(categories), dtype=np.int32)
+            self.codes[name][~missing] = codes
+
+        self.arrays = {}
+        self.valid = {}
+        self.values = {}
+        for name, values in columns.items():
+            column = _as_array(values)
+            if column is None:
+                self.values[name] = values
+                continue
+            self.arrays[name], valid = column
+            if valid is not None:
+                self.valid[name] = valid
+
+        self.sorted_index = {}
+        for name in sorted_on:
+            values = self.arrays[name]
+            valid = self.valid.get(name)
+            if valid is None:
+                order = np.argsort(values, kind="stable")
+                self.sorted_index[name] = (order, values[order])
+            else:
+                # Valid rows first, in value order, then the missing ones; only the valid values are searched
+                order = np.lexsort((values, ~valid))
+                self.sorted_index[name] = (order, values[order[: np.count_nonzero(valid)]])
+
+    @classmethod
+    def from_rows(cls, header: list[str], rows: list[tuple], categorical=(), sorted_on=()) -> "Dataset":
+        columns = dict(zip(header, map(list, zip(*rows)))) if rows else {name: [] for name in header}
+        return cls(header, columns, len(rows), categorical, sorted_on)
+
+    @classmethod
+    def from_csv(cls, path, schema: CsvSchema = WOMEN_IN_SCIENCE_SCHEMA, categorical=("Field", "Nobel Prize?"), sorted_on=("Born",), cache: bool = False, cache_dir=None) -> "Dataset":
+        """
+        Load a CSV file, either by parsing the text or, with `cache=True`,
+        through the memory-mapped binary cache of `csv_cache` (built on first use).
+        """
+        if cache:
+            table = load_cached(path, schema, cache_dir)
+            return cls(table.header, table.columns, table.n_rows, categorical, sorted_on)
+        header, rows = None, []
+        for header, batch in load_batches(path, schema):
+            rows.extend(batch)
+        if header is None:
+            raise ValueError(f"Empty dataset: {path}")
+        return cls.from_rows(header, rows, categorical, sorted_on)
+
+    # ------------------------------------------------------------------ #
+    # Predicates, all returning boolean row masks
+    # ------------------------------------------------------------------ #
+    def equals(self, column: str, value) -> np.ndarray:
+        if column in self.codes:
+            code = self.category_codes[column].get(value)
+            if code is None:
+                return np.zeros(self.n_rows, dtype=bool)
+            return self.codes[column] == code
+        if column in self.arrays:
+            valid = self.valid.get(column)
+            if value is None:
+                return np.zeros(self.n_rows, dtype=bool) if valid is None else ~valid
+            mask = self.arrays[column] == value
+            return mask if valid is None else mask & valid
+        return np.fromiter((item == value for item in self.values[column]), dtype=bool, count=self.n_rows)
+
+    def between(self, column: str, low=None, high=None) -> np.ndarray:
+        """Rows with `low <= column <= high`, through the sorted index when there is one."""
+        if column not in self.sorted_index:
+            values = self.arrays[column]
+            mask = self.valid[column].copy() if column in self.valid else np.ones(self.n_rows, dtype=bool)
+            if low is not None:
+                mask &= values >= low
+            if high is not None:
+                mask &= values <= high
+            return mask
+        order, sorted_values = self.sorted_index[column]
+        start = 0 if low is None else np.searchsorted(sorted_values, low, side="left")
+        stop = len(sorted_values) if high is None else np.searchsorted(sorted_values, high, side="right")
+        mask = np.zeros(self.n_rows, dtype=bool)
+        mask[order[start:stop]] = True
+        return mask
+
+    def mask(self, where: dict | None = None, ranges: dict | None = None) -> np.ndarray:
+        mask = np.ones(self.n_rows, dtype=bool)
+        for column, value in (where or {}).items():
+            mask &= self.equals(column, value)
+        for column, (low, high) in (ranges or {}).items():
+            mask &= self.between(column, low, high)
+        return mask
+
+    # ------------------------------------------------------------------ #
+    # Results
+    # ------------------------------------------------------------------ #
+    def count(self, mask: np.ndarray) -> int:
+        return int(np.count_nonzero(mask))
+
+    def group_count(self, by: str, mask: np.ndarray) -> dict:
+        """Number of matching rows per category of a categorical column."""
+        counts = np.bincount(self.codes[by][mask], minlength=len(self.categories[by]))
+        return {category: int(count) for category, count in zip(self.categories[by], counts)}
+
+    def column(self, name: str, indices: np.ndarray | None = None) -> list:
+        """Decoded values of a column, for all rows or only the given row indices."""
+        if name in self.codes:
+            categories = self.categories[name]
+            codes = self.codes[name] if indices is None else self.codes[name][indices]
+            return [categories[code] for code in codes.tolist()]
+        if name in self.arrays:
+            values = self.arrays[name] if indices is None else self.arrays[name][indices]
+            if name not in self.valid:
+                return values.tolist()
+            valid = self.valid[name] if indices is None else self.valid[name][indices]
+            return [value if ok else None for value, ok in zip(values.tolist(), valid.tolist())]
+        values = self.values[name]
+        return values if indices is None else [values[i] for i in indices.tolist()]
+
+    def rows(self, mask: np.ndarray) -> list[tuple]:
+        indices = np.flatnonzero(mask)
+        return list(zip(*(self.column(name, indices) for name in self.header)))
+
+
+class QueryEngine:
+    """
+    Cached queries over a CSV file.
+    Results are memoized per query; the file's modification time (and size)
+    is checked on each call, and a change reloads the dataset and drops the
+    cache.
+    Usage:
+        engine = QueryEngine("src/data/famous_women_in_science.csv")
+        engine.group_count("Field", where={"Nobel Prize?": True})
+        engine.count(ranges={"Born": (1850, 1900)})
+    """
+
+    def __init__(self, path, schema: CsvSchema = WOMEN_IN_SCIENCE_SCHEMA, categorical=("Field", "Nobel Prize?"), sorted_on=("Born",), cache: bool = False, cache_dir=None):
+        self.path = path
+        self.cache = cache
+        self.cache_dir = cache_dir
+        self.schema = schema
+        self.categorical = categorical
+        self.sorted_on = sorted_on
+        self._dataset = None
+        self._signature = None
+        self._cache = {}
+
+    @property
+    def dataset(self) -> Dataset:
+        stat = os.stat(self.path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature != self._signature:
+            self._dataset = Dataset.from_csv(self.path, self.schema, self.categorical, self.sorted_on, self.cache, self.cache_dir)
+            self._signature = signature
+            self._cache.clear()
+        return self._dataset
+
+    def _query(self, kind: str, where, ranges, *args):
+        dataset = self.dataset
+        key = (kind, frozenset((where or {}).items()), frozenset((ranges or {}).items()), args)
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        mask = dataset.mask(where, ranges)
+        if kind == "count":
+            result = dataset.count(mask)
+        elif kind == "group_count":
+            result = dataset.group_count(args[0], mask)
+        else:
+            result = dataset.rows(mask)
+        self._cache[key] = result
+        return result
+
+    def count(self, where: dict | None = None, ranges: dict | None = None) -> int:
+        return self._query("count", where, ranges)
+
+    def group_count(self, by: str, where: dict | None = None, ranges: dict | None = None) -> dict:
+        return self._query("group_count", where, ranges, by)
+
+    def rows(self, where: dict | None = None, ranges: dict | None = None) -> list[tuple]:
+        return self._query("rows", where, ranges)
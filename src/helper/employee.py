@@ -1,11 +1,121 @@
+import atexit
+import contextlib
 import logging
+import os
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 formatter = logging.Formatter("%(levelname)s:%(name)s:%(message)s")
-file_handler = logging.FileHandler("employee.log")
-file_handler.setFormatter(formatter)
-logger.addHandler(file_handler)
+
+# The file handler is created on the first audit record (and the file opened
+# on its first write), not when this module is imported. The file sits next to
+# this module whatever the working directory, unless EMPLOYEE_AUDIT_LOG names another one.
+LOG_FILE = os.environ.get("EMPLOYEE_AUDIT_LOG", os.path.join(os.path.dirname(os.path.abspath(__file__)), "employee.log"))
+file_handler = None
+_file_handler_lock = threading.Lock()
+
+
+def get_file_handler() -> logging.FileHandler:
+    global file_handler
+    if file_handler is None:
+        with _file_handler_lock:
+            if file_handler is None:
+                handler = logging.FileHandler(LOG_FILE, delay=True)
+                handler.setFormatter(formatter)
+                logger.addHandler(handler)
+                file_handler = handler
+    return file_handler
+
+
+class AuditBatch:
+    """
+    In-memory batch of employee creations, written as one summarized record.
+    The batch is flushed when it holds `max_size` entries, when `interval`
+    seconds passed since the last flush (checked on each new entry and by a
+    background timer, so a partial batch does not wait for the next
+    creation), on `flush()`, on `close()` and at interpreter exit.
+    """
+
+    def __init__(self, max_size: int = 1000, interval: float = 1.0):
+        self.max_size = max_size
+        self.interval = interval
+        self._entries = []
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self._stop_event = threading.Event()
+        self._timer = None
+        if interval != float("inf"):
+            self._timer = threading.Thread(target=self._flush_periodically, name="AuditBatch", daemon=True)
+            self._timer.start()
+
+    def add(self, first_name, last_name, class_name) -> None:
+        with self._lock:
+            self._entries.append((first_name, last_name, class_name))
+            full = len(self._entries) >= self.max_size or time.monotonic() - self._last_flush >= self.interval
+        if full:
+            self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            entries, self._entries = self._entries, []
+            self._last_flush = time.monotonic()
+        if not entries:
+            return
+        get_file_handler()
+        lines = "\n".join(f"    {first}-{last} using class : {class_name}" for first, last, class_name in entries)
+        logger.info("Created %d Employees:\n%s", len(entries), lines)
+
+    def _flush_periodically(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            if self._entries and time.monotonic() - self._last_flush >= self.interval:
+                self.flush()
+
+    def close(self) -> None:
+        """Stop the timer and write what is left."""
+        self._stop_event.set()
+        if self._timer is not None and self._timer is not threading.current_thread():
+            self._timer.join()
+        self.flush()
+
+
+audit_batch = None  # Active AuditBatch, None means one record per employee
+
+
+def enable_audit_batching(max_size: int = 1000, interval: float = 1.0) -> AuditBatch:
+    global audit_batch
+    disable_audit_batching()
+    audit_batch = AuditBatch(max_size, interval)
+    return audit_batch
+
+
+def disable_audit_batching() -> None:
+    global audit_batch
+    batch, audit_batch = audit_batch, None
+    if batch is not None:
+        batch.close()
+
+
+@contextlib.contextmanager
+def batched_audit(max_size: int = 1_000_000, interval: float = float("inf")):
+    """
+    Record every employee created inside the block into a single summary record.
+    Usage:
+        with batched_audit():
+            employees = [Employee(first, last) for first, last in names]
+    """
+    previous = audit_batch
+    batch = enable_audit_batching(max_size, interval)
+    try:
+        yield batch
+    finally:
+        disable_audit_batching()
+        if previous is not None:
+            enable_audit_batching(previous.max_size, previous.interval)
+
+
+atexit.register(disable_audit_batching)
 
 
 class Employee:
@@ -14,7 +124,13 @@ class Employee:
     def __init__(self, first_name=None, last_name=None):
         self.first_name = first_name
         self.last_name = last_name
-        logger.info(f"Created Employee: {self.first_name}-{self.last_name} using class : {self.__class__.__name__}")
+        if logger.isEnabledFor(logging.INFO):
+            batch = audit_batch
+            if batch is not None:
+                batch.add(first_name, last_name, self.__class__.__name__)
+            else:
+                get_file_handler()
+                logger.info("Created Employee: %s-%s using class : %s", self.first_name, self.last_name, self.__class__.__name__)
 
     def __str__(self):
         return f"Created Employee: {self.first_name}-{self.last_name} using class : {self.__class__.__name__}"
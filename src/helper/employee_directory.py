@@ -0,0 +1,242 @@
+__all__ = ["EmployeeDirectory"]
+
+import math
+import random
+import time
+import tracemalloc
+from itertools import islice
+
+from sortedcontainers import SortedList
+
+from src.helper.caller import Employee, get_console
+
+SORTED_FIELDS = ("salary", "age")
+
+
+def employee_email(emp) -> str:
+    """Same address as `helper.employee.Employee.email`."""
+    return f"{emp.first_name}_{emp.last_name}@email.com"
+
+
+def employee_full_name(emp) -> str:
+    return f"{emp.first_name} {emp.last_name}"
+
+
+# Multi-valued hash index: a key maps to a single emp_id, and only becomes a
+# set once a second employee shares it (a set per key would triple the memory).
+def _multi_add(index: dict, key, emp_id: int) -> None:
+    current = index.get(key)
+    if current is None:
+        index[key] = emp_id
+    elif isinstance(current, set):
+        current.add(emp_id)
+    else:
+        index[key] = {current, emp_id}
+
+
+def _multi_remove(index: dict, key, emp_id: int) -> None:
+    current = index[key]
+    if not isinstance(current, set):
+        del index[key]
+        return
+    current.discard(emp_id)
+    if len(current) == 1:
+        index[key] = current.pop()
+
+
+def _multi_get(index: dict, key) -> tuple | set:
+    current = index.get(key)
+    if current is None:
+        return ()
+    return current if isinstance(current, set) else (current,)
+
+
+class EmployeeDirectory:
+    """
+    In-memory directory of `caller.Employee` (or `SlottedEmployee`) objects.
+    Indexes:
+        emp_id            -> employee         (dict, unique, O(1))
+        email, full name  -> emp_id(s)        (dict, O(1), names are not unique)
+        salary, age       -> (value, emp_id)  (SortedList, O(log n) insert,
+                             delete and range queries, top-k in O(log n + k))
+    Email and full name are built on insert and removal, never on lookup.
+    Every index is maintained incrementally by `add`, `update` and `remove`.
+    Memory cost (CPython 3.11, measured with `benchmark_employee_directory`):
+    roughly 400 bytes per employee on top of the employee objects themselves,
+    i.e. about 4 GB of index for 10M employees. Most of it is the two
+    `(value, emp_id)` tuples of the sorted indexes, the email and name
+    strings used as keys and the dict slots.
+    """
+
+    def __init__(self, employees=()):
+        self._by_id = {}
+        self._by_email = {}
+        self._by_name = {}
+        self._sorted = {field: SortedList() for field in SORTED_FIELDS}
+        self.add_many(employees)
+
+    # ------------------------------------------------------------------ #
+    # Maintenance
+    # ------------------------------------------------------------------ #
+    def add(self, emp) -> None:
+        emp_id = emp.emp_id
+        if emp_id in self._by_id:
+            raise KeyError(f"Employee with id {emp_id} is already in the directory")
+        self._by_id[emp_id] = emp
+        self._index(emp)
+
+    def add_many(self, employees) -> None:
+        """Insert many employees; on an empty directory the sorted indexes are bulk loaded."""
+        employees = list(employees)
+        if self._by_id or not employees:
+            for emp in employees:
+                self.add(emp)
+            return
+        by_id = {emp.emp_id: emp for emp in employees}
+        if len(by_id) != len(employees):
+            raise KeyError("Duplicated employee ids in the bulk insert")
+        self._by_id = by_id
+        for emp in employees:
+            self._index_hash(emp)
+        for field, index in self._sorted.items():
+            index.update((getattr(emp, field), emp.emp_id) for emp in employees)
+
+    def remove(self, emp_id: int):
+        emp = self._by_id.pop(emp_id)
+        self._unindex(emp)
+        return emp
+
+    def update(self, emp_id: int, **changes) -> None:
+        """
+        Change fields of a stored employee and refresh the affected indexes only.
+        The changes are validated before any index is touched; if a setter
+        still raises, the fields are restored and the employee re-indexed, so
+        a failed update leaves the directory as it was.
+        """
+        emp = self._by_id[emp_id]
+        if "emp_id" in changes:
+            raise ValueError("emp_id cannot be updated, remove and add the employee instead")
+        for name, value in changes.items():
+            if not hasattr(emp, name):
+                raise AttributeError(f"{type(emp).__name__} has no field {name!r}")
+            if name in SORTED_FIELDS:
+                try:
+                    value < getattr(emp, name)
+                except TypeError:
+                    raise TypeError(f"{name} must be comparable with the indexed values, got {value!r}") from None
+        renamed = "first_name" in changes or "last_name" in changes
+        moved = [field for field in SORTED_FIELDS if field in changes]
+        previous = {name: getattr(emp, name) for name in changes}
+        if renamed:
+            self._unindex_hash(emp)
+        for field in moved:
+            self._sorted[field].remove((getattr(emp, field), emp_id))
+        try:
+            for name, value in changes.items():
+                setattr(emp, name, value)
+        except BaseException:
+            for name, value in previous.items():
+                setattr(emp, name, value)
+            raise
+        finally:
+            if renamed:
+                self._index_hash(emp)
+            for field in moved:
+                self._sorted[field].add((getattr(emp, field), emp_id))
+
+    def _index(self, emp) -> None:
+        self._index_hash(emp)
+        for field, index in self._sorted.items():
+            index.add((getattr(emp, field), emp.emp_id))
+
+    def _unindex(self, emp) -> None:
+        self._unindex_hash(emp)
+        for field, index in self._sorted.items():
+            index.remove((getattr(emp, field), emp.emp_id))
+
+    def _index_hash(self, emp) -> None:
+        _multi_add(self._by_email, employee_email(emp), emp.emp_id)
+        _multi_add(self._by_name, employee_full_name(emp), emp.emp_id)
+
+    def _unindex_hash(self, emp) -> None:
+        # Called before any field changes, so the keys rebuild to the indexed ones
+        _multi_remove(self._by_email, employee_email(emp), emp.emp_id)
+        _multi_remove(self._by_name, employee_full_name(emp), emp.emp_id)
+
+    # ------------------------------------------------------------------ #
+    # Lookups
+    # ------------------------------------------------------------------ #
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, emp_id) -> bool:
+        return emp_id in self._by_id
+
+    def __iter__(self):
+        return iter(self._by_id.values())
+
+    def get(self, emp_id: int, default=None):
+        return self._by_id.get(emp_id, default)
+
+    def find_by_email(self, email: str) -> list:
+        return [self._by_id[emp_id] for emp_id in _multi_get(self._by_email, email)]
+
+    def find_by_name(self, full_name: str) -> list:
+        """Employees whose `"first last"` name matches exactly."""
+        return [self._by_id[emp_id] for emp_id in _multi_get(self._by_name, full_name)]
+
+    def range(self, field: str, low=None, high=None) -> list:
+        """Employees with `low <= field <= high` (either bound may be None), ordered by `field`."""
+        minimum = None if low is None else (low,)
+        maximum = None if high is None else (high, math.inf)
+        return [self._by_id[emp_id] for _, emp_id in self._sorted[field].irange(minimum, maximum)]
+
+    def salary_range(self, low=None, high=None) -> list:
+        return self.range("salary", low, high)
+
+    def age_range(self, low=None, high=None) -> list:
+        return self.range("age", low, high)
+
+    def top_k(self, field: str, k: int, largest: bool = True) -> list:
+        index = self._sorted[field]
+        entries = index.islice(max(len(index) - k, 0), reverse=True) if largest else islice(index, k)
+        return [self._by_id[emp_id] for _, emp_id in entries]
+
+
+def benchmark_employee_directory(n: int = 1_000_000, lookups: int = 100_000) -> None:
+    """Build a directory of `n` employees and time the lookups, ranges and top-k."""
+    console = get_console()
+    rng = random.Random(0)
+    first_names = [f"first{i}" for i in range(1000)]
+    last_names = [f"last{i}" for i in range(1000)]
+    employees = [Employee(rng.choice(first_names), rng.choice(last_names), rng.randint(20, 65), rng.uniform(2000, 15000), rng.choice(["male", "female"])) for _ in range(n)]
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    directory = EmployeeDirectory(employees)
+    build_s = time.perf_counter() - start
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    console.log(f"[ INFO ] build: {build_s:.2f} s, index memory: {memory / n:.0f} B/employee (~{memory / n * 10_000_000 / 1e9:.1f} GB at 10M)")
+
+    sample = rng.sample(employees, min(lookups, n))
+    timings = {
+        "get(emp_id)": lambda emp: directory.get(emp.emp_id),
+        "find_by_email": lambda emp: directory.find_by_email(employee_email(emp)),
+        "find_by_name": lambda emp: directory.find_by_name(employee_full_name(emp)),
+        "salary_range(+-1)": lambda emp: directory.salary_range(emp.salary - 1, emp.salary + 1),
+        "update(salary)": lambda emp: directory.update(emp.emp_id, salary=emp.salary + 1),
+    }
+    for name, lookup in timings.items():
+        start = time.perf_counter()
+        for emp in sample:
+            lookup(emp)
+        console.log(f"[ INFO ] {name:<18} {(time.perf_counter() - start) / len(sample) * 1e6:8.2f} us/op")
+
+    start = time.perf_counter()
+    top = directory.top_k("salary", 100)
+    console.log(f"[ INFO ] top_k(salary, 100)  {(time.perf_counter() - start) * 1e6:8.2f} us, max salary: {top[0].salary:.2f}")
+
+
+if __name__ == "__main__":
+    benchmark_employee_directory()
@@ -0,0 +1,232 @@
+__all__ = ["EmployeeRepository"]
+
+import contextlib
+import os
+import queue
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+
+from src.helper.caller import Employee, get_console
+from src.helper.employee_table import EmployeeTable, restore_employee
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS employees (
+    emp_id     INTEGER PRIMARY KEY,
+    first_name TEXT NOT NULL,
+    last_name  TEXT NOT NULL,
+    age        INTEGER NOT NULL,
+    salary     REAL NOT NULL,
+    gender     TEXT NOT NULL
+);
+"""
+INDEXES_SQL = """
+CREATE INDEX IF NOT EXISTS ix_employees_name ON employees (last_name, first_name);
+CREATE INDEX IF NOT EXISTS ix_employees_salary ON employees (salary);
+"""
+DROP_INDEXES_SQL = """
+DROP INDEX IF EXISTS ix_employees_name;
+DROP INDEX IF EXISTS ix_employees_salary;
+"""
+
+# Statements are kept as module constants: sqlite3 caches the compiled
+# (prepared) statement per connection keyed by the SQL text, so reusing the
+# exact same string skips the parse/plan step on every call.
+INSERT_SQL = "INSERT OR REPLACE INTO employees (emp_id, first_name, last_name, age, salary, gender) VALUES (?, ?, ?, ?, ?, ?)"
+SELECT_COLUMNS = "SELECT first_name, last_name, age, salary, gender, emp_id FROM employees"
+SELECT_BY_ID_SQL = f"{SELECT_COLUMNS} WHERE emp_id = ?"
+DELETE_SQL = "DELETE FROM employees WHERE emp_id = ?"
+COUNT_SQL = "SELECT COUNT(*) FROM employees"
+
+
+class EmployeeRepository:
+    """
+    SQLite persistence for `caller.Employee` objects.
+    - WAL journal mode, so readers never block the writer (and vice versa).
+    - One writer connection; bulk inserts go through `executemany` in
+      transactions of `chunk_size` rows. Large loads drop the secondary
+      indexes and rebuild them once at the end (one sort instead of a random
+      B-tree insert per row).
+    - A small pool of reader connections for multi-threaded lookups.
+    - Queries stream rows with `fetchmany`, the cursor steps through the
+      result set lazily, so memory stays bounded by `batch_size`.
+    """
+
+    def __init__(self, path: str, readers: int = 4, chunk_size: int = 50_000, statement_cache: int = 256):
+        self.path = path
+        self.chunk_size = chunk_size
+        self._statement_cache = statement_cache
+        self._writer = self._connect()
+        self._writer.executescript(SCHEMA + INDEXES_SQL)
+        self._writer_lock = threading.Lock()
+        self._readers = queue.Queue()
+        for _ in range(readers):
+            self._readers.put(self._connect())
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, check_same_thread=False, cached_statements=self._statement_cache, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("PRAGMA temp_store=MEMORY")
+        return connection
+
+    @contextlib.contextmanager
+    def _reader(self):
+        connection = self._readers.get()
+        try:
+            yield connection
+        finally:
+            self._readers.put(connection)
+
+    def close(self) -> None:
+        self._writer.close()
+        while not self._readers.empty():
+            self._readers.get_nowait().close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # ------------------------------------------------------------------ #
+    # Writes
+    # ------------------------------------------------------------------ #
+    def add_many(self, employees, rebuild_indexes: bool = False) -> int:
+        """
+        Insert (or replace) employees in chunked transactions, returns the number of rows written.
+        Args:
+            rebuild_indexes (bool): Drop the secondary indexes during the load
+                and rebuild them afterwards, worth it for large bulk loads.
+        """
+        rows = ((emp.emp_id, emp.first_name, emp.last_name, emp.age, emp.salary, emp.gender) for emp in employees)
+        return self._write_rows(rows, rebuild_indexes)
+
+    def add_table(self, table: EmployeeTable, rebuild_indexes: bool = False) -> int:
+        rows = zip(table.emp_id.tolist(), table.first_name.tolist(), table.last_name.tolist(), table.age.tolist(), table.salary.tolist(), table.gender.tolist())
+        return self._write_rows(rows, rebuild_indexes)
+
+    def _write_rows(self, rows, rebuild_indexes: bool = False) -> int:
+        with self._writer_lock:
+            if rebuild_indexes:
+                self._writer.executescript(DROP_INDEXES_SQL)
+            try:
+                written = self._write_chunks(rows)
+            finally:
+                if rebuild_indexes:
+                    self._writer.executescript(INDEXES_SQL)
+        return written
+
+    def _write_chunks(self, rows) -> int:
+        written = 0
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= self.chunk_size:
+                written += self._write_chunk(chunk)
+                chunk = []
+        if chunk:
+            written += self._write_chunk(chunk)
+        return written
+
+    def _write_chunk(self, chunk) -> int:
+        self._writer.execute("BEGIN")
+        try:
+            self._writer.executemany(INSERT_SQL, chunk)
+        except Exception:
+            self._writer.execute("ROLLBACK")
+            raise
+        self._writer.execute("COMMIT")
+        return len(chunk)
+
+    def add(self, emp) -> None:
+        self.add_many((emp,))
+
+    def remove(self, emp_id: int) -> None:
+        with self._writer_lock:
+            self._writer.execute(DELETE_SQL, (emp_id,))
+
+    # ------------------------------------------------------------------ #
+    # Reads
+    # ------------------------------------------------------------------ #
+    def __len__(self) -> int:
+        with self._reader() as connection:
+            return connection.execute(COUNT_SQL).fetchone()[0]
+
+    def get(self, emp_id: int, cls=Employee):
+        with self._reader() as connection:
+            row = connection.execute(SELECT_BY_ID_SQL, (emp_id,)).fetchone()
+        return None if row is None else restore_employee(cls, *row)
+
+    def iter_batches(self, where: str = "", params=(), batch_size: int = 10_000):
+        """
+        Yield lists of raw rows `(first_name, last_name, age, salary, gender, emp_id)`.
+        Args:
+            where (str): Optional SQL condition, e.g. `"salary > ?"`. It is
+                spliced into the statement as it is, so it must be trusted
+                text from the code, never built from input: values go
+                through `params`.
+            params (tuple): Parameters bound to the condition.
+        The reader connection is taken from the pool for the life of the
+        generator and returned once it is exhausted or closed. Stopping early,
+        close it (`contextlib.closing`) rather than dropping it, so the
+        connection does not wait for the garbage collector.
+        """
+        sql = f"{SELECT_COLUMNS} WHERE {where}" if where else SELECT_COLUMNS
+        connection = self._readers.get()
+        try:
+            cursor = connection.execute(sql, params)
+            try:
+                while rows := cursor.fetchmany(batch_size):
+                    yield rows
+            finally:
+                cursor.close()
+        finally:
+            # Also runs on GeneratorExit, when the generator is closed early
+            self._readers.put(connection)
+
+    def iter_employees(self, where: str = "", params=(), batch_size: int = 10_000, cls=Employee):
+        """Stream matching rows as employee objects (ids are kept, none are allocated)."""
+        # Closing this generator closes the batches right away, not when they are collected
+        with contextlib.closing(self.iter_batches(where, params, batch_size)) as batches:
+            for rows in batches:
+                for row in rows:
+                    yield restore_employee(cls, *row)
+
+    def iter_tables(self, where: str = "", params=(), batch_size: int = 100_000):
+        """Stream matching rows as `EmployeeTable` chunks of at most `batch_size` rows."""
+        with contextlib.closing(self.iter_batches(where, params, batch_size)) as batches:
+            for rows in batches:
+                first_name, last_name, age, salary, gender, emp_id = zip(*rows)
+                yield EmployeeTable(first_name, last_name, age, salary, gender, emp_id)
+
+
+def benchmark_employee_repository(n: int = 1_000_000, lookups: int = 100_000) -> None:
+    """Rows per second for a bulk load of `n` employees and for indexed point lookups."""
+    console = get_console()
+    rng = random.Random(0)
+    employees = [Employee("Jack", rng.choice(["Michael", "Smith", "Brown"]), rng.randint(20, 55), rng.uniform(2000, 15000), rng.choice(["male", "female"])) for _ in range(n)]
+
+    with tempfile.TemporaryDirectory() as tmp_dir, EmployeeRepository(os.path.join(tmp_dir, "employees.db")) as repository:
+        start = time.perf_counter()
+        repository.add_many(employees, rebuild_indexes=True)
+        elapsed = time.perf_counter() - start
+        console.log(f"[ INFO ] bulk load: {n:,} rows in {elapsed:.2f} s -> {n / elapsed:,.0f} rows/s")
+
+        ids = [emp.emp_id for emp in rng.sample(employees, min(lookups, n))]
+        start = time.perf_counter()
+        for emp_id in ids:
+            repository.get(emp_id)
+        elapsed = time.perf_counter() - start
+        console.log(f"[ INFO ] point lookups: {len(ids):,} in {elapsed:.2f} s -> {len(ids) / elapsed:,.0f} lookups/s")
+
+        start = time.perf_counter()
+        streamed = sum(len(table) for table in repository.iter_tables("salary > ?", (10_000,)))
+        elapsed = time.perf_counter() - start
+        console.log(f"[ INFO ] streamed scan: {streamed:,} rows in {elapsed:.2f} s -> {streamed / elapsed:,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    benchmark_employee_repository()
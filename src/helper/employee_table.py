@@ -0,0 +1,226 @@
+__all__ = ["SlottedEmployee", "EmployeeTable", "restore_employee"]
+
+import random
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from src.helper.caller import EMPLOYEE_IDS, Employee, get_console
+
+COLUMNS = ("first_name", "last_name", "age", "salary", "gender", "emp_id")
+
+
+@dataclass(order=True, repr=False, slots=True)
+class SlottedEmployee:
+    """
+    Same fields and behaviour as `caller.Employee`, without a per-instance `__dict__`.
+    Ids are taken from the same allocator as `caller.Employee`, so both kinds of
+    objects can be mixed in one `EmployeeTable`.
+    """
+
+    first_name: str = field(init=True, repr=True)
+    last_name: str = field(init=True, repr=True)
+    age: int = field(init=True, repr=True)
+    salary: float = field(init=True, repr=True)
+    gender: str = field(init=True, repr=True)
+    emp_id: int = field(init=False, repr=True)
+
+    def __post_init__(self):
+        self.emp_id = EMPLOYEE_IDS.next_id()
+
+    def __str__(self):
+        return f"[ INFO ] Employee: {self.first_name} {self.last_name}, Gender: {self.gender:<6}, Age: {self.age}, Salary: {self.salary:3.2f} "
+
+
+def restore_employee(cls, first_name, last_name, age, salary, gender, emp_id):
+    """Rebuild an employee object from stored values without allocating a new id."""
+    emp = object.__new__(cls)
+    emp.first_name = first_name
+    emp.last_name = last_name
+    emp.age = age
+    emp.salary = salary
+    emp.gender = gender
+    emp.emp_id = emp_id
+    return emp
+
+
+class EmployeeTable:
+    """
+    Columnar store for employees, one NumPy array per field.
+    Columns:
+        first_name, last_name: variable width strings (`StringDType`).
+        age: int32, salary: float64, emp_id: int64.
+        gender: uint8 codes into `gender_categories` (dictionary encoded).
+    Filters are boolean masks built from the columns (`table[table.age > 30]`),
+    sorting uses `np.lexsort` and group aggregates use `np.bincount` on the
+    gender codes, so none of these touch a Python object per row.
+    """
+
+    __slots__ = ("first_name", "last_name", "age", "salary", "gender_codes", "gender_categories", "emp_id")
+
+    def __init__(self, first_name, last_name, age, salary, gender, emp_id, gender_categories=None):
+        self.first_name = np.asarray(first_name, dtype=np.dtypes.StringDType())
+        self.last_name = np.asarray(last_name, dtype=np.dtypes.StringDType())
+        self.age = np.asarray(age, dtype=np.int32)
+        self.salary = np.asarray(salary, dtype=np.float64)
+        self.emp_id = np.asarray(emp_id, dtype=np.int64)
+        if gender_categories is None:
+            # Dictionary encode the raw gender labels
+            gender_categories, gender = np.unique(np.asarray(gender, dtype=np.dtypes.StringDType()), return_inverse=True)
+        self.gender_categories = np.asarray(gender_categories, dtype=np.dtypes.StringDType())
+        self.gender_codes = np.asarray(gender, dtype=np.uint8)
+
+        lengths = {len(column) for column in (self.first_name, self.last_name, self.age, self.salary, self.gender_codes, self.emp_id)}
+        if len(lengths) > 1:
+            raise ValueError(f"All columns must have the same length, got: {sorted(lengths)}")
+
+    # ------------------------------------------------------------------ #
+    # Conversion
+    # ------------------------------------------------------------------ #
+    @classmethod
+    def from_employees(cls, employees) -> "EmployeeTable":
+        """Build a table from `Employee` or `SlottedEmployee` objects."""
+        employees = list(employees)
+        count = len(employees)
+        return cls(
+            first_name=[emp.first_name for emp in employees],
+            last_name=[emp.last_name for emp in employees],
+            age=np.fromiter((emp.age for emp in employees), dtype=np.int32, count=count),
+            salary=np.fromiter((emp.salary for emp in employees), dtype=np.float64, count=count),
+            gender=[emp.gender for emp in employees],
+            emp_id=np.fromiter((emp.emp_id for emp in employees), dtype=np.int64, count=count),
+        )
+
+    def to_employees(self, cls=SlottedEmployee) -> list:
+        """Materialize the rows as `cls` objects, keeping their stored ids."""
+        gender = self.gender.tolist()
+        return [
+            restore_employee(cls, *row)
+            for row in zip(self.first_name.tolist(), self.last_name.tolist(), self.age.tolist(), self.salary.tolist(), gender, self.emp_id.tolist())
+        ]
+
+    @property
+    def gender(self) -> np.ndarray:
+        """The decoded gender labels."""
+        return self.gender_categories[self.gender_codes]
+
+    # ------------------------------------------------------------------ #
+    # Container protocol and vectorized selection
+    # ------------------------------------------------------------------ #
+    def __len__(self) -> int:
+        return len(self.emp_id)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(rows={len(self)}, nbytes={self.nbytes})"
+
+    def __getitem__(self, index):
+        """
+        `table[i]` returns one `SlottedEmployee`; a slice, an index array or
+        a boolean mask returns a new table sharing the same categories.
+        """
+        if isinstance(index, (int, np.integer)):
+            return self.row(int(index))
+        return EmployeeTable(
+            first_name=self.first_name[index],
+            last_name=self.last_name[index],
+            age=self.age[index],
+            salary=self.salary[index],
+            gender=self.gender_codes[index],
+            emp_id=self.emp_id[index],
+            gender_categories=self.gender_categories,
+        )
+
+    def row(self, i: int, cls=SlottedEmployee):
+        """Materialize a single row as a `cls` object."""
+        return restore_employee(cls, str(self.first_name[i]), str(self.last_name[i]), int(self.age[i]), float(self.salary[i]), str(self.gender[i]), int(self.emp_id[i]))
+
+    def gender_mask(self, gender: str) -> np.ndarray:
+        """Boolean mask of the rows with the given gender, compared on the codes."""
+        matches = np.flatnonzero(self.gender_categories == gender)
+        if not len(matches):
+            return np.zeros(len(self), dtype=bool)
+        return self.gender_codes == matches[0]
+
+    def filter(self, mask) -> "EmployeeTable":
+        return self[np.asarray(mask, dtype=bool)]
+
+    def sort_by(self, *keys: str, descending: bool = False) -> "EmployeeTable":
+        """
+        Return a table sorted by the given columns (first key is the primary one).
+        The default order matches `caller.Employee` ordering: every field in declaration order.
+        """
+        keys = keys or COLUMNS
+        order = np.lexsort([self._sort_key(key) for key in reversed(keys)])
+        if descending:
+            order = order[::-1]
+        return self[order]
+
+    def _sort_key(self, key: str) -> np.ndarray:
+        # `np.lexsort` does not accept StringDType columns: string columns are
+        # ranked through `np.unique`, and the gender codes already follow the
+        # (sorted) category order.
+        if key == "gender":
+            return self.gender_codes
+        column = getattr(self, key)
+        if key in ("first_name", "last_name"):
+            return np.unique(column, return_inverse=True)[1]
+        return column
+
+    # ------------------------------------------------------------------ #
+    # Aggregates
+    # ------------------------------------------------------------------ #
+    def mean_by_gender(self, column: str = "salary") -> dict[str, float]:
+        """Mean of a numeric column for each gender, e.g. the mean salary by gender."""
+        values = getattr(self, column)
+        n_categories = len(self.gender_categories)
+        counts = np.bincount(self.gender_codes, minlength=n_categories)
+        sums = np.bincount(self.gender_codes, weights=values, minlength=n_categories)
+        return {str(category): float(sums[i] / counts[i]) for i, category in enumerate(self.gender_categories) if counts[i]}
+
+    def count_by_gender(self) -> dict[str, int]:
+        counts = np.bincount(self.gender_codes, minlength=len(self.gender_categories))
+        return {str(category): int(count) for category, count in zip(self.gender_categories, counts)}
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory used by the columns (string columns include their heap data)."""
+        strings = sum(len(name.encode()) for name in self.first_name.tolist()) + sum(len(name.encode()) for name in self.last_name.tolist())
+        return strings + sum(column.nbytes for column in (self.first_name, self.last_name, self.age, self.salary, self.gender_codes, self.emp_id, self.gender_categories))
+
+
+def benchmark_employee_table(n: int = 1_000_000) -> None:
+    """
+    Compare memory, sort time and a group aggregate for `n` employees stored
+    as `caller.Employee` objects, `SlottedEmployee` objects and an `EmployeeTable`.
+    """
+    console = get_console()
+    rng = random.Random(0)
+    rows = [("Jack", rng.choice(["Michael", "Smith", "Brown"]), rng.randint(20, 55), rng.uniform(2000, 15000), rng.choice(["male", "female"])) for _ in range(n)]
+
+    for cls in (Employee, SlottedEmployee):
+        tracemalloc.start()
+        employees = [cls(*row) for row in rows]
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        start = time.perf_counter()
+        employees.sort()
+        sort_s = time.perf_counter() - start
+        console.log(f"[ INFO ] {cls.__name__:<16} memory: {memory / n:7.1f} B/row, sort: {sort_s:6.3f} s")
+
+    tracemalloc.start()
+    table = EmployeeTable.from_employees(employees)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    start = time.perf_counter()
+    table.sort_by()
+    sort_s = time.perf_counter() - start
+    start = time.perf_counter()
+    means = table.mean_by_gender("salary")
+    mean_s = time.perf_counter() - start
+    console.log(f"[ INFO ] {'EmployeeTable':<16} memory: {memory / n:7.1f} B/row, sort: {sort_s:6.3f} s, mean salary by gender: {mean_s * 1000:.2f} ms {means}")
+
+
+if __name__ == "__main__":
+    benchmark_employee_table()
@@ -0,0 +1,182 @@
+__all__ = ["IdAllocator", "LocalCounter", "SharedCounter"]
+
+import multiprocessing
+import os
+import threading
+import time
+import warnings
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+
+class LocalCounter:
+    """Block counter for a single process, guarded by a plain lock."""
+
+    def __init__(self, start: int = 0):
+        self._value = start
+        self._lock = threading.Lock()
+
+    def lease(self, size: int) -> int:
+        """Reserve `size` ids and return the first one."""
+        with self._lock:
+            first = self._value + 1
+            self._value += size
+        return first
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+
+class SharedCounter:
+    """
+    Block counter living in shared memory (`multiprocessing.Value`).
+    It must reach the worker processes at creation time, e.g. through the
+    `initializer` of a `ProcessPoolExecutor` (see `IdAllocator.attach`).
+    """
+
+    def __init__(self, start: int = 0, value=None):
+        self._shared = value if value is not None else multiprocessing.Value("q", start)
+
+    def lease(self, size: int) -> int:
+        with self._shared.get_lock():
+            first = self._shared.value + 1
+            self._shared.value += size
+        return first
+
+    @property
+    def value(self) -> int:
+        return self._shared.value
+
+
+class IdAllocator:
+    """
+    Hands out unique, increasing-per-thread integer ids without a global lock on the hot path.
+    Each thread leases a block of `block_size` ids from the backing counter
+    and then serves `next_id()` from its own thread-local range; the counter
+    lock is only taken once per block. With a `SharedCounter` the blocks are
+    leased from shared memory, so ids stay unique across a process pool.
+    Ids are unique but not dense: a thread that stops early leaves the rest
+    of its block unused.
+    Processes: call `share()` before creating worker processes and hand the
+    returned counter to them (`attach()` in the pool initializer). A forked
+    child keeps a copy of the parent's `LocalCounter`, so both would lease the
+    same blocks; an unshared allocator therefore warns (`RuntimeWarning`)
+    when a forked child leases its first block.
+    """
+
+    _instances = weakref.WeakSet()
+
+    def __init__(self, block_size: int = 1024, counter=None):
+        self.block_size = block_size
+        self.counter = counter if counter is not None else LocalCounter()
+        self._forked = False
+        self._reset()
+        IdAllocator._instances.add(self)
+
+    def _reset(self) -> None:
+        self._local = threading.local()
+        self._states = []
+        self._states_lock = threading.Lock()
+
+    def _state(self):
+        state = self._local.__dict__
+        if not state:
+            state.update(next=0, end=0, issued=0)
+            with self._states_lock:
+                self._states.append(state)
+        return state
+
+    def next_id(self) -> int:
+        state = self._local.__dict__
+        if not state:
+            state = self._state()
+        emp_id = state["next"]
+        if emp_id >= state["end"]:
+            if self._forked and not isinstance(self.counter, SharedCounter):
+                self._forked = False  # Warn once per child
+                warnings.warn(
+                    "IdAllocator used in a forked child without share(): parent and child lease the same id blocks", RuntimeWarning, stacklevel=3
+                )
+            emp_id = self.counter.lease(self.block_size)
+            state["end"] = emp_id + self.block_size
+        state["next"] = emp_id + 1
+        state["issued"] += 1
+        return emp_id
+
+    @property
+    def issued(self) -> int:
+        """Number of ids handed out by this process (all threads)."""
+        with self._states_lock:
+            return sum(state["issued"] for state in self._states)
+
+    def share(self) -> SharedCounter:
+        """
+        Move the allocator onto a shared-memory counter and return it.
+        The shared counter starts after every id already leased here, so ids
+        handed out before the switch cannot be reused.
+        """
+        if not isinstance(self.counter, SharedCounter):
+            self.counter = SharedCounter(self.counter.value)
+            issued = self.issued
+            self._reset()
+            self._state()["issued"] = issued
+        return self.counter
+
+    def attach(self, counter: SharedCounter) -> None:
+        """Use a counter shared by the parent process (call it from the pool initializer)."""
+        self.counter = counter
+        self._forked = False
+        self._reset()
+
+
+def _reset_after_fork() -> None:
+    # A forked child inherits the thread-local block of the forking thread,
+    # drop it so parent and child do not serve the same ids.
+    for allocator in list(IdAllocator._instances):
+        allocator._forked = True
+        allocator._reset()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _create_employees(count: int) -> list[int]:
+    from src.helper.caller import Employee
+
+    return [Employee("Jack", "Michael", 30, 5000.0, "male").emp_id for _ in range(count)]
+
+
+def _attach_employee_ids(counter: SharedCounter) -> None:
+    from src.helper.caller import EMPLOYEE_IDS
+
+    EMPLOYEE_IDS.attach(counter)
+
+
+def benchmark_id_allocation(per_thread: int = 200_000, threads=(1, 2, 4, 8, 16, 32)) -> None:
+    """
+    Measure `caller.Employee` creation throughput from 1 to 32 threads and
+    check that every id is unique, then repeat the check across a process pool.
+    """
+    from src.helper.caller import EMPLOYEE_IDS, get_console
+
+    console = get_console()
+    for n_threads in threads:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=n_threads) as pool:
+            results = list(pool.map(_create_employees, [per_thread] * n_threads))
+        elapsed = time.perf_counter() - start
+        ids = [emp_id for result in results for emp_id in result]
+        unique = len(set(ids)) == len(ids)
+        console.log(f"[ INFO ] threads: {n_threads:>2}, employees/s: {len(ids) / elapsed:12,.0f}, unique ids: {unique}")
+
+    counter = EMPLOYEE_IDS.share()
+    n_workers = min(8, os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=n_workers, initializer=_attach_employee_ids, initargs=(counter,)) as pool:
+        results = list(pool.map(_create_employees, [per_thread // 4] * n_workers * 2))
+    ids = [emp_id for result in results for emp_id in result] + _create_employees(1000)
+    console.log(f"[ INFO ] processes: {n_workers}, ids: {len(ids):,}, unique ids: {len(set(ids)) == len(ids)}")
+
+
+if __name__ == "__main__":
+    benchmark_id_allocation()
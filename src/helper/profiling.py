@@ -0,0 +1,135 @@
+__all__ = ["StackSampler", "run_cprofile", "run_tracemalloc", "run_sampling"]
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+DEFAULT_INTERVAL = 0.005  # 5 ms between stack snapshots
+
+
+def run_cprofile(target, output: str, sort: str = "cumulative", limit: int = 30, stream=None) -> None:
+    """
+    Run `target()` under cProfile.
+    Args:
+        output (str): The raw stats are dumped to this file (open it with
+            `python -m pstats` or snakeviz), the sorted report goes to `<output>.txt`.
+        sort (str): pstats sort key, e.g. "cumulative", "tottime", "calls".
+        limit (int): Number of functions listed in the report.
+    """
+    import cProfile
+    import io
+    import pstats
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.runcall(target)
+    finally:
+        profiler.dump_stats(output)
+        report = io.StringIO()
+        pstats.Stats(profiler, stream=report).strip_dirs().sort_stats(sort).print_stats(limit)
+        with open(f"{output}.txt", "w") as f_out:
+            f_out.write(report.getvalue())
+        print(report.getvalue(), file=stream or sys.stderr)
+
+
+def run_tracemalloc(target, top: int = 20, frames: int = 1, stream=None) -> None:
+    """
+    Run `target()` with tracemalloc and report the `top` allocation sites
+    still alive at the end, grouped by line (or by traceback with `frames > 1`),
+    and the peak traced memory.
+    """
+    import tracemalloc
+
+    stream = stream or sys.stderr
+    tracemalloc.start(frames)
+    try:
+        target()
+    finally:
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        snapshot = snapshot.filter_traces((tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, "<frozen importlib._bootstrap*>")))
+        stats = snapshot.statistics("traceback" if frames > 1 else "lineno")
+        print(f"Top {top} allocation sites:", file=stream)
+        for index, stat in enumerate(stats[:top], 1):
+            frame = stat.traceback[0]
+            print(f"#{index:<3} {frame.filename}:{frame.lineno}: {stat.size / 1024:.1f} KiB in {stat.count} blocks", file=stream)
+            for line in stat.traceback.format()[2:] if frames > 1 else ():
+                print(f"     {line}", file=stream)
+        print(f"Current: {current / 1024:.1f} KiB, peak: {peak / 1024:.1f} KiB", file=stream)
+
+
+class StackSampler(threading.Thread):
+    """
+    Low overhead sampling profiler.
+    Every `interval` seconds a daemon thread snapshots the stacks of all the
+    other threads (`sys._current_frames()`) and counts identical stacks, the
+    profiled code itself is not instrumented. The result is written in the
+    folded format, one `thread;outer;...;inner count` line per stack, which
+    flamegraph.pl, speedscope and inferno read directly.
+    Usage:
+        with StackSampler() as sampler:
+            work()
+        sampler.write_folded("profile.folded")
+    """
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL):
+        super().__init__(name="StackSampler", daemon=True)
+        self.interval = interval
+        self.samples = Counter()
+        self.n_snapshots = 0
+        self._stop_event = threading.Event()
+        self._labels = {}
+
+    def _label(self, code) -> str:
+        # One label per code object, formatted once
+        label = self._labels.get(code)
+        if label is None:
+            label = self._labels[code] = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})".replace(";", ",")
+        return label
+
+    def run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop_event.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(self._label(frame.f_code))
+                    frame = frame.f_back
+                stack.append(names.get(thread_id, str(thread_id)))
+                self.samples[";".join(reversed(stack))] += 1
+            self.n_snapshots += 1
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def write_folded(self, output: str) -> None:
+        with open(output, "w") as f_out:
+            for stack, count in self.samples.most_common():
+                f_out.write(f"{stack} {count}\n")
+
+
+def run_sampling(target, output: str, interval: float = DEFAULT_INTERVAL, stream=None) -> None:
+    """Run `target()` under a `StackSampler` and write the folded stacks to `output`."""
+    start = time.perf_counter()
+    sampler = StackSampler(interval)
+    try:
+        with sampler:
+            target()
+    finally:
+        elapsed = time.perf_counter() - start
+        sampler.write_folded(output)
+        print(f"{sampler.n_snapshots} snapshots in {elapsed:.2f} s, {len(sampler.samples)} distinct stacks written to {output}", file=stream or sys.stderr)
@@ -3,6 +3,8 @@ import logging.config
 import logging.handlers
 import os
 
+from src.logging.mySharedFormatter import share_formatters
+
 logger = logging.getLogger(__name__)
 
 
@@ -13,6 +15,9 @@ def setup_logging():
         config = json.load(f_in)
     logging.config.dictConfig(config)
 
+    # Handlers sharing the `colored` formatter reuse the same formatted line
+    share_formatters(logging.getLogger().handlers)
+
 
 def testing_loading_config():
     setup_logging()
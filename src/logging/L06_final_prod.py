@@ -5,12 +5,53 @@ import logging.config
 import os
 from queue import Queue
 
+from src.logging.myQueueListener import HotReloadQueueListener
+from src.logging.mySpans import tracer
+
+# The opt-in parts of the pipeline (compact records, hot reload, tail server,
+# debug-on-error ring, notebook viewer) are imported in the setup_logging()
+# branch that enables them, so importing this module stays cheap
+
 logger = logging.getLogger(__name__)  # Module-level logger
 log_queue = Queue()  # Initialize the queue
+queue_listener = None  # The running listener, set by setup_logging()
+config_watcher = None  # The config file watcher, set by setup_logging(hot_reload=True)
+tail_server = None  # The live tail endpoint, set by setup_logging(tail_socket=...)
+debug_on_error_capacity = 0  # Records kept per thread, set by setup_logging(debug_on_error=...)
+notebook_viewer = None  # The JupyterLab log view, set by setup_logging(notebook=True)
+
+
+def config_path():
+    return os.path.join(os.getcwd(), "src/logging/config06.json")
+
+
+def setup_logging(hot_reload: bool = False, compact_records: bool = False, tail_socket: str | None = None, debug_on_error: int = 0, notebook: bool = False):
+    """
+    Args:
+        hot_reload (bool): Watch config06.json and apply its changes live.
+        compact_records (bool): Create the records as slotted
+            `CompactLogRecord` objects (see myCompactRecord), less memory
+            per queued record.
+        tail_socket (str | None): Serve a live, filtered tail of the
+            pipeline on this Unix socket (see myTailServer).
+        debug_on_error (int): When set, keep this many DEBUG/INFO records
+            per thread in memory and write them to file_json only when an
+            error follows (see myRingBufferHandler). stdout is left out, so
+            nothing below WARNING is formatted in normal operation.
+        notebook (bool): Show the records in a paginated, filterable view in
+            the current notebook cell instead of flooding it through stdout
+            (see myNotebookViewer).
+    """
+    global queue_listener, config_watcher, tail_server, debug_on_error_capacity, notebook_viewer
+
+    # Calling setup_logging() again must not orphan the running listener,
+    # swap the new handlers into it instead of running dictConfig twice
+    if queue_listener is not None:
+        reload_logging()
+        return
 
-def setup_logging():
     # Load the logging configuration from the JSON file
-    config_file = os.path.join(os.getcwd(), "src/logging/config06.json")
+    config_file = config_path()
     with open(config_file) as f_in:
         config = json.load(f_in)
 
@@ -29,28 +70,113 @@ def setup_logging():
     if not all([stdout_handler, stderr_handler, file_json_handler]):
         raise RuntimeError("Handlers not correctly attached.")
 
-    # Create and start the QueueListener with the handlers
-    queue_listener = logging.handlers.QueueListener(
-        log_queue, stdout_handler, stderr_handler, file_json_handler
-    )
+    if compact_records:
+        from src.logging.myCompactRecord import install_record_factory
+
+        install_record_factory([logging._handlers["queue_handler"], stdout_handler, stderr_handler, file_json_handler])
+
+    # Create and start the QueueListener with the handlers, records are
+    # formatted once per formatter and shared by stdout/stderr
+    handlers = [stdout_handler, stderr_handler, file_json_handler]
+
+    # The tail handler uses the JSON formatter of file_json, the listener
+    # shares it, so the tail costs no extra formatting
+    if tail_socket is not None:
+        from src.logging.myTailServer import TailServer
+
+        tail_server = TailServer(tail_socket).start()
+        tail_server.handler.setFormatter(file_json_handler.formatter)
+        handlers.append(tail_server.handler)
+        atexit.register(tail_server.stop)
+
+    # Below WARNING, records wait in a ring instead of reaching stdout and file_json
+    if debug_on_error:
+        from src.logging.myRingBufferHandler import DebugOnErrorHandler
+
+        debug_on_error_capacity = debug_on_error
+        handlers = [DebugOnErrorHandler(debug_on_error, target=file_json_handler, close_target=True), stderr_handler, *handlers[3:]]
+
+    if notebook:
+        from src.logging.myNotebookViewer import NotebookLogHandler
+
+        # The viewer stands in for stdout: same level and filters (redact, no_span_filter, ...)
+        notebook_viewer = NotebookLogHandler(level=stdout_handler.level)
+        notebook_viewer.filters = list(stdout_handler.filters)
+        handlers = [notebook_viewer, *(h for h in handlers if h is not stdout_handler)]
+        notebook_viewer.show()
+
+    queue_listener = HotReloadQueueListener(log_queue, *handlers)
     queue_listener.start()
 
     # Ensure the listener stops gracefully on exit
     atexit.register(queue_listener.stop)
+    # atexit runs in reverse order: the buffered spans reach the queue before the listener stops
+    atexit.register(tracer.flush_all)
+
+    # Watch the config file and swap changes into the running listener
+    if hot_reload:
+        from src.logging.myHotReload import ConfigWatcher
+
+        config_watcher = ConfigWatcher(config_file, lambda _: reload_logging())
+        config_watcher.start()
+        atexit.register(config_watcher.stop)
+
+
+def reload_logging():
+    """
+    Apply the current content of config06.json to the running pipeline.
+    The new handlers are built off to the side and swapped into the running
+    QueueListener in queue order, then the logger levels are updated. The
+    queue handler and the queue itself are kept, so producers never pause.
+    """
+    from src.logging.myCompactRecord import compact_records_installed, prepare_handlers
+    from src.logging.myHotReload import apply_logger_levels, build_handlers, load_config
+
+    config = load_config(config_path())
+    handlers = build_handlers(config)
+    if not handlers:
+        raise RuntimeError("No handlers found in the logging configuration.")
+    if tail_server is not None:
+        if "file_json" in handlers:
+            tail_server.handler.setFormatter(handlers["file_json"].formatter)
+        handlers["tail"] = tail_server.handler
+    if compact_records_installed():
+        prepare_handlers(handlers.values())
+    if notebook_viewer is not None:
+        stdout_handler = handlers.pop("stdout", None)
+        if stdout_handler is not None:
+            notebook_viewer.setLevel(stdout_handler.level)
+            notebook_viewer.filters = list(stdout_handler.filters)
+        handlers["notebook"] = notebook_viewer
+    if debug_on_error_capacity and "file_json" in handlers:
+        from src.logging.myRingBufferHandler import DebugOnErrorHandler
+
+        handlers.pop("stdout", None)
+        handlers["debug_on_error"] = DebugOnErrorHandler(debug_on_error_capacity, target=handlers.pop("file_json"), close_target=True)
+    queue_listener.swap_handlers(handlers)
+    apply_logger_levels(config)
+    logger.debug("logging configuration reloaded with handlers: %s", ", ".join(handlers))
+
 
 def testing_loading_config():
     setup_logging()  # Initialize logging
+    log_sample_records()
+
 
-    # Generate some test logs
-    logger.debug("debug message", extra={"x": "hello"})
-    logger.info("info message")
-    logger.warning("warning message")
-    logger.error("error message")
-    logger.critical("critical message")
-    try:
-        1 / 0
-    except ZeroDivisionError:
-        logger.exception("exception message")
+def log_sample_records():
+    """Generate some test logs, timed as spans (written to the JSON file only), through an already set up pipeline."""
+    with tracer.span("testing_loading_config"):
+        with tracer.span("non_error_logs"):
+            logger.debug("debug message", extra={"x": "hello"})
+            logger.info("info message")
+        with tracer.span("error_logs"):
+            logger.warning("warning message")
+            logger.error("error message")
+            logger.critical("critical message")
+            try:
+                1 / 0
+            except ZeroDivisionError:
+                logger.exception("exception message")
 
 if __name__ == "__main__":
     testing_loading_config()
@@ -9,6 +9,9 @@ class MyColoredFormatter(logging.Formatter):
     and other attributes such as timestamp, filename, function name, and line number.
     """
 
+    # Fields are read as attributes, so compact (slotted) records work as is
+    supports_compact_records = True
+
     def format(self, record):
         # Generate timestamp with formatTime method including timezone
         asctime = f"{TIME_COLOR}{self.formatTime(record, self.datefmt)}{RESET}"
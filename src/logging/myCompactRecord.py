@@ -0,0 +1,259 @@
+import collections.abc
+import logging
+import operator
+import os
+import queue
+import sys
+import threading
+import time
+import tracemalloc
+
+from src.logging.myDurableFileHandler import DURABLE_COMMIT_ATTR
+from src.logging.mySharedFormatter import FORMAT_CACHE_ATTR, SharedFormatter
+
+# Every attribute the stdlib (LogRecord.__init__, Formatter, QueueHandler)
+# and this package set on a record. They live in slots, so the instance
+# dict only ever holds the extras.
+COMPACT_RECORD_ATTRS = (
+    "name",
+    "msg",
+    "args",
+    "levelname",
+    "levelno",
+    "pathname",
+    "filename",
+    "module",
+    "exc_info",
+    "exc_text",
+    "stack_info",
+    "lineno",
+    "funcName",
+    "created",
+    "msecs",
+    "relativeCreated",
+    "thread",
+    "threadName",
+    "processName",
+    "process",
+    "taskName",
+    "message",
+    "asctime",
+    FORMAT_CACHE_ATTR,
+    DURABLE_COMMIT_ATTR,
+)
+
+# Slots always set by __init__, the other ones are only copied when present
+_INIT_ATTRS = tuple(attr for attr in COMPACT_RECORD_ATTRS if attr not in ("taskName", "message", "asctime", FORMAT_CACHE_ATTR, DURABLE_COMMIT_ATTR))
+_OPTIONAL_ATTRS = ("taskName", "message", "asctime", DURABLE_COMMIT_ATTR)
+_get_init_attrs = operator.attrgetter(*_INIT_ATTRS)
+
+# (filename, module) per pathname, shared by the records of the same source file
+_PATH_PARTS = {}
+_MISSING = object()
+
+
+class CompactLogRecord(logging.LogRecord):
+    """
+    LogRecord storing its standard attributes in slots.
+    The stdlib record keeps ~22 attributes in a per-instance dict; here they
+    are fixed slots and `record.__dict__` is only created (lazily) for the
+    extras passed with `extra=`, which is exactly the side dict
+    `MyJSONFormatter` copies into its output. `filename` and `module` are
+    derived once per source file instead of allocating two strings per record.
+    Limits, this is why the factory is opt-in (`install_record_factory`):
+    - Formatters that look fields up in `record.__dict__` (every stock
+      `logging.Formatter` style) do not see the slots, use `CompactFormatter`
+      or an attribute-reading formatter (`supports_compact_records = True`).
+    - An extra named like a standard attribute is shadowed by the slot instead
+      of raising `KeyError`, and `logging.makeLogRecord` cannot set them.
+    """
+
+    __slots__ = COMPACT_RECORD_ATTRS
+
+    def __init__(self, name, level, pathname, lineno, msg, args, exc_info, func=None, sinfo=None, **kwargs):
+        # Same fields and semantics as LogRecord.__init__
+        created = time.time()
+        self.name = name
+        self.msg = msg
+        if args and len(args) == 1 and isinstance(args[0], collections.abc.Mapping) and args[0]:
+            args = args[0]
+        self.args = args
+        self.levelname = logging.getLevelName(level)
+        self.levelno = level
+        self.pathname = pathname
+        try:
+            self.filename, self.module = _PATH_PARTS[pathname]
+        except KeyError:
+            try:
+                filename = os.path.basename(pathname)
+                module = os.path.splitext(filename)[0]
+            except (TypeError, ValueError, AttributeError):
+                filename = module = "Unknown module"
+            self.filename, self.module = _PATH_PARTS[pathname] = (filename, module)
+        self.exc_info = exc_info
+        self.exc_text = None
+        self.stack_info = sinfo
+        self.lineno = lineno
+        self.funcName = func
+        self.created = created
+        self.msecs = int((created - int(created)) * 1000) + 0.0
+        self.relativeCreated = (created - logging._startTime) * 1000
+        if logging.logThreads:
+            self.thread = threading.get_ident()
+            self.threadName = threading.current_thread().name
+        else:
+            self.thread = None
+            self.threadName = None
+        self.processName = None
+        if logging.logMultiprocessing:
+            self.processName = "MainProcess"
+            mp = sys.modules.get("multiprocessing")
+            if mp is not None:
+                try:
+                    self.processName = mp.current_process().name
+                except Exception:
+                    pass
+        self.process = os.getpid() if logging.logProcesses and hasattr(os, "getpid") else None
+
+    def __copy__(self):
+        # QueueHandler.prepare copies every record, the generic copy protocol
+        # goes through a slots state dict and is twice as slow
+        cls = type(self)
+        record = cls.__new__(cls)
+        for attr, value in zip(_INIT_ATTRS, _get_init_attrs(self)):
+            setattr(record, attr, value)
+        for attr in _OPTIONAL_ATTRS:
+            value = getattr(self, attr, _MISSING)
+            if value is not _MISSING:
+                setattr(record, attr, value)
+        if extras := self.__dict__:
+            record.__dict__.update(extras)
+        return record
+
+
+class RecordView:
+    """Read-only mapping over the attributes of a record, for the stock format styles."""
+
+    __slots__ = ("record",)
+
+    def __init__(self, record: logging.LogRecord):
+        self.record = record
+
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self.record, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+
+class CompactFormatter(logging.Formatter):
+    """`logging.Formatter` (any of the `%`, `{` and `$` styles) reading the fields through `RecordView`."""
+
+    supports_compact_records = True
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        style = self._style
+        if style._fmt == "%(message)s" and type(style) is logging.PercentStyle:
+            # Default format (e.g. the QueueHandler), no lookup needed
+            return record.message
+        view = RecordView(record)
+        if isinstance(style, logging.StrFormatStyle):
+            return style._fmt.format_map(view)
+        if isinstance(style, logging.StringTemplateStyle):
+            return style._tpl.substitute(view)
+        return style._fmt % view
+
+
+def supports_compact_records(formatter: logging.Formatter | None) -> bool:
+    if isinstance(formatter, SharedFormatter):
+        formatter = formatter.formatter
+    return getattr(formatter, "supports_compact_records", False)
+
+
+def prepare_handlers(handlers) -> None:
+    """
+    Make the given handlers safe for `CompactLogRecord`.
+    Handlers without a formatter (e.g. the `QueueHandler`, which formats the
+    message in `prepare()`) and handlers with a stock `logging.Formatter`
+    get an equivalent `CompactFormatter`. Any other formatter must declare
+    `supports_compact_records = True`, otherwise a `TypeError` is raised.
+    """
+    for handler in handlers:
+        formatter = handler.formatter
+        if formatter is None:
+            handler.setFormatter(CompactFormatter())
+        elif type(formatter) is logging.Formatter:
+            compact = CompactFormatter(datefmt=formatter.datefmt)
+            compact._style = formatter._style
+            compact._fmt = formatter._fmt
+            handler.setFormatter(compact)
+        elif not supports_compact_records(formatter):
+            raise TypeError(f"Formatter {type(formatter).__name__} of handler {handler.name!r} does not support compact log records")
+
+
+def install_record_factory(handlers) -> None:
+    """
+    Prepare the handlers (and `logging.lastResort`) with `prepare_handlers`,
+    then create every new record as a `CompactLogRecord`.
+    """
+    handlers = list(handlers)
+    if logging.lastResort is not None:
+        handlers.append(logging.lastResort)
+    prepare_handlers(handlers)
+    logging.setLogRecordFactory(CompactLogRecord)
+
+
+def uninstall_record_factory() -> None:
+    logging.setLogRecordFactory(logging.LogRecord)
+
+
+def compact_records_installed() -> bool:
+    return logging.getLogRecordFactory() is CompactLogRecord
+
+
+def benchmark_record_factory(n: int = 100_000) -> None:
+    """
+    Memory per queued record and allocation rate, stdlib `LogRecord` vs.
+    `CompactLogRecord`. Records go through a `QueueHandler` into a queue that
+    nobody drains, which is what a burst does to the L06 pipeline: the
+    allocation rate is how fast the queue grows while the listener lags.
+    """
+    import logging.handlers
+
+    from src.helper.caller import get_console
+
+    console = get_console()
+    previous_factory = logging.getLogRecordFactory()
+    try:
+        for factory in (logging.LogRecord, CompactLogRecord):
+            log_queue = queue.SimpleQueue()
+            handler = logging.handlers.QueueHandler(log_queue)
+            if factory is CompactLogRecord:
+                prepare_handlers([handler])
+            logger = logging.getLogger(f"benchmark_record_factory.{factory.__name__}")
+            logger.handlers = [handler]
+            logger.propagate = False
+            logger.setLevel(logging.DEBUG)
+            logging.setLogRecordFactory(factory)
+
+            tracemalloc.start()
+            for i in range(n):
+                logger.info("request %d served", i, extra={"user_id": i, "path": "/api"})
+            queued, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            while not log_queue.empty():
+                log_queue.get_nowait()
+
+            start = time.perf_counter()
+            for i in range(n):
+                logger.info("request %d served", i, extra={"user_id": i, "path": "/api"})
+            elapsed = time.perf_counter() - start
+            per_record = queued / n
+            rate = n / elapsed
+            console.log(f"[ INFO ] {factory.__name__:<17} {per_record:6.0f} B/queued record, {rate:,.0f} records/s, {per_record * rate / 2**20:6.1f} MiB/s of queue growth")
+    finally:
+        logging.setLogRecordFactory(previous_factory)
+
+
+if __name__ == "__main__":
+    benchmark_record_factory()
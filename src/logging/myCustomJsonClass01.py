@@ -1,6 +1,11 @@
 import datetime as dt
 import json
 import logging
+import reprlib
+
+from src.logging.myCompactRecord import CompactLogRecord
+from src.logging.myDurableFileHandler import DURABLE_COMMIT_ATTR
+from src.logging.mySharedFormatter import FORMAT_CACHE_ATTR
 
 # from typing import override
 
@@ -28,41 +33,214 @@ LOG_RECORD_BUILTIN_ATTRS = {
     "thread",
     "threadName",
     "taskName",
+    FORMAT_CACHE_ATTR,
+    DURABLE_COMMIT_ATTR,
 }
 
 
+class CappedRepr(reprlib.Repr):
+    """
+    `reprlib.Repr` for the values JSON cannot encode natively.
+    Containers are walked only up to the `maxlist`/`maxdict`/... limits, so
+    a huge set or deque is never rendered in full. Strings and bytes are
+    sliced before they are rendered, and any other object with more than
+    `maxother` items (an array, a frame, a custom collection) becomes
+    `<Type instance, len N>` without being rendered at all. The remaining
+    objects keep the `str()` of the former `default=str`: their `__str__`
+    runs in full and only its output is cut at `maxother` characters.
+    """
+
+    def __init__(self, max_chars: int):
+        super().__init__()
+        self.maxstring = self.maxother = max_chars
+        self.maxlist = self.maxtuple = self.maxset = self.maxfrozenset = self.maxdeque = self.maxarray = 50
+        self.maxdict = 25
+
+    def repr_instance(self, x, level):
+        limit = self.maxother
+        if isinstance(x, str):
+            return x[:limit] if len(x) <= limit else f"{x[:limit]}...({len(x)} chars)"
+        if isinstance(x, (bytes, bytearray)):
+            text = repr(bytes(x[:limit]))
+            return text if len(x) <= limit else f"{text}...({len(x)} bytes)"
+        try:
+            size = len(x)
+        except Exception:
+            size = None
+        if size is not None and size > limit:
+            # Its text would be cut anyway, rendering it first is the cost avoided
+            return f"<{type(x).__name__} instance, len {size:,}>"
+        try:
+            text = str(x)
+        except Exception:
+            return f"<{type(x).__name__} instance>"
+        return truncate(text, limit)
+
+
+def truncate(text: str, max_chars: int) -> str:
+    if len(text) <= max_chars:
+        return text
+    return f"{text[:max_chars]}...({len(text)} chars)"
+
+
+def _coerce(convert, fallback):
+    """Converter for a declared extra of the wrong type, its text (`fallback`) when it cannot be converted."""
+
+    def coerce(value):
+        try:
+            return convert(value)
+        except (TypeError, ValueError, OverflowError):
+            return value if value.__class__ is str else fallback(value)
+
+    return coerce
+
+
+def _as_int(value):
+    converted = int(value)
+    if value.__class__ is not str and converted != value:
+        raise ValueError(f"{value!r} is not integral")  # int() would truncate 3.9 to 3
+    return converted
+
+
+_BOOL_STRINGS = {"true": True, "false": False, "1": True, "0": False}
+
+
+def _as_bool(value):
+    if value.__class__ is str:
+        try:
+            return _BOOL_STRINGS[value.strip().lower()]
+        except KeyError:
+            raise ValueError(f"not a boolean: {value!r}") from None
+    if isinstance(value, (int, float)) and value in (0, 1):
+        return bool(value)
+    raise TypeError(type(value).__name__)  # bool() would make any non-empty value true
+
+
+def _as_json(value):
+    if isinstance(value, (list, dict)):
+        return value
+    if isinstance(value, (tuple, set, frozenset)):
+        return list(value)
+    raise TypeError(type(value).__name__)
+
+
+# Declared type -> (classes encoded as they are, converter for any other class)
+EXTRA_TYPES = {
+    "str": ((str,), str),
+    "int": ((int,), _as_int),
+    "float": ((float, int), float),
+    "bool": ((bool,), _as_bool),
+    "json": ((list, dict), _as_json),
+}
+_JSON_NATIVE = frozenset((str, int, float, bool, type(None), list, dict))
+
+
 class MyJSONFormatter(logging.Formatter):
+    """
+    JSON lines formatter, `fmt_keys` maps output keys to record attributes
+    and every extra is added after them.
+    Args:
+        fmt_keys (dict[str, str] | None): Output key -> record attribute.
+        extras_schema (dict[str, str] | None): Declared extras and their type,
+            one of `EXTRA_TYPES` (`json` for lists and dicts). A declared
+            extra has its type in the output: a value of the declared class is
+            encoded as it is (one class check), any other value is converted
+            when that loses nothing (`"42"` -> 42, `"false"` -> false, but
+            neither 3.9 -> 3 nor `"no"` -> true), or becomes its capped text
+            otherwise; `None` stays `null`.
+        max_value_chars (int | None): Cap of string extras, of the serialized
+            size of list and dict extras (a longer one becomes its capped JSON
+            text), and of the text of the values JSON cannot encode, rendered
+            by `CappedRepr` instead of a full `str()`.
+    Without `extras_schema` and `max_value_chars` the output is the same as
+    before, unknown values go through `default=str`. With them, no extra
+    ever reaches the `default` hook (only objects nested in containers do),
+    and the dict is encoded in one pass by the C encoder of `json`.
+    Usage in a `dictConfig` formatters section:
+        "json": {
+          "()": "src.logging.myCustomJsonClass01.MyJSONFormatter",
+          "fmt_keys": {"level": "levelname", "message": "message"},
+          "extras_schema": {"user_id": "int", "duration_s": "float"},
+          "max_value_chars": 2000
+        }
+    """
+
+    supports_compact_records = True  # Reads attributes, never the record __dict__ (see myCompactRecord)
+
     def __init__(
         self,
         *,
         fmt_keys: dict[str, str] | None = None,
+        extras_schema: dict[str, str] | None = None,
+        max_value_chars: int | None = None,
     ):
         super().__init__()
         self.fmt_keys = fmt_keys if fmt_keys is not None else {}
+        self.extras_schema = extras_schema if extras_schema is not None else {}
+        self.max_value_chars = max_value_chars
+        if unknown := {kind for kind in self.extras_schema.values() if kind not in EXTRA_TYPES}:
+            raise ValueError(f"Unknown extras_schema types {sorted(unknown)}, expected one of {list(EXTRA_TYPES)}")
+        fallback = CappedRepr(max_value_chars).repr if max_value_chars is not None else str
+        self._fallback = fallback
+        # Same output as json.dumps(..., default=...), without building an encoder per call
+        self._dumps = json.JSONEncoder(default=fallback).encode
+        self._schema = {key: (EXTRA_TYPES[kind][0], _coerce(EXTRA_TYPES[kind][1], fallback)) for key, kind in self.extras_schema.items()}
 
     # @override
     def format(self, record: logging.LogRecord) -> str:
-        message = self._prepare_log_dict(record)
-        return json.dumps(message, default=str)
+        if not self._schema and self.max_value_chars is None:
+            message = self._prepare_log_dict(record)
+            return self._dumps(message)
+
+        message = self._prepare_fields(record)
+        schema = self._schema
+        max_chars = self.max_value_chars
+        for key, value in self._extras(record):
+            cls = value.__class__
+            declared = schema.get(key)
+            if declared is not None and cls not in declared[0] and value is not None:
+                value = declared[1](value)
+                cls = value.__class__
+            if cls is str:
+                if max_chars is not None and len(value) > max_chars:
+                    value = truncate(value, max_chars)
+            elif cls is list or cls is dict:
+                if max_chars is not None and len(value):
+                    text = self._dumps(value)
+                    if len(text) > max_chars:
+                        value = truncate(text, max_chars)
+            elif cls not in _JSON_NATIVE:
+                value = self._fallback(value)
+            message[key] = value
+        return self._dumps(message)
 
     def _prepare_log_dict(self, record: logging.LogRecord):
+        message = self._prepare_fields(record)
+        message.update(self._extras(record))
+        return message
+
+    def _extras(self, record: logging.LogRecord):
+        if isinstance(record, CompactLogRecord):
+            # The standard attributes live in slots, the dict only holds the extras
+            return record.__dict__.items()
+        return ((key, val) for key, val in record.__dict__.items() if key not in LOG_RECORD_BUILTIN_ATTRS)
+
+    def _prepare_fields(self, record: logging.LogRecord):
         always_fields = {
             "message": record.getMessage(),
             "timestamp": dt.datetime.fromtimestamp(record.created, tz=dt.timezone.utc).isoformat(),
         }
         if record.exc_info is not None:
-            always_fields["exc_info"] = self.formatException(record.exc_info)
+            # Formatted once per record, like logging.Formatter (and possibly redacted since, see myRedaction)
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            always_fields["exc_info"] = record.exc_text
 
         if record.stack_info is not None:
             always_fields["stack_info"] = self.formatStack(record.stack_info)
 
         message = {key: msg_val if (msg_val := always_fields.pop(val, None)) is not None else getattr(record, val) for key, val in self.fmt_keys.items()}
         message.update(always_fields)
-
-        for key, val in record.__dict__.items():
-            if key not in LOG_RECORD_BUILTIN_ATTRS:
-                message[key] = val
-
         return message
 
 
@@ -70,3 +248,41 @@ class NonErrorFilter(logging.Filter):
     # @override
     def filter(self, record: logging.LogRecord) -> bool | logging.LogRecord:
         return record.levelno <= logging.INFO
+
+
+def benchmark_extras_schema(n: int = 100_000) -> None:
+    """
+    Records per second and line size, `default=str` for every extra vs.
+    declared extras with `max_value_chars`, for span like extras plus, once
+    every 1000 records, a mistyped one and an undeclared object with a huge
+    `str()`.
+    """
+    import time
+
+    from src.helper.caller import get_console
+
+    class Payload:
+        def __str__(self):
+            return "payload " + "x" * 100_000
+
+    console = get_console()
+    fmt_keys = {"level": "levelname", "message": "message", "timestamp": "timestamp", "logger": "name", "line": "lineno"}
+    schema = {"x": "str", "span_name": "str", "duration_ns": "int", "span_id": "int", "parent_id": "int", "ratio": "float", "tags": "json"}
+    extras = {"x": "hello", "span_name": "db.query", "duration_ns": 1_234_567, "span_id": 42, "parent_id": None, "ratio": 0.25, "tags": ["a", "b"]}
+    records = []
+    for i in range(n):
+        record = logging.LogRecord("benchmark", logging.INFO, __file__, i, "request %d served", (i,), None)
+        record.__dict__.update(extras)
+        if i % 1000 == 0:
+            record.payload = Payload()
+            record.span_id = str(i)  # Mistyped, converted back to an int with the schema
+        records.append(record)
+    for label, formatter in (("default=str", MyJSONFormatter(fmt_keys=fmt_keys)), ("extras_schema", MyJSONFormatter(fmt_keys=fmt_keys, extras_schema=schema, max_value_chars=1000))):
+        start = time.perf_counter()
+        size = sum(len(formatter.format(record)) for record in records)
+        elapsed = time.perf_counter() - start
+        console.log(f"[ INFO ] {label:<14} {n:,} records in {elapsed:.2f} s -> {n / elapsed:,.0f} records/s, {size / n:,.0f} chars/line")
+
+
+if __name__ == "__main__":
+    benchmark_extras_schema()
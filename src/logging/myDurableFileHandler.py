@@ -0,0 +1,288 @@
+import logging
+import logging.handlers
+import os
+import threading
+import time
+
+DURABILITY_MODES = ("none", "periodic", "error", "group")
+
+# Name of the per-record attribute holding the `DurableCommit` a producer
+# waits on. It is listed in `LOG_RECORD_BUILTIN_ATTRS` (and is a slot of
+# `CompactLogRecord`) so it is never emitted as an extra.
+DURABLE_COMMIT_ATTR = "_durable_commit"
+
+
+class DurableCommit:
+    """
+    Completion of a critical record, waited on by the producer that logged it.
+    Every party that still has work to do on the record holds it (the
+    QueueListener until it dispatched the record, each group commit handler
+    until its fsync covered it); `wait()` returns once nobody holds it.
+    """
+
+    __slots__ = ("_lock", "_holds", "_done")
+
+    def __init__(self, holds: int = 0):
+        self._lock = threading.Lock()
+        self._holds = holds
+        self._done = threading.Event()
+        if not holds:
+            self._done.set()
+
+    def claim(self) -> None:
+        with self._lock:
+            self._holds += 1
+            self._done.clear()
+
+    def release(self) -> None:
+        with self._lock:
+            self._holds -= 1
+            if self._holds <= 0:
+                self._done.set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        return self._done.wait(timeout)
+
+
+class DurableRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler with a choice of when the written records reach the disk.
+    Args:
+        durability (str): One of `DURABILITY_MODES`:
+            - "none": records stay in the page cache until the OS writes
+              them, as with the stock handler.
+            - "periodic": a background thread calls `fsync` every
+              `fsync_interval` seconds when something was written since the
+              last one, at most that much is lost on a power failure.
+            - "error": every record from `fsync_level` on is followed by an
+              `fsync` on the writing thread, before `emit()` returns.
+            - "group": records from `fsync_level` on are committed by a
+              background thread; one `fsync` covers every record written
+              since the previous one, and the producers of those records
+              wait on it together (see `DurableQueueHandler`).
+        fsync_interval (float): Seconds between two fsyncs in "periodic" mode.
+        fsync_level (int | str): Level of the critical records in the
+            "error" and "group" modes.
+        commit_timeout (float): Longest wait of a producer in "group" mode.
+    Records are always flushed to the OS after each write (StreamHandler),
+    the modes only differ in the `fsync` calls. fsync runs on a duplicate of
+    the file descriptor, so a rollover can close the file meanwhile, and the
+    file being rotated out is synced first unless durability is "none". The
+    background thread never takes the handler lock, which
+    `logging.shutdown()` holds while it closes the handler and joins it.
+    When the handler is used directly, the thread logging a critical record
+    waits for its group commit in `handle()`. Behind the L06 queue, use
+    `DurableQueueHandler` as the queue handler: the producer waits and the
+    QueueListener keeps writing the next records, which is what makes the
+    groups. With the stock QueueHandler the listener itself waits.
+    Usage in a `dictConfig` handlers section:
+        "file_json": {
+          "class": "src.logging.myDurableFileHandler.DurableRotatingFileHandler",
+          "formatter": "json",
+          "filename": "src/logging/project_log_file.log",
+          "durability": "group"
+        }
+    """
+
+    def __init__(
+        self,
+        filename,
+        mode="a",
+        maxBytes=0,
+        backupCount=0,
+        encoding=None,
+        delay=False,
+        errors=None,
+        durability: str = "none",
+        fsync_interval: float = 1.0,
+        fsync_level=logging.ERROR,
+        commit_timeout: float = 5.0,
+    ):
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"durability must be one of {DURABILITY_MODES}, got {durability!r}")
+        super().__init__(filename, mode, maxBytes, backupCount, encoding, delay, errors)
+        self.durability = durability
+        self.fsync_interval = fsync_interval
+        self.fsync_level = logging._checkLevel(fsync_level)
+        self.commit_timeout = commit_timeout
+        self.fsyncs = 0
+        self._dirty = False
+        self._pending = []  # DurableCommit of the records written since the last group fsync
+        self._commit_ready = threading.Condition(threading.Lock())
+        # Held while the background thread duplicates the fd, and while a rollover replaces the stream
+        self._fd_lock = threading.Lock()
+        self._closing = False
+        self._stop_event = threading.Event()
+        self._thread = None
+        if durability == "periodic":
+            self._thread = threading.Thread(target=self._fsync_periodically, name="DurableFileHandler", daemon=True)
+        elif durability == "group":
+            self._thread = threading.Thread(target=self._group_commit, name="DurableFileHandler", daemon=True)
+        if self._thread is not None:
+            self._thread.start()
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        commit = None
+        if self.durability == "group" and record.levelno >= self.fsync_level and getattr(record, DURABLE_COMMIT_ATTR, None) is None:
+            # Direct use, this thread is the producer
+            commit = DurableCommit()
+            setattr(record, DURABLE_COMMIT_ATTR, commit)
+        rv = super().handle(record)
+        if commit is not None:
+            commit.wait(self.commit_timeout)
+        return rv
+
+    def emit(self, record: logging.LogRecord) -> None:
+        super().emit(record)
+        if self.durability == "none" or self.stream is None:
+            return
+        self._dirty = True
+        if record.levelno < self.fsync_level:
+            return
+        if self.durability == "error":
+            self._fsync()
+        elif self.durability == "group" and (commit := getattr(record, DURABLE_COMMIT_ATTR, None)) is not None:
+            commit.claim()
+            with self._commit_ready:
+                self._pending.append(commit)
+                self._commit_ready.notify()
+
+    def _fsync(self) -> None:
+        """fsync what was written so far, called with the handler lock held."""
+        self._dirty = False
+        os.fsync(self.stream.fileno())
+        self.fsyncs += 1
+
+    def _fsync_unlocked(self) -> None:
+        """fsync what was written so far, from the background thread, without the handler lock."""
+        with self._fd_lock:
+            if self.stream is None:
+                return
+            self._dirty = False
+            fd = os.dup(self.stream.fileno())
+        try:
+            os.fsync(fd)
+            self.fsyncs += 1
+        finally:
+            os.close(fd)
+
+    def _fsync_periodically(self) -> None:
+        while not self._stop_event.wait(self.fsync_interval):
+            if self._dirty:
+                try:
+                    self._fsync_unlocked()
+                except OSError:
+                    pass  # Retried at the next period
+
+    def _group_commit(self) -> None:
+        while True:
+            with self._commit_ready:
+                while not self._pending and not self._closing:
+                    self._commit_ready.wait()
+                if not self._pending:
+                    return
+                # Everything already written is covered by the next fsync, later records wait for the one after
+                group, self._pending = self._pending, []
+            try:
+                self._fsync_unlocked()
+            except OSError:
+                pass  # The producers are released anyway, `commit_timeout` is no place to retry
+            for commit in group:
+                commit.release()
+
+    def doRollover(self) -> None:
+        with self._fd_lock:
+            if self.durability != "none" and self.stream is not None:
+                self._fsync()
+            super().doRollover()
+
+    def close(self) -> None:
+        self._stop_event.set()
+        with self._commit_ready:
+            self._closing = True
+            self._commit_ready.notify()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        with self.lock:
+            if self.durability != "none" and self._dirty and self.stream is not None:
+                self.stream.flush()
+                self._fsync()
+        super().close()
+
+
+class DurableQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler whose producers wait for the group commit of their critical records.
+    Args:
+        queue: The queue of the QueueListener.
+        wait_level (int | str): Level from which the producer waits.
+        timeout (float): Longest wait, the record is logged either way.
+    The record gets a `DurableCommit` held by the listener until every
+    handler saw the record (released by `FormatOnceQueueListener`), and by
+    each "group" `DurableRotatingFileHandler` until its fsync. Producers of
+    lower levels never wait.
+    """
+
+    def __init__(self, queue, wait_level=logging.ERROR, timeout: float = 5.0):
+        super().__init__(queue)
+        self.wait_level = logging._checkLevel(wait_level)
+        self.timeout = timeout
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        commit = None
+        if record.levelno >= self.wait_level:
+            commit = DurableCommit(holds=1)
+            setattr(record, DURABLE_COMMIT_ATTR, commit)
+        rv = super().handle(record)
+        if rv and commit is not None:
+            commit.wait(self.timeout)
+        return rv
+
+
+def benchmark_durability(threads: int = 8, per_thread: int = 5_000, error_every: int = 10) -> None:
+    """
+    Records per second per durability mode on the local disk, `threads`
+    producers logging straight to the handler, one ERROR every
+    `error_every` records. "fsync per record" is the "error" mode with
+    `fsync_level=DEBUG`, the baseline the other modes avoid.
+    """
+    import tempfile
+
+    from src.helper.caller import get_console
+    from src.logging.myCustomJsonClass01 import MyJSONFormatter
+
+    console = get_console()
+    formatter = MyJSONFormatter(fmt_keys={"level": "levelname", "message": "message", "timestamp": "timestamp", "logger": "name"})
+    logger = logging.getLogger("benchmark_durability")
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+
+    def produce(count: int) -> None:
+        for i in range(count):
+            if i % error_every == error_every - 1:
+                logger.error("request %d failed", i)
+            else:
+                logger.info("request %d served", i)
+
+    cases = [(mode, mode, logging.ERROR) for mode in DURABILITY_MODES] + [("fsync per record", "error", logging.DEBUG)]
+    with tempfile.TemporaryDirectory(dir=os.getcwd()) as tmp_dir:
+        for label, durability, fsync_level in cases:
+            count = per_thread if label != "fsync per record" else per_thread // 10
+            handler = DurableRotatingFileHandler(os.path.join(tmp_dir, f"{durability}_{fsync_level}.log"), durability=durability, fsync_level=fsync_level)
+            handler.setFormatter(formatter)
+            logger.handlers = [handler]
+            workers = [threading.Thread(target=produce, args=(count,)) for _ in range(threads)]
+            start = time.perf_counter()
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            elapsed = time.perf_counter() - start
+            handler.close()
+            total = threads * count
+            console.log(f"[ INFO ] {label:<17} {total:,} records in {elapsed:.2f} s -> {total / elapsed:,.0f} records/s, {handler.fsyncs:,} fsyncs")
+    logger.handlers = []
+
+
+if __name__ == "__main__":
+    benchmark_durability()
@@ -13,3 +13,10 @@ class StderrFilter(logging.Filter):
 
     def filter(self, record: logging.LogRecord) -> bool:
         return record.levelno >= logging.WARNING
+
+
+class NoSpanFilter(logging.Filter):
+    """Keep the timing span records (`spans` logger, see mySpans) out of the console."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.name != "spans"
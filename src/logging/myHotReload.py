@@ -0,0 +1,107 @@
+import json
+import logging
+import logging.config
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+def load_config(config_file: str) -> dict:
+    with open(config_file) as f_in:
+        return json.load(f_in)
+
+
+def build_handlers(config: dict, exclude=("queue_handler",)) -> dict[str, logging.Handler]:
+    """
+    Build the handlers of a logging configuration without installing them.
+    Args:
+        config (dict): A `dictConfig` style configuration.
+        exclude (Iterable[str]): Handler names to skip (the producer side queue handler).
+    Returns:
+        dict[str, Handler]: The new handlers keyed by name, with their
+            formatters and filters attached but not registered under any name.
+    This reuses the `DictConfigurator` steps that `dictConfig` runs, but it
+    leaves the loggers, the root handlers and `logging._handlers` untouched,
+    so the running pipeline keeps working while the new graph is built.
+    """
+    configurator = logging.config.DictConfigurator(config)
+    config = configurator.config
+
+    formatters = config.get("formatters", {})
+    for name in formatters:
+        formatters[name] = configurator.configure_formatter(formatters[name])
+
+    filters = config.get("filters", {})
+    for name in filters:
+        filters[name] = configurator.configure_filter(filters[name])
+
+    handlers = config.get("handlers", {})
+    built = {}
+    deferred = []
+    for name in sorted(handlers):
+        if name in exclude:
+            continue
+        try:
+            built[name] = handlers[name] = configurator.configure_handler(handlers[name])
+        except ValueError as error:
+            # A handler with a `target` (MemoryHandler family) configured before its target, same retry as dictConfig
+            if "target not configured yet" not in str(error.__cause__):
+                raise
+            deferred.append(name)
+    for name in deferred:
+        built[name] = handlers[name] = configurator.configure_handler(handlers[name])
+    return built
+
+
+def apply_logger_levels(config: dict) -> None:
+    """Set the level of every logger listed in the configuration (a single attribute write each)."""
+    loggers = dict(config.get("loggers", {}))
+    if "root" in config:
+        loggers["root"] = config["root"]
+    for name, logger_config in loggers.items():
+        level = logger_config.get("level")
+        if level is not None:
+            logging.getLogger(None if name == "root" else name).setLevel(logging._checkLevel(level))
+
+
+class ConfigWatcher(threading.Thread):
+    """
+    Daemon thread polling a configuration file and reporting changes.
+    The file is checked with `os.stat` every `interval` seconds; a change of
+    its modification time or size calls `on_change(config_file)`. Stat
+    polling is used instead of inotify so it works the same on macOS and
+    Linux without extra dependencies.
+    """
+
+    def __init__(self, config_file: str, on_change, interval: float = 1.0):
+        super().__init__(name="ConfigWatcher", daemon=True)
+        self.config_file = config_file
+        self.on_change = on_change
+        self.interval = interval
+        self._stop_event = threading.Event()
+        self._signature = self._stat()
+
+    def _stat(self):
+        try:
+            stat = os.stat(self.config_file)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            signature = self._stat()
+            if signature is None or signature == self._signature:
+                continue
+            self._signature = signature
+            try:
+                self.on_change(self.config_file)
+            except Exception:
+                # Keep the running configuration if the new one is broken
+                logger.exception("Failed to reload logging configuration from %s", self.config_file)
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self.is_alive():
+            self.join()
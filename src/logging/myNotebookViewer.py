@@ -0,0 +1,191 @@
+import html
+import itertools
+import logging
+import threading
+import time
+from collections import Counter, deque
+
+_LEVEL_STYLES = {
+    "DEBUG": "color: #0aa",
+    "INFO": "color: #a0a",
+    "WARNING": "color: #b80",
+    "ERROR": "color: #c00",
+    "CRITICAL": "color: #c00; font-weight: bold",
+}
+
+
+class NotebookLogHandler(logging.Handler):
+    """
+    Log viewer for JupyterLab, instead of the `stdout` StreamHandler.
+    Args:
+        capacity (int): Records kept, the oldest ones are dropped beyond that.
+        page_size (int): Rows rendered at a time.
+        min_interval (float): Seconds between two re-renders at most.
+    `emit()` only appends the record to a bounded deque: nothing is
+    formatted nor sent to the browser per record. Once shown (`show()`), a
+    background thread re-renders the view in place (one display id, so the
+    cell output never grows) at most every `min_interval` seconds and only
+    when records arrived or the view changed. Only the rows of the current
+    page are formatted and escaped, so the cost of a render does not depend
+    on how many records are stored, and the kernel stays responsive while
+    thousands of records per second come in.
+    Usage in a notebook cell:
+        viewer = NotebookLogHandler()
+        logging.getLogger().addHandler(viewer)
+        viewer.show()
+        viewer.filter_view(level="WARNING", logger="src.logging")
+        viewer.page(0)  # oldest records, viewer.follow() goes back to the newest
+    Or `setup_logging(notebook=True)` in L06, which replaces `stdout` with it.
+    """
+
+    def __init__(self, capacity: int = 10_000, page_size: int = 50, min_interval: float = 0.5, level=logging.NOTSET):
+        super().__init__(level)
+        self.capacity = capacity
+        self.page_size = page_size
+        self.min_interval = min_interval
+        self.records = deque(maxlen=capacity)
+        self.received = 0
+        self.level_counts = Counter()
+        self.view_level = logging.NOTSET
+        self.view_logger = None
+        self.page_number = None  # None follows the newest records
+        self.renders = 0
+        self._time_formatter = logging.Formatter(datefmt="%H:%M:%S")
+        self._dirty = threading.Event()
+        self._stop_event = threading.Event()
+        self._display = None
+        self._thread = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+        self.received += 1
+        self.level_counts[record.levelname] += 1
+        self._dirty.set()
+
+    # ------------------------------------------------------------------ #
+    # View
+    # ------------------------------------------------------------------ #
+    def filter_view(self, level=None, logger: str | None = None) -> None:
+        """Show only the records from `level` on, of `logger` and its children (None clears a filter)."""
+        self.view_level = logging._checkLevel(level) if level is not None else logging.NOTSET
+        self.view_logger = logger
+        self._dirty.set()
+
+    def page(self, number: int) -> None:
+        """Show page `number` of the filtered records, 0 being the oldest, negative ones count from the newest."""
+        self.page_number = number
+        self._dirty.set()
+
+    def follow(self) -> None:
+        """Keep showing the newest records."""
+        self.page(None)
+
+    def _visible(self):
+        records = self.records.copy()  # A consistent snapshot, emit() may run meanwhile
+        level, name = self.view_level, self.view_logger
+        if level <= logging.NOTSET and name is None:
+            return records
+        prefix = f"{name}." if name else None
+        return [r for r in records if r.levelno >= level and (name is None or r.name == name or r.name.startswith(prefix))]
+
+    def render_html(self) -> str:
+        visible = self._visible()
+        pages = max(1, -(-len(visible) // self.page_size))
+        number = pages - 1 if self.page_number is None else self.page_number % pages
+        start = number * self.page_size
+        rows = [self._row_html(record) for record in itertools.islice(visible, start, start + self.page_size)]
+        counts = ", ".join(f"{name}: {count:,}" for name, count in sorted(self.level_counts.items(), key=lambda item: logging._checkLevel(item[0])))
+        view = [f"level &ge; {logging.getLevelName(self.view_level)}"] if self.view_level else []
+        if self.view_logger:
+            view.append(f"logger {html.escape(self.view_logger)}")
+        return (
+            "<div style='font-family: monospace; font-size: 12px'>"
+            f"<div>{len(visible):,} shown of {len(self.records):,} kept ({self.received:,} received; {counts})"
+            f"{' | ' + ', '.join(view) if view else ''} | page {number + 1}/{pages}{' (following)' if self.page_number is None else ''}</div>"
+            "<table style='border-collapse: collapse'>" + "".join(rows) + "</table></div>"
+        )
+
+    def _row_html(self, record: logging.LogRecord) -> str:
+        message = html.escape(record.getMessage())
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self._time_formatter.formatException(record.exc_info)
+        if record.exc_text:
+            message += f"<pre style='margin: 0'>{html.escape(record.exc_text)}</pre>"
+        style = _LEVEL_STYLES.get(record.levelname, "")
+        return (
+            f"<tr><td style='padding: 0 6px'>{self._time_formatter.formatTime(record, self._time_formatter.datefmt)}</td>"
+            f"<td style='padding: 0 6px; {style}'>{record.levelname}</td>"
+            f"<td style='padding: 0 6px'>{html.escape(record.name)}</td>"
+            f"<td style='padding: 0 6px; text-align: left'>{message}</td></tr>"
+        )
+
+    # ------------------------------------------------------------------ #
+    # Display
+    # ------------------------------------------------------------------ #
+    def show(self) -> None:
+        """Display the view in the current cell and start the throttled re-renders."""
+        from IPython.display import HTML, display
+
+        self._display = display(HTML(self.render_html()), display_id=True)
+        self.renders += 1
+        self._dirty.clear()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._render_periodically, name="NotebookLogHandler", daemon=True)
+            self._thread.start()
+
+    def render(self) -> None:
+        """Re-render the displayed view now."""
+        from IPython.display import HTML
+
+        self._dirty.clear()
+        if self._display is not None:
+            self._display.update(HTML(self.render_html()))
+            self.renders += 1
+
+    def _render_periodically(self) -> None:
+        while not self._stop_event.is_set():
+            self._dirty.wait()
+            if self._stop_event.is_set():
+                return
+            try:
+                self.render()
+            except Exception:
+                pass  # A closed front end must not break the logging, the next change retries
+            # Throttle: whatever arrives meanwhile is covered by the next render
+            self._stop_event.wait(self.min_interval)
+
+    def close(self) -> None:
+        self._stop_event.set()
+        self._dirty.set()
+        super().close()
+
+
+def benchmark_notebook_viewer(n: int = 100_000) -> None:
+    """Records per second through the viewer, vs. the stdout StreamHandler it replaces, and the cost of one page render."""
+    import io
+
+    from src.helper.caller import get_console
+
+    console = get_console()
+    levels = (logging.DEBUG, logging.INFO, logging.INFO, logging.WARNING, logging.ERROR)
+    records = [logging.LogRecord(f"app.module{i % 7}", levels[i % 5], __file__, i, "step %d done", (i,), None) for i in range(n)]
+    stream_handler = logging.StreamHandler(io.StringIO())
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s: %(filename)s: %(funcName)s: L%(lineno)d: %(levelname)s: %(message)s"))
+    viewer = NotebookLogHandler()
+    for label, handler in (("stdout stream", stream_handler), ("notebook viewer", viewer)):
+        start = time.perf_counter()
+        for record in records:
+            handler.handle(record)
+        elapsed = time.perf_counter() - start
+        console.log(f"[ INFO ] {label:<16} {n:,} records in {elapsed:.2f} s -> {n / elapsed:,.0f} records/s")
+
+    for label, level, logger in (("last page", None, None), ("WARNING+ of app.module3", "WARNING", "app.module3")):
+        viewer.filter_view(level, logger)
+        start = time.perf_counter()
+        page = viewer.render_html()
+        console.log(f"[ INFO ] render {label:<24} {(time.perf_counter() - start) * 1000:.1f} ms, {len(page):,} chars of HTML")
+    viewer.close()
+
+
+if __name__ == "__main__":
+    benchmark_notebook_viewer()
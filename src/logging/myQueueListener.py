@@ -0,0 +1,85 @@
+import logging
+import logging.handlers
+
+from src.logging.myDurableFileHandler import DURABLE_COMMIT_ATTR
+from src.logging.mySharedFormatter import prepare_record, share_formatters
+
+
+class FormatOnceQueueListener(logging.handlers.QueueListener):
+    """
+    QueueListener that formats each record once per distinct formatter.
+    The stock listener hands the record to every handler, and every handler
+    formats it again even when several of them share the same formatter. This
+    listener wraps the handler formatters in `SharedFormatter` proxies and
+    gives each dequeued record a fresh cache, so the formatted string (and
+    the merged message) is computed once and reused by the other handlers.
+    """
+
+    def __init__(self, queue, *handlers, respect_handler_level=False):
+        super().__init__(queue, *share_formatters(handlers), respect_handler_level=respect_handler_level)
+
+    def handle(self, record: logging.LogRecord) -> None:
+        record = self.prepare(record)
+        # A copy made by `QueueHandler.prepare` may still point at the cache
+        # of the original record, always start from an empty one.
+        try:
+            prepare_record(record)
+            for handler in self.handlers:
+                if not self.respect_handler_level:
+                    process = True
+                else:
+                    process = record.levelno >= handler.level
+                if process:
+                    handler.handle(record)
+        finally:
+            # Dispatched (or failed): a producer waiting in DurableQueueHandler now only waits for the group commits
+            commit = getattr(record, DURABLE_COMMIT_ATTR, None)
+            if commit is not None:
+                commit.release()
+
+
+class _HandlerSwap:
+    """Control item put on the queue to replace the listener handlers in order."""
+
+    def __init__(self, handlers: dict[str, logging.Handler]):
+        self.handlers = handlers
+
+
+class HotReloadQueueListener(FormatOnceQueueListener):
+    """
+    FormatOnceQueueListener whose handlers can be replaced while it runs.
+    `swap_handlers()` does not touch the running handlers itself: it puts a
+    swap marker on the same queue the producers write to. Every record queued
+    before the marker is handled by the old handlers and every record queued
+    after it by the new ones, so nothing is lost or written twice, and the
+    producers never wait on a lock. The old handlers are flushed and closed
+    on the listener thread, right after the swap.
+    """
+
+    def swap_handlers(self, handlers: dict[str, logging.Handler]) -> None:
+        """
+        Schedule the replacement of the listener handlers.
+        Args:
+            handlers (dict[str, Handler]): The new, unnamed handlers keyed by
+                their configuration name. Names are only registered once the
+                old handlers are closed, so `logging._handlers` stays valid.
+        """
+        share_formatters(handlers.values())
+        self.queue.put_nowait(_HandlerSwap(handlers))
+
+    def handle(self, record) -> None:
+        if isinstance(record, _HandlerSwap):
+            self._apply_swap(record.handlers)
+            return
+        super().handle(record)
+
+    def _apply_swap(self, handlers: dict[str, logging.Handler]) -> None:
+        old_handlers = self.handlers
+        self.handlers = tuple(handlers.values())
+        for handler in old_handlers:
+            if handler in self.handlers:
+                continue  # Carried over (e.g. the tail handler), keep it open
+            handler.flush()
+            handler.close()
+        for name, handler in handlers.items():
+            handler.name = name
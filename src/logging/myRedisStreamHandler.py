@@ -0,0 +1,315 @@
+import functools
+import logging
+import socketserver
+import threading
+import time
+from collections import deque
+
+
+def _import_redis():
+    """redis-py is an optional dependency (see the README), only imported when a Redis sink is configured."""
+    try:
+        import redis
+    except ImportError as error:
+        raise ImportError("RedisStreamHandler needs redis-py, which is not part of the locked environment: pipenv run pip install redis==5.0.8") from error
+    return redis
+
+
+@functools.cache
+def get_client(url: str, pool_size: int = 4, timeout: float = 0.5):
+    """
+    Redis client on a connection pool, one per (url, pool size, timeout).
+    Handlers rebuilt by a hot reload get the same client, and so the same
+    open connections.
+    """
+    redis = _import_redis()
+    pool = redis.ConnectionPool.from_url(url, max_connections=pool_size, socket_timeout=timeout, socket_connect_timeout=timeout)
+    return redis.Redis(connection_pool=pool)
+
+
+class RedisStreamHandler(logging.Handler):
+    """
+    Append formatted records to a Redis Stream with `XADD`.
+    Args:
+        stream (str): Stream key.
+        url (str): Redis URL, e.g. `redis://localhost:6379/0`.
+        maxlen (int): Approximate stream length kept (`MAXLEN ~`), Redis
+            trims whole nodes so the trimming itself stays cheap.
+        batch_size (int): Records per pipeline (one round trip).
+        flush_interval (float): Seconds after which a partial batch is sent.
+        timeout (float): Socket timeout of the pooled connections, bounds how
+            long a slow Redis can hold the calling thread.
+        max_backoff (float): Upper bound of the retry delay after a failure.
+        max_buffered (int): Records kept while Redis is unavailable, the
+            oldest ones are dropped (and counted in `dropped`) beyond that.
+        client: A ready client with `pipeline()`, instead of `url`.
+    Each entry has two fields: `level` (for cheap consumer side filtering)
+    and `record`, the output of the handler's formatter (`MyJSONFormatter`).
+    Batches are flushed from the thread calling `emit()`, the QueueListener
+    thread in L06. When Redis fails or times out the handler backs off
+    exponentially and only buffers in memory until the next attempt, so the
+    listener pays at most one `timeout` per backoff period. Delivery is at
+    least once: a pipeline that failed halfway is sent again.
+    Usage in a `dictConfig` handlers section:
+        "redis": {
+          "()": "src.logging.myRedisStreamHandler.RedisStreamHandler",
+          "formatter": "json",
+          "stream": "logs:project",
+          "url": "redis://localhost:6379/0"
+        }
+    """
+
+    def __init__(
+        self,
+        stream: str = "logs",
+        url: str = "redis://localhost:6379/0",
+        maxlen: int = 100_000,
+        batch_size: int = 200,
+        flush_interval: float = 1.0,
+        pool_size: int = 4,
+        timeout: float = 0.5,
+        max_backoff: float = 30.0,
+        max_buffered: int = 10_000,
+        client=None,
+        level=logging.NOTSET,
+    ):
+        super().__init__(level)
+        redis = _import_redis()
+
+        self.stream = stream
+        self.maxlen = maxlen
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_backoff = max_backoff
+        self.client = client if client is not None else get_client(url, pool_size, timeout)
+        self.sent = 0
+        self.dropped = 0
+        self._errors = (redis.RedisError, OSError)
+        self._buffer = deque(maxlen=max_buffered)
+        self._last_flush = time.monotonic()
+        self._backoff = 0.0
+        self._next_attempt = 0.0
+        self._stop_event = threading.Event()
+        # Sends the tail of a batch when the pipeline goes quiet, under load emit() flushes first
+        self._timer = threading.Thread(target=self._flush_periodically, name="RedisStreamHandler", daemon=True)
+        self._timer.start()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            payload = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+        if len(self._buffer) == self._buffer.maxlen:
+            self.dropped += 1
+        self._buffer.append((record.levelname, payload))
+        if len(self._buffer) >= self.batch_size or time.monotonic() - self._last_flush >= self.flush_interval:
+            self._flush_buffer()
+
+    def _flush_buffer(self) -> None:
+        now = time.monotonic()
+        self._last_flush = now
+        if not self._buffer or now < self._next_attempt:
+            return
+        buffer = self._buffer
+        while buffer:
+            batch = [buffer[i] for i in range(min(self.batch_size, len(buffer)))]
+            pipeline = self.client.pipeline(transaction=False)
+            for levelname, payload in batch:
+                pipeline.xadd(self.stream, {"level": levelname, "record": payload}, maxlen=self.maxlen, approximate=True)
+            try:
+                pipeline.execute()
+            except self._errors:
+                self._backoff = min(max(self._backoff * 2, 0.1), self.max_backoff)
+                self._next_attempt = time.monotonic() + self._backoff
+                return
+            finally:
+                pipeline.reset()
+            for _ in batch:
+                buffer.popleft()
+            self.sent += len(batch)
+            self._backoff = 0.0
+
+    def flush(self) -> None:
+        with self.lock:
+            self._flush_buffer()
+
+    def _flush_periodically(self) -> None:
+        while not self._stop_event.wait(self.flush_interval):
+            if self._buffer and time.monotonic() - self._last_flush >= self.flush_interval:
+                self.flush()
+
+    def close(self) -> None:
+        self._stop_event.set()
+        self.flush()
+        super().close()
+
+
+# ---------------------------------------------------------------------- #
+# Local stand-in server (a tiny RESP2 subset), for tests and benchmarks
+# ---------------------------------------------------------------------- #
+def _encode(value) -> bytes:
+    if value is None:
+        return b"$-1\r\n"
+    if isinstance(value, int):
+        return b":%d\r\n" % value
+    if isinstance(value, bytes):
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+    if isinstance(value, str):
+        return b"+" + value.encode() + b"\r\n"
+    if isinstance(value, Exception):
+        return b"-ERR " + str(value).encode() + b"\r\n"
+    return b"*%d\r\n" % len(value) + b"".join(map(_encode, value))
+
+
+class _RedisRequestHandler(socketserver.BaseRequestHandler):
+    def handle(self) -> None:
+        server = self.server.stand_in
+        data = b""
+        while chunk := self.request.recv(1 << 16):
+            data += chunk
+            replies = []
+            # Answer every complete command of the chunk with one send, like Redis does for a pipeline
+            while (parsed := self._parse(data)) is not None:
+                args, data = parsed
+                if server.delay:
+                    time.sleep(server.delay)
+                try:
+                    replies.append(_encode(server.execute(args)))
+                except Exception as error:
+                    replies.append(_encode(error))
+            if replies:
+                self.request.sendall(b"".join(replies))
+
+    @staticmethod
+    def _parse(data: bytes):
+        """One `*N` array of bulk strings from the front of `data`, None when incomplete."""
+        end = data.find(b"\r\n")
+        if end < 0:
+            return None
+        args, position = [], end + 2
+        for _ in range(int(data[1:end])):
+            end = data.find(b"\r\n", position)
+            if end < 0:
+                return None
+            length = int(data[position + 1 : end])
+            start, position = end + 2, end + 2 + length + 2
+            if position > len(data):
+                return None
+            args.append(data[start : start + length])
+        return args, data[position:]
+
+
+class LocalRedisServer:
+    """
+    Minimal in-process Redis stand-in speaking RESP2 over TCP, enough for
+    redis-py and the stream sink: PING, CLIENT/SELECT (accepted), XADD with
+    MAXLEN, XLEN, XRANGE, DEL. `delay` adds latency to every command, to
+    simulate a slow server.
+    Usage:
+        with LocalRedisServer() as server:
+            handler = RedisStreamHandler(url=server.url)
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, delay: float = 0.0):
+        self.host = host
+        self.port = port
+        self.delay = delay
+        self.streams = {}
+        self._lock = threading.Lock()
+        self._last_id = (0, 0)
+        self._server = None
+
+    @property
+    def url(self) -> str:
+        return f"redis://{self.host}:{self.port}/0"
+
+    def start(self) -> "LocalRedisServer":
+        socketserver.ThreadingTCPServer.allow_reuse_address = True
+        self._server = socketserver.ThreadingTCPServer((self.host, self.port), _RedisRequestHandler)
+        self._server.daemon_threads = True
+        self._server.stand_in = self
+        self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, name="LocalRedisServer", daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def execute(self, args: list[bytes]):
+        command = args[0].upper()
+        with self._lock:
+            if command == b"PING":
+                return "PONG"
+            if command in (b"CLIENT", b"SELECT"):
+                return "OK"
+            if command == b"XADD":
+                return self._xadd(args[1], args[2:])
+            if command == b"XLEN":
+                return len(self.streams.get(args[1], ()))
+            if command == b"XRANGE":
+                entries = self.streams.get(args[1], [])
+                count = int(args[5]) if len(args) > 5 and args[4].upper() == b"COUNT" else len(entries)
+                return [[entry_id, [item for pair in fields.items() for item in pair]] for entry_id, fields in entries[:count]]
+            if command == b"DEL":
+                return sum(self.streams.pop(key, None) is not None for key in args[1:])
+        raise ValueError(f"unknown command '{command.decode()}'")
+
+    def _xadd(self, key: bytes, args: list[bytes]):
+        maxlen, approximate = None, False
+        if args[0].upper() == b"MAXLEN":
+            approximate = args[1] == b"~"
+            offset = 2 if args[1] in (b"~", b"=") else 1
+            maxlen = int(args[offset])
+            args = args[offset + 1 :]
+        entry_id, args = args[0], args[1:]
+        if entry_id == b"*":
+            ms, seq = int(time.time() * 1000), 0
+            if ms <= self._last_id[0]:
+                ms, seq = self._last_id[0], self._last_id[1] + 1
+            self._last_id = (ms, seq)
+            entry_id = b"%d-%d" % (ms, seq)
+        entries = self.streams.setdefault(key, [])
+        entries.append((entry_id, dict(zip(args[::2], args[1::2]))))
+        # `~` trims by whole nodes in Redis, emulate it by trimming in steps of 100 entries
+        if maxlen is not None and len(entries) > maxlen + (100 if approximate else 0):
+            del entries[: len(entries) - maxlen]
+        return entry_id
+
+
+def benchmark_redis_stream(n: int = 100_000) -> None:
+    """
+    Records per second into a stream on the local stand-in, one XADD per
+    round trip vs. pipelined batches. The slow server answers after 0.5 s,
+    past the 0.2 s timeout: the emitting thread keeps its pace and the
+    records wait in the bounded buffer (`buffered`) instead.
+    """
+    from src.helper.caller import get_console
+    from src.logging.myCustomJsonClass01 import MyJSONFormatter
+
+    console = get_console()
+    formatter = MyJSONFormatter(fmt_keys={"level": "levelname", "message": "message", "timestamp": "timestamp", "logger": "name"})
+    records = [logging.LogRecord("benchmark", logging.INFO, __file__, 1, "request %d served", (i,), None) for i in range(n)]
+    for label, batch_size, delay, count in (("unbatched", 1, 0.0, n // 10), ("pipelined x200", 200, 0.0, n), ("slow server", 200, 0.5, n // 10)):
+        with LocalRedisServer(delay=delay) as server:
+            handler = RedisStreamHandler("logs", server.url, batch_size=batch_size, timeout=0.2, max_backoff=1.0)
+            handler.setFormatter(formatter)
+            start = time.perf_counter()
+            for record in records[:count]:
+                handler.handle(record)
+            handler.flush()
+            elapsed = time.perf_counter() - start
+            handler.close()
+            stored = len(server.streams.get(b"logs", ()))
+            console.log(f"[ INFO ] {label:<15} {count:,} records in {elapsed:.2f} s -> {count / elapsed:,.0f} records/s, sent {handler.sent:,}, stored {stored:,}, buffered {len(handler._buffer):,}, dropped {handler.dropped:,}")
+
+
+if __name__ == "__main__":
+    benchmark_redis_stream()
@@ -0,0 +1,141 @@
+import logging
+import logging.handlers
+import time
+from collections import deque
+
+
+class DebugOnErrorHandler(logging.handlers.MemoryHandler):
+    """
+    Keep the recent DEBUG/INFO context in memory, write it only when an error follows.
+    Args:
+        capacity (int): Records kept per context, the oldest ones fall out of the ring.
+        flushLevel (int | str): Level from which a record flushes the ring of
+            its context before being written. A record carrying an exception
+            (`logger.exception()`, `exc_info=True`) flushes at any level.
+        target (Handler): Handler writing the records (`file_json` in L06).
+        passLevel (int | str): Records from this level on go straight to the
+            target; the ones below only enter the ring.
+        context (str | None): Record attribute naming the context (an extra
+            such as `request_id`), records without it fall back to their
+            thread. None keeps one ring per thread.
+        max_contexts (int): Rings kept at most, the least recently used
+            context is forgotten beyond that (e.g. threads that are gone).
+        close_target (bool): Close the target with this handler, when the
+            target is not registered anywhere else.
+    Buffered records are kept as they are, unformatted: in normal operation
+    nothing below `passLevel` is formatted nor written, the target only sees
+    warnings. When an error arrives the ring of its context is formatted by
+    the target (`MyJSONFormatter`) in order, with the original timestamps,
+    followed by the error itself, then the ring starts empty again.
+    Usage in a `dictConfig` handlers section (`class`, so that `target` is
+    resolved by name like for the stock MemoryHandler):
+        "debug_on_error": {
+          "class": "src.logging.myRingBufferHandler.DebugOnErrorHandler",
+          "capacity": 200,
+          "target": "file_json"
+        }
+    """
+
+    def __init__(
+        self,
+        capacity: int = 200,
+        flushLevel=logging.ERROR,
+        target: logging.Handler | None = None,
+        flushOnClose: bool = False,
+        passLevel=logging.WARNING,
+        context: str | None = None,
+        max_contexts: int = 1024,
+        close_target: bool = False,
+    ):
+        super().__init__(capacity, logging._checkLevel(flushLevel), target, flushOnClose)
+        self.passLevel = logging._checkLevel(passLevel)
+        self.context = context
+        self.max_contexts = max_contexts
+        self.close_target = close_target
+        self.flushed = 0  # Buffered records written because an error followed them
+        self._rings = {}
+
+    def _context_of(self, record: logging.LogRecord):
+        if self.context is None:
+            return record.thread
+        return getattr(record, self.context, record.thread)
+
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= self.flushLevel or record.exc_info is not None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        key = self._context_of(record)
+        if record.levelno < self.passLevel and record.exc_info is None:
+            ring = self._rings.pop(key, None)
+            if ring is None:
+                if len(self._rings) >= self.max_contexts:
+                    del self._rings[next(iter(self._rings))]
+                ring = deque(maxlen=self.capacity)
+            # Re-inserted at the end: the first context is always the least recently used one
+            self._rings[key] = ring
+            ring.append(record)
+            return
+        target = self.target
+        if target is None:
+            return
+        if self.shouldFlush(record):
+            ring = self._rings.pop(key, None)
+            if ring:
+                self.flushed += len(ring)
+                for buffered in ring:
+                    target.handle(buffered)
+        target.handle(record)
+
+    def flush(self) -> None:
+        """Flush the target only, the rings are written when an error asks for them."""
+        with self.lock:
+            if self.target is not None:
+                self.target.flush()
+
+    def close(self) -> None:
+        with self.lock:
+            self._rings.clear()
+            if self.close_target and self.target is not None:
+                self.target.close()
+        super().close()
+
+
+def benchmark_debug_on_error(n: int = 100_000, error_every: int = 1000) -> None:
+    """
+    Records per second and lines written for a DEBUG heavy workload (one
+    ERROR every `error_every` records), the JSON file handler alone vs.
+    behind `DebugOnErrorHandler`.
+    """
+    import os
+    import tempfile
+
+    from src.helper.caller import get_console
+    from src.logging.myCustomJsonClass01 import MyJSONFormatter
+
+    console = get_console()
+    formatter = MyJSONFormatter(fmt_keys={"level": "levelname", "message": "message", "timestamp": "timestamp", "logger": "name"})
+    levels = (logging.DEBUG, logging.DEBUG, logging.DEBUG, logging.INFO)
+    records = [
+        logging.LogRecord("benchmark", logging.ERROR if i % error_every == error_every - 1 else levels[i % 4], __file__, i, "step %d done", (i,), None)
+        for i in range(n)
+    ]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for label in ("file_json", "debug_on_error"):
+            path = os.path.join(tmp_dir, f"{label}.jsonl")
+            handler = file_handler = logging.FileHandler(path)
+            file_handler.setFormatter(formatter)
+            if label == "debug_on_error":
+                handler = DebugOnErrorHandler(100, target=file_handler, close_target=True)
+            start = time.perf_counter()
+            for record in records:
+                handler.handle(record)
+            handler.flush()
+            elapsed = time.perf_counter() - start
+            handler.close()
+            with open(path, "rb") as f_in:
+                lines = sum(1 for _ in f_in)
+            console.log(f"[ INFO ] {label:<15} {n:,} records in {elapsed:.2f} s -> {n / elapsed:,.0f} records/s, {lines:,} lines written")
+
+
+if __name__ == "__main__":
+    benchmark_debug_on_error()
@@ -0,0 +1,218 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+
+from src.logging.mySharedFormatter import SharedFormatter
+
+# Same columns as the `json` formatter of config06.json
+DEFAULT_FMT_KEYS = {
+    "level": "levelname",
+    "message": "message",
+    "timestamp": "timestamp",
+    "logger": "name",
+    "module": "module",
+    "function": "funcName",
+    "line": "lineno",
+    "thread_name": "threadName",
+}
+DEFAULT_INDEXED = ("level", "timestamp", "logger")
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+class SQLiteHandler(logging.Handler):
+    """
+    Write records to a SQLite table, one column per `fmt_keys` entry.
+    Args:
+        database (str): Path of the database file.
+        table (str): Table name, created if missing.
+        batch_size (int): Rows inserted per transaction.
+        flush_interval (float): Seconds after which pending rows are
+            committed even if the batch is not full.
+        indexed (Iterable[str]): Columns with a secondary index.
+        max_buffered (int): Rows kept while the inserts fail (locked
+            database, disk full), retried every `flush_interval`; records
+            arriving beyond that are dropped and counted in `dropped`.
+        timeout (float): Seconds an insert waits for a lock held by another connection.
+    The row is built by the handler's `MyJSONFormatter` (`_prepare_log_dict`),
+    so the columns are its `fmt_keys` (`level`, `timestamp`, `logger`, ...),
+    plus `exc_info`/`stack_info` and an `extras` column holding the other
+    fields as JSON. Without a formatter the keys of config06.json are used.
+    Rows are buffered and inserted with `executemany` in one transaction per
+    batch, on the thread calling `emit()` (the QueueListener thread in L06);
+    the database is in WAL mode, so incident queries run while it writes:
+        SELECT timestamp, message FROM logs
+        WHERE level = 'ERROR' AND timestamp >= '2024-10-01' ORDER BY timestamp;
+        SELECT logger, COUNT(*) FROM logs WHERE json_extract(extras, '$.user_id') = 42 GROUP BY logger;
+    Usage in a `dictConfig` handlers section:
+        "sqlite": {
+          "()": "src.logging.mySQLiteHandler.SQLiteHandler",
+          "formatter": "json",
+          "database": "src/logging/project_logs.db"
+        }
+    """
+
+    def __init__(
+        self,
+        database: str,
+        table: str = "logs",
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        indexed=DEFAULT_INDEXED,
+        max_buffered: int = 50_000,
+        timeout: float = 5.0,
+        level=logging.NOTSET,
+    ):
+        super().__init__(level)
+        self.database = database
+        self.table = table
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.indexed = tuple(indexed)
+        self.max_buffered = max_buffered
+        self.timeout = timeout
+        self.dropped = 0
+        self._connection = None
+        self._columns = None
+        self._insert_sql = None
+        self._rows = []
+        self._fallback_formatter = None
+        self._last_commit = time.monotonic()
+        self._retry_at = 0.0  # After a failed insert, no new attempt before then
+        self._stop_event = threading.Event()
+        # Commits the tail of a batch when the pipeline goes quiet, under load emit() commits first
+        self._timer = threading.Thread(target=self._flush_periodically, name="SQLiteHandler", daemon=True)
+        self._timer.start()
+
+    def _json_formatter(self):
+        formatter = self.formatter
+        if isinstance(formatter, SharedFormatter):
+            formatter = formatter.formatter
+        return formatter if hasattr(formatter, "_prepare_log_dict") else None
+
+    def _open(self) -> None:
+        formatter = self._json_formatter()
+        fmt_keys = formatter.fmt_keys if formatter is not None else DEFAULT_FMT_KEYS
+        self._columns = [key for key in fmt_keys if key not in ("exc_info", "stack_info")] + ["exc_info", "stack_info"]
+        columns = ", ".join(f"{_quote(column)} {'INTEGER' if fmt_keys.get(column) in ('lineno', 'levelno', 'process', 'thread') else 'TEXT'}" for column in self._columns)
+        self._connection = sqlite3.connect(self.database, timeout=self.timeout, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(f"CREATE TABLE IF NOT EXISTS {_quote(self.table)} (id INTEGER PRIMARY KEY, {columns}, extras TEXT)")
+        for column in self.indexed:
+            if column in self._columns:
+                self._connection.execute(f"CREATE INDEX IF NOT EXISTS {_quote(f'ix_{self.table}_{column}')} ON {_quote(self.table)} ({_quote(column)})")
+        placeholders = ", ".join("?" * (len(self._columns) + 1))
+        self._insert_sql = f"INSERT INTO {_quote(self.table)} ({', '.join(map(_quote, self._columns))}, extras) VALUES ({placeholders})"
+
+    def _row(self, record: logging.LogRecord) -> tuple:
+        formatter = self._json_formatter()
+        if formatter is None:
+            formatter = self._fallback_formatter = self._fallback_formatter or _default_json_formatter()
+        fields = formatter._prepare_log_dict(record)
+        row = []
+        for column in self._columns:
+            value = fields.pop(column, None)
+            row.append(value if value is None or isinstance(value, (str, int, float)) else str(value))
+        row.append(json.dumps(fields, default=str) if fields else None)
+        return tuple(row)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self._connection is None:
+                self._open()
+            if len(self._rows) < self.max_buffered:
+                self._rows.append(self._row(record))
+            else:
+                self.dropped += 1  # The inserts keep failing, the rows already buffered go first
+            now = time.monotonic()
+            if (len(self._rows) >= self.batch_size or now - self._last_commit >= self.flush_interval) and now >= self._retry_at:
+                self._commit()
+        except Exception:
+            self.handleError(record)
+
+    def _commit(self) -> None:
+        """Insert the buffered rows in one transaction, they stay buffered until it commits."""
+        self._last_commit = time.monotonic()
+        if not self._rows:
+            return
+        try:
+            self._connection.execute("BEGIN")
+            self._connection.executemany(self._insert_sql, self._rows)
+            self._connection.execute("COMMIT")
+        except Exception:
+            self._retry_at = self._last_commit + self.flush_interval
+            if self._connection.in_transaction:
+                self._connection.execute("ROLLBACK")
+            raise
+        self._rows = []
+
+    def flush(self) -> None:
+        with self.lock:
+            if self._connection is not None:
+                self._commit()
+
+    def _flush_periodically(self) -> None:
+        while not self._stop_event.wait(self.flush_interval):
+            if self._rows and time.monotonic() - self._last_commit >= self.flush_interval:
+                try:
+                    self.flush()
+                except Exception:
+                    pass  # The next emit() reports it through handleError
+
+    def close(self) -> None:
+        self._stop_event.set()
+        with self.lock:
+            if self._connection is not None:
+                try:
+                    self._commit()
+                finally:
+                    self._connection.close()
+                    self._connection = None
+        super().close()
+
+
+def _default_json_formatter():
+    from src.logging.myCustomJsonClass01 import MyJSONFormatter
+
+    return MyJSONFormatter(fmt_keys=DEFAULT_FMT_KEYS)
+
+
+def benchmark_sqlite_handler(n: int = 200_000) -> None:
+    """Records per second written by the SQLite sink vs. the JSONL file handler, same formatter and records."""
+    import os
+    import tempfile
+
+    from src.helper.caller import get_console
+
+    console = get_console()
+    records = [logging.LogRecord("benchmark", (logging.INFO, logging.WARNING)[i % 2], __file__, i, "request %d served", (i,), None) for i in range(n)]
+    for i, record in enumerate(records):
+        record.user_id = i % 100
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        handlers = {
+            "jsonl file": logging.FileHandler(os.path.join(tmp_dir, "logs.jsonl")),
+            "sqlite": SQLiteHandler(os.path.join(tmp_dir, "logs.db")),
+        }
+        for name, handler in handlers.items():
+            handler.setFormatter(_default_json_formatter())
+            start = time.perf_counter()
+            for record in records:
+                handler.handle(record)
+            handler.flush()
+            elapsed = time.perf_counter() - start
+            handler.close()
+            console.log(f"[ INFO ] {name:<10} {n:,} records in {elapsed:.2f} s -> {n / elapsed:,.0f} records/s")
+
+        with sqlite3.connect(os.path.join(tmp_dir, "logs.db")) as connection:
+            start = time.perf_counter()
+            count = connection.execute("SELECT COUNT(*) FROM logs WHERE level = 'WARNING' AND logger = 'benchmark'").fetchone()[0]
+            console.log(f"[ INFO ] indexed query: {count:,} warnings in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    benchmark_sqlite_handler()
@@ -0,0 +1,72 @@
+import logging
+
+# Name of the per-record attribute holding the formatted output of every
+# formatter that already processed the record. It is listed in
+# `LOG_RECORD_BUILTIN_ATTRS` so the JSON formatter never emits it as an extra.
+FORMAT_CACHE_ATTR = "_format_cache"
+
+
+def prepare_record(record: logging.LogRecord) -> dict:
+    """
+    Attach a fresh format cache to the record and freeze its message.
+    Args:
+        record (LogRecord): The record about to be dispatched to the handlers.
+    Returns:
+        dict: The (empty) cache that the shared formatters will fill.
+    The message is merged once with its arguments, the same way
+    `QueueHandler.prepare` does it, so every later `getMessage()` call made
+    by a formatter is a plain `str()` of an already built string.
+    """
+    record.message = record.getMessage()
+    record.msg = record.message
+    record.args = None
+    cache = {}
+    setattr(record, FORMAT_CACHE_ATTR, cache)
+    return cache
+
+
+class SharedFormatter(logging.Formatter):
+    """
+    Proxy that formats each record once per wrapped formatter instance.
+    Handlers that share the same formatter (e.g. `stdout` and `stderr` both
+    using `colored`) receive the same proxy, so the second handler reuses the
+    string produced for the first one instead of formatting again.
+    """
+
+    def __init__(self, formatter: logging.Formatter):
+        super().__init__()
+        self.formatter = formatter
+        self.datefmt = formatter.datefmt
+
+    def format(self, record: logging.LogRecord) -> str:
+        cache = getattr(record, FORMAT_CACHE_ATTR, None)
+        if cache is None:
+            cache = prepare_record(record)
+        try:
+            return cache[self]
+        except KeyError:
+            formatted = cache[self] = self.formatter.format(record)
+            return formatted
+
+
+def share_formatters(handlers) -> list[logging.Handler]:
+    """
+    Wrap the formatters of the given handlers in `SharedFormatter` proxies.
+    Args:
+        handlers (Iterable[Handler]): The handlers that receive the same records.
+    Returns:
+        list[Handler]: The handlers, now pointing at one proxy per distinct formatter.
+    Calling it twice on the same handlers is harmless: formatters that are
+    already shared are kept as they are.
+    """
+    handlers = list(handlers)
+    proxies = {id(h.formatter.formatter): h.formatter for h in handlers if isinstance(h.formatter, SharedFormatter)}
+    for handler in handlers:
+        formatter = handler.formatter
+        if formatter is None or isinstance(formatter, SharedFormatter):
+            continue
+        proxy = proxies.get(id(formatter))
+        if proxy is None:
+            proxy = proxies[id(formatter)] = SharedFormatter(formatter)
+        handler.setFormatter(proxy)
+    return handlers
@@ -0,0 +1,480 @@
+import atexit
+import gzip
+import json
+import logging
+import os
+import queue
+import random
+import select
+import socket
+import socketserver
+import threading
+import time
+import zlib
+
+_STOP = object()  # Sentinel put on the batch queue by close()
+
+
+def parse_address(address) -> tuple[int, object]:
+    """
+    Socket family and address of a collector.
+    Accepts `"host:port"`, `"tcp://host:port"`, `["host", port]` (JSON
+    configs) or `"unix:/path/to/socket"`.
+    """
+    if isinstance(address, (list, tuple)):
+        return socket.AF_INET, (address[0], int(address[1]))
+    if address.startswith("unix:"):
+        return socket.AF_UNIX, address[len("unix:") :].removeprefix("//")
+    host, _, port = address.removeprefix("tcp://").rpartition(":")
+    return socket.AF_INET, (host, int(port))
+
+
+class ConnectionPool:
+    """
+    Persistent connections to one collector, shared by every handler that
+    ships to the same address (including the handlers rebuilt by a hot
+    reload, which pick up the connections of the ones they replace).
+    At most `size` idle connections are kept; a connection the collector
+    closed is detected when it is taken from the pool and replaced.
+    """
+
+    def __init__(self, address, size: int = 2, timeout: float = 5.0):
+        self.family, self.address = parse_address(address)
+        self.size = size
+        self.timeout = timeout
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def _connect(self) -> socket.socket:
+        sock = socket.socket(self.family, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(self.timeout)
+            sock.connect(self.address)
+        except OSError:
+            sock.close()
+            raise
+        if self.family == socket.AF_INET:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return sock
+
+    def acquire(self) -> socket.socket:
+        while True:
+            with self._lock:
+                sock = self._idle.pop() if self._idle else None
+            if sock is None:
+                return self._connect()
+            # The collector never writes: a readable idle socket means EOF or a reset
+            readable, _, _ = select.select([sock], [], [], 0)
+            if not readable:
+                return sock
+            sock.close()
+
+    def release(self, sock: socket.socket, broken: bool = False) -> None:
+        with self._lock:
+            if not broken and len(self._idle) < self.size:
+                self._idle.append(sock)
+                return
+        sock.close()
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for sock in idle:
+            sock.close()
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(address, size: int = 2, timeout: float = 5.0) -> ConnectionPool:
+    key = (tuple(address) if isinstance(address, list) else address, timeout)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = ConnectionPool(address, size, timeout)
+        return pool
+
+
+@atexit.register
+def close_pools() -> None:
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+class DiskSpill:
+    """
+    Bounded append-only file holding the NDJSON lines that could not be
+    shipped. Batches that would grow it past `max_bytes` are dropped and
+    counted in `dropped`.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 64 << 20):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.dropped = 0
+        self._lock = threading.Lock()
+        try:
+            self.size = os.path.getsize(path)
+        except OSError:
+            self.size = 0
+
+    def append(self, payload: bytes, n_records: int) -> bool:
+        with self._lock:
+            if self.size + len(payload) > self.max_bytes:
+                self.dropped += n_records
+                return False
+            with open(self.path, "ab") as f_out:
+                f_out.write(payload)
+            self.size += len(payload)
+            return True
+
+    def read(self) -> bytes:
+        with self._lock:
+            if not self.size:
+                return b""
+            with open(self.path, "rb") as f_in:
+                return f_in.read()
+
+    def discard(self, n_bytes: int) -> None:
+        """Remove the first `n_bytes` (already shipped), keeping what was appended since `read()`."""
+        with self._lock:
+            with open(self.path, "rb") as f_in:
+                f_in.seek(n_bytes)
+                rest = f_in.read()
+            with open(self.path, "wb") as f_out:
+                f_out.write(rest)
+            self.size = len(rest)
+
+
+class ShippingHandler(logging.Handler):
+    """
+    Ship formatted records as newline-delimited JSON to a log collector.
+    Args:
+        address (str | list): `"host:port"`, `["host", port]` or `"unix:/path"`.
+        batch_size (int): Records per batch, a batch is one `sendall`.
+        flush_interval (float): Seconds after which a partial batch is sent.
+        compression (str | None): `"gzip"` compresses each batch into one
+            gzip member; concatenated members are a valid gzip stream, so
+            the collector just gunzips the connection.
+        spill_path (str | None): File receiving the batches that cannot be
+            shipped while the collector is down, replayed on reconnect.
+        spill_max_bytes (int): Size bound of the spill file.
+        pool_size (int): Idle connections kept for the address.
+        max_backoff (float): Upper bound of the reconnect delay, which
+            doubles (with jitter) from 0.1 s after each failed attempt.
+        max_pending (int): Batches waiting for the sender thread. When they
+            are all taken, the current batch keeps growing until one is
+            shipped; past `max_pending * batch_size` records, new records
+            are dropped (counted in `dropped`) instead of blocking the caller.
+    `emit()` only formats the record and appends it to the current batch,
+    a sender thread does the network I/O, so a slow or absent collector never
+    blocks the QueueListener. Only the sender thread spills, so records
+    reach the collector (or the spill file) in the order they were logged.
+    The sender never takes the handler lock, which `logging.shutdown()` holds
+    while it flushes. Delivery is at least once: a spilled batch replayed
+    after a partial send may be received twice.
+    Usage in a `dictConfig` handlers section:
+        "ship": {
+          "()": "src.logging.myShippingHandler.ShippingHandler",
+          "formatter": "json",
+          "address": "127.0.0.1:5170",
+          "compression": "gzip",
+          "spill_path": "src/logging/ship_spill.jsonl"
+        }
+    """
+
+    def __init__(
+        self,
+        address,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        compression: str | None = None,
+        spill_path: str | None = None,
+        spill_max_bytes: int = 64 << 20,
+        pool_size: int = 2,
+        timeout: float = 5.0,
+        max_backoff: float = 30.0,
+        max_pending: int = 64,
+        level=logging.NOTSET,
+    ):
+        super().__init__(level)
+        if compression not in (None, "gzip"):
+            raise ValueError(f"Unsupported compression: {compression!r}")
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.compression = compression
+        self.max_backoff = max_backoff
+        self.pool = get_pool(address, pool_size, timeout)
+        self.spill = DiskSpill(spill_path, spill_max_bytes) if spill_path else None
+        self.shipped = 0
+        self.dropped = 0
+        self.max_held = max_pending * batch_size
+        self._batch = []
+        # Guards `_batch` and `dropped`, shared by the producers and the sender thread
+        self._batch_lock = threading.Lock()
+        self._pending = queue.Queue(max_pending)
+        self._backoff = 0.0
+        self._next_attempt = 0.0
+        self._sender = threading.Thread(target=self._run, name="ShippingHandler", daemon=True)
+        self._sender.start()
+
+    # ------------------------------------------------------------------ #
+    # Producer side, called with the handler lock held
+    # ------------------------------------------------------------------ #
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            line = self.format(record).encode("utf-8") + b"\n"
+        except Exception:
+            self.handleError(record)
+            return
+        with self._batch_lock:
+            if len(self._batch) >= self.max_held:
+                self.dropped += 1
+                return
+            self._batch.append(line)
+            if len(self._batch) >= self.batch_size:
+                try:
+                    self._pending.put_nowait(self._batch)
+                except queue.Full:
+                    return  # Kept in order in the current batch, handed over at a later emit or timer tick
+                self._batch = []
+
+    def flush(self) -> None:
+        """Hand the current batch to the sender and wait until everything queued is shipped (or spilled)."""
+        with self._batch_lock:
+            batch, self._batch = self._batch, []
+        if batch:
+            self._pending.put(batch)
+        # The sender never takes the handler lock, waiting here is safe under logging.shutdown()
+        self._pending.join()
+
+    def close(self) -> None:
+        try:
+            if self._sender.is_alive():
+                self.flush()
+                self._pending.put(_STOP)
+                self._sender.join(self.pool.timeout + 1)
+        finally:
+            super().close()
+
+    # ------------------------------------------------------------------ #
+    # Sender thread
+    # ------------------------------------------------------------------ #
+    def _run(self) -> None:
+        while True:
+            try:
+                batch = self._pending.get(timeout=self.flush_interval)
+            except queue.Empty:
+                # Timer tick: ship the partial batch, retry the spill file
+                with self._batch_lock:
+                    batch, self._batch = self._batch, []
+                if batch:
+                    self._ship(batch)
+                elif self.spill is not None and self.spill.size:
+                    self._replay_spill()
+                continue
+            try:
+                if batch is _STOP:
+                    return
+                self._ship(batch)
+            finally:
+                self._pending.task_done()
+
+    def _ship(self, batch: list[bytes]) -> None:
+        payload = b"".join(batch)
+        if self.spill is not None and self.spill.size and not self._replay_spill():
+            # Keep the order: nothing bypasses records already waiting on disk
+            self._spill_or_drop(payload, len(batch))
+            return
+        if self._send(payload):
+            self.shipped += len(batch)
+        else:
+            self._spill_or_drop(payload, len(batch))
+
+    def _send(self, payload: bytes) -> bool:
+        """Send one payload, False when the collector is unreachable (the backoff is updated)."""
+        if time.monotonic() < self._next_attempt:
+            return False
+        data = gzip.compress(payload, compresslevel=6, mtime=0) if self.compression == "gzip" else payload
+        try:
+            sock = self.pool.acquire()
+        except OSError:
+            self._failed()
+            return False
+        try:
+            sock.sendall(data)
+        except OSError:
+            self.pool.release(sock, broken=True)
+            self._failed()
+            return False
+        self.pool.release(sock)
+        self._backoff = 0.0
+        return True
+
+    def _failed(self) -> None:
+        self._backoff = min(max(self._backoff * 2, 0.1), self.max_backoff)
+        self._next_attempt = time.monotonic() + self._backoff * random.uniform(0.5, 1.0)
+
+    def _replay_spill(self, chunk_size: int = 1 << 20) -> bool:
+        """Ship the spill file in chunks cut on line boundaries, True once it is empty."""
+        data = self.spill.read()
+        sent = 0
+        while sent < len(data):
+            cut = data.rfind(b"\n", sent, sent + chunk_size) + 1 or len(data)
+            if not self._send(data[sent:cut]):
+                if sent:
+                    self.spill.discard(sent)
+                return False
+            self.shipped += data.count(b"\n", sent, cut)
+            sent = cut
+        self.spill.discard(sent)
+        return not self.spill.size
+
+    def _spill_or_drop(self, payload: bytes, n_records: int) -> None:
+        if self.spill is None or not self.spill.append(payload, n_records):
+            with self._batch_lock:
+                self.dropped += n_records
+
+
+# ---------------------------------------------------------------------- #
+# Local stand-in collector, for tests and benchmarks
+# ---------------------------------------------------------------------- #
+class _CollectorRequestHandler(socketserver.BaseRequestHandler):
+    def setup(self) -> None:
+        with self.server.collector._condition:
+            self.server.collector._connections.add(self.request)
+
+    def finish(self) -> None:
+        with self.server.collector._condition:
+            self.server.collector._connections.discard(self.request)
+
+    def handle(self) -> None:
+        collector = self.server.collector
+        gzipped = collector.compression == "gzip"
+        decompressor = zlib.decompressobj(wbits=31)
+        tail = b""
+        while data := self.request.recv(1 << 16):
+            if gzipped:
+                # Each batch is a gzip member, start a new decompressor at every member boundary
+                out = []
+                while data:
+                    out.append(decompressor.decompress(data))
+                    if not decompressor.eof:
+                        break
+                    data = decompressor.unused_data
+                    decompressor = zlib.decompressobj(wbits=31)
+                data = b"".join(out)
+            lines = (tail + data).split(b"\n")
+            tail = lines.pop()
+            if lines:
+                collector._receive(lines)
+
+
+class LocalCollector:
+    """
+    Minimal NDJSON collector (TCP or Unix socket) counting what it receives.
+    Usage:
+        with LocalCollector("127.0.0.1:0") as collector:
+            handler = ShippingHandler(collector.address)
+            ...
+            collector.wait_for(1000)
+    Args:
+        keep (bool): Keep the decoded records in `records`, otherwise only count them.
+    """
+
+    def __init__(self, address="127.0.0.1:0", compression: str | None = None, keep: bool = True):
+        self.family, self._bind_address = parse_address(address)
+        self.compression = compression
+        self.keep = keep
+        self.count = 0
+        self.records = []
+        self._condition = threading.Condition()
+        self._connections = set()
+        self._server = None
+        self._thread = None
+
+    @property
+    def address(self) -> str:
+        if self.family == socket.AF_UNIX:
+            return f"unix:{self._server.server_address}"
+        host, port = self._server.server_address[:2]
+        return f"{host}:{port}"
+
+    def start(self) -> "LocalCollector":
+        server_class = socketserver.ThreadingUnixStreamServer if self.family == socket.AF_UNIX else socketserver.ThreadingTCPServer
+        server_class.allow_reuse_address = True
+        server_class.daemon_threads = True
+        self._server = server_class(self._bind_address, _CollectorRequestHandler)
+        self._server.collector = self
+        self._thread = threading.Thread(target=self._server.serve_forever, name="LocalCollector", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        # Like a real collector going away: the clients see their connections closed
+        with self._condition:
+            connections = list(self._connections)
+        for connection in connections:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        if self.family == socket.AF_UNIX:
+            try:
+                os.unlink(self._bind_address)
+            except FileNotFoundError:
+                pass
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _receive(self, lines: list[bytes]) -> None:
+        with self._condition:
+            self.count += len(lines)
+            if self.keep:
+                self.records.extend(json.loads(line) for line in lines)
+            self._condition.notify_all()
+
+    def wait_for(self, n: int, timeout: float = 10.0) -> bool:
+        with self._condition:
+            return self._condition.wait_for(lambda: self.count >= n, timeout)
+
+
+def benchmark_shipping(n: int = 200_000) -> None:
+    """Records per second shipped to a local collector over TCP and a Unix socket, plain and gzip."""
+    import tempfile
+
+    from src.helper.caller import get_console
+    from src.logging.myCustomJsonClass01 import MyJSONFormatter
+
+    console = get_console()
+    formatter = MyJSONFormatter(fmt_keys={"level": "levelname", "message": "message", "timestamp": "timestamp", "logger": "name", "line": "lineno"})
+    records = [logging.LogRecord("benchmark", logging.INFO, __file__, 1, "request %d served", (i,), None) for i in range(n)]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for address in ("127.0.0.1:0", f"unix:{os.path.join(tmp_dir, 'collector.sock')}"):
+            for compression in (None, "gzip"):
+                with LocalCollector(address, compression, keep=False) as collector:
+                    handler = ShippingHandler(collector.address, batch_size=1000, compression=compression)
+                    handler.setFormatter(formatter)
+                    start = time.perf_counter()
+                    for record in records:
+                        handler.handle(record)
+                    handler.flush()
+                    collector.wait_for(n)
+                    elapsed = time.perf_counter() - start
+                    handler.close()
+                    kind = "unix" if address.startswith("unix:") else "tcp"
+                    console.log(f"[ INFO ] {kind:<4} {compression or 'plain':<5} {collector.count:,} records in {elapsed:.2f} s -> {collector.count / elapsed:,.0f} records/s")
+
+
+if __name__ == "__main__":
+    benchmark_shipping()
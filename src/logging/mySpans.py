@@ -0,0 +1,271 @@
+import contextlib
+import functools
+import itertools
+import logging
+import threading
+import time
+import weakref
+from array import array
+
+SPAN_LOGGER = "spans"  # Span records are emitted by this logger, see `NoSpanFilter`
+UNSAMPLED = -1  # Stack marker of a span (and its children) skipped by sampling
+
+_span_ids = itertools.count(1)  # next() on a count is atomic under the GIL
+_perf_counter_ns = time.perf_counter_ns
+_NULL_SPAN = contextlib.nullcontext()
+
+
+class _SpanBuffer:
+    """Preallocated per-thread storage of finished spans, written in place by the owning thread."""
+
+    __slots__ = ("names", "span_ids", "parent_ids", "starts", "durations", "size", "stack", "roots", "last_flush", "thread_name")
+
+    def __init__(self, capacity: int):
+        zeros = bytes(8 * capacity)
+        self.names = [None] * capacity
+        self.span_ids = array("q", zeros)
+        self.parent_ids = array("q", zeros)
+        self.starts = array("q", zeros)
+        self.durations = array("q", zeros)
+        self.size = 0
+        self.stack = []  # ids of the open spans, innermost last
+        self.roots = 0
+        self.last_flush = _perf_counter_ns()
+        self.thread_name = threading.current_thread().name
+
+
+class _BufferOwner:
+    """Kept only by the thread-local of a buffer's thread, so it dies with the thread."""
+
+    __slots__ = ("__weakref__",)
+
+
+class _Span:
+    __slots__ = ("recorder", "name", "buffer", "span_id", "parent_id", "start")
+
+    def __init__(self, recorder: "SpanRecorder", name: str):
+        self.recorder = recorder
+        self.name = name
+
+    def __enter__(self):
+        recorder = self.recorder
+        buffer = self.buffer = recorder._buffer()
+        stack = buffer.stack
+        if stack:
+            parent_id = stack[-1]
+        else:
+            # Sampling is decided per root span, children follow their root
+            parent_id = 0 if buffer.roots % recorder.sample_every == 0 else UNSAMPLED
+            buffer.roots += 1
+        if parent_id == UNSAMPLED:
+            stack.append(UNSAMPLED)
+            self.span_id = UNSAMPLED
+            return self
+        self.parent_id = parent_id
+        self.span_id = next(_span_ids)
+        stack.append(self.span_id)
+        self.start = _perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        end = _perf_counter_ns()
+        buffer = self.buffer
+        buffer.stack.pop()
+        if self.span_id != UNSAMPLED:
+            self.recorder._record(buffer, self.name, self.span_id, self.parent_id, self.start, end)
+
+
+class SpanRecorder:
+    """
+    Low overhead timing spans, emitted as structured records in batches.
+    Args:
+        logger_name (str): Logger of the span records, `spans` by default.
+        capacity (int): Number of spans buffered per thread before a flush.
+        sample_every (int): Record one root span (with all its children) out
+            of `sample_every`, per thread.
+        flush_interval (float): Seconds after which a thread flushes its
+            buffer when a root span ends, even if it is not full.
+        level (int): Level of the span records.
+    Finished spans are written into preallocated arrays of the current thread
+    (name, span id, parent id, start and duration in `perf_counter_ns`): no
+    lock, no record and no formatting on the hot path. A full buffer is
+    turned into one DEBUG record per span, with `span_name`, `duration_ns`,
+    `span_id`, `parent_id` and `start_ns` as extras, so they reach the
+    `file_json` handler and `MyJSONFormatter` as top-level JSON fields. The
+    buffer of a thread is flushed and dropped when the thread exits, so a
+    churning thread pool neither delays its spans nor grows the recorder.
+    Disabled, `span()` returns a shared no-op context manager and `timed()`
+    wrappers call straight through.
+    Usage:
+        with tracer.span("load"):
+            ...
+
+        @tracer.timed()
+        def parse(): ...
+    """
+
+    def __init__(self, logger_name: str = SPAN_LOGGER, capacity: int = 512, sample_every: int = 1, flush_interval: float = 1.0, level: int = logging.DEBUG, enabled: bool = True):
+        self.logger = logging.getLogger(logger_name)
+        self.capacity = capacity
+        self.sample_every = sample_every
+        self.flush_interval_ns = int(flush_interval * 1e9)
+        self.level = level
+        self.enabled = enabled
+        self._local = threading.local()
+        self._buffers = []
+        self._lock = threading.Lock()
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def span(self, name: str):
+        """Context manager timing its block as the span `name`."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def timed(self, name: str | None = None):
+        """Decorator timing every call as a span, named after the function by default."""
+
+        def decorator(func):
+            span_name = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with _Span(self, span_name):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def _buffer(self) -> _SpanBuffer:
+        try:
+            return self._local.buffer
+        except AttributeError:
+            buffer = self._local.buffer = _SpanBuffer(self.capacity)
+            with self._lock:
+                self._buffers.append(buffer)
+            # When the thread exits its spans are emitted and the buffer forgotten, at shutdown `flush_all` does it
+            owner = self._local.owner = _BufferOwner()
+            weakref.finalize(owner, self._retire, buffer).atexit = False
+            return buffer
+
+    def _retire(self, buffer: _SpanBuffer) -> None:
+        with self._lock:
+            try:
+                self._buffers.remove(buffer)
+            except ValueError:
+                return
+        self._flush_buffer(buffer)
+
+    def _record(self, buffer: _SpanBuffer, name: str, span_id: int, parent_id: int, start: int, end: int) -> None:
+        i = buffer.size
+        buffer.names[i] = name
+        buffer.span_ids[i] = span_id
+        buffer.parent_ids[i] = parent_id
+        buffer.starts[i] = start
+        buffer.durations[i] = end - start
+        buffer.size = i + 1
+        if buffer.size == self.capacity or (not buffer.stack and end - buffer.last_flush >= self.flush_interval_ns):
+            self._flush_buffer(buffer, end)
+
+    def _flush_buffer(self, buffer: _SpanBuffer, now: int | None = None) -> None:
+        size, buffer.size = buffer.size, 0
+        buffer.last_flush = now or _perf_counter_ns()
+        logger = self.logger
+        if not size or not logger.isEnabledFor(self.level):
+            return
+        # perf_counter has no epoch, shift the starts onto the wall clock once per batch
+        offset_ns = time.time_ns() - _perf_counter_ns()
+        start_time = logging._startTime
+        names, span_ids, parent_ids, starts, durations = buffer.names, buffer.span_ids, buffer.parent_ids, buffer.starts, buffer.durations
+        for i in range(size):
+            extra = {
+                "span_name": names[i],
+                "duration_ns": durations[i],
+                "span_id": span_ids[i],
+                "parent_id": parent_ids[i] or None,
+                "start_ns": starts[i] + offset_ns,
+            }
+            # makeRecord skips the caller lookup of logger.debug(), the span name stands for the function
+            record = logger.makeRecord(logger.name, self.level, "(span)", 0, "span %s took %d ns", (names[i], durations[i]), None, names[i], extra)
+            # The record is dated when the span started, not when the batch is flushed
+            record.created = extra["start_ns"] / 1e9
+            record.msecs = (extra["start_ns"] // 1_000_000) % 1000
+            record.relativeCreated = (record.created - start_time) * 1000
+            record.threadName = buffer.thread_name
+            logger.handle(record)
+            names[i] = None
+
+    def flush(self) -> None:
+        """Emit the spans buffered by the calling thread."""
+        self._flush_buffer(self._buffer())
+
+    def flush_all(self) -> None:
+        """
+        Emit the spans buffered by every thread. Meant for shutdown (it is
+        registered by `setup_logging`): the buffers belong to their threads,
+        which must not be recording at the same time.
+        """
+        with self._lock:
+            buffers = list(self._buffers)
+        for buffer in buffers:
+            self._flush_buffer(buffer)
+
+
+tracer = SpanRecorder()  # Shared recorder of the application
+span = tracer.span
+timed = tracer.timed
+
+
+def benchmark_spans(n: int = 200_000) -> None:
+    """
+    Cost per span: disabled, enabled (buffered, then emitted in batches to a
+    NullHandler), recording only (span records below the logger level),
+    sampled, and a hand-written `time.time()` delta plus `logger.info`.
+    """
+    from src.helper.caller import get_console
+
+    console = get_console()
+    logger = logging.getLogger("benchmark_spans")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+
+    def measure(label: str, body) -> None:
+        start = time.perf_counter_ns()
+        body()
+        console.log(f"[ INFO ] {label:<26} {(time.perf_counter_ns() - start) / n:8.0f} ns/span")
+
+    recorder = SpanRecorder("benchmark_spans", enabled=False)
+
+    def with_spans():
+        for _ in range(n):
+            with recorder.span("work"):
+                pass
+
+    measure("disabled:", with_spans)
+    recorder.enable()
+    measure("enabled:", with_spans)
+    logger.setLevel(logging.INFO)
+    measure("enabled, recording only:", with_spans)
+    logger.setLevel(logging.DEBUG)
+    recorder.sample_every = 100
+    measure("enabled, 1 in 100:", with_spans)
+
+    def hand_written():
+        for _ in range(n):
+            start = time.time()
+            logger.info("work took %f s", time.time() - start)
+
+    measure("time.time() + logger.info:", hand_written)
+
+
+if __name__ == "__main__":
+    benchmark_spans()
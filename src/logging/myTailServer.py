@@ -0,0 +1,241 @@
+import json
+import logging
+import os
+import queue
+import socket
+import threading
+
+_MISSING = object()
+_CLOSE = b""  # Sentinel put on a subscriber buffer by TailServer.stop()
+
+
+class Subscriber:
+    """
+    One connected viewer and its filter.
+    Args:
+        level (int): Minimum level of the records sent.
+        logger (str | None): Only this logger and its children.
+        match (dict | None): Record attributes (standard ones like `funcName`
+            or extras) that must be equal to the given values.
+        buffer_size (int): Lines buffered for this viewer, when the buffer is
+            full the viewer is too slow and gets disconnected.
+    """
+
+    def __init__(self, sock: socket.socket, level: int = logging.NOTSET, logger: str | None = None, match: dict | None = None, buffer_size: int = 1000):
+        self.sock = sock
+        self.level = level
+        self.logger = logger
+        self.logger_prefix = f"{logger}." if logger else None
+        self.match = match or {}
+        self.buffer = queue.Queue(buffer_size)
+        self.dropped = False
+
+    def matches(self, record: logging.LogRecord) -> bool:
+        if record.levelno < self.level:
+            return False
+        if self.logger and record.name != self.logger and not record.name.startswith(self.logger_prefix):
+            return False
+        for key, value in self.match.items():
+            if getattr(record, key, _MISSING) != value:
+                return False
+        return True
+
+    def offer(self, line: bytes) -> bool:
+        """Buffer a line without blocking, False when the buffer is full."""
+        try:
+            self.buffer.put_nowait(line)
+        except queue.Full:
+            return False
+        return True
+
+
+class TailHandler(logging.Handler):
+    """
+    Listener-side handler feeding the subscribers of a `TailServer`.
+    With no subscriber it returns right away; otherwise the record is
+    formatted once (with the JSON formatter shared with `file_json`, see
+    `share_formatters`) and offered to every subscriber whose filter matches.
+    It never blocks: a subscriber whose buffer is full is dropped.
+    """
+
+    def __init__(self, server: "TailServer", level=logging.NOTSET):
+        super().__init__(level)
+        self.server = server
+
+    def emit(self, record: logging.LogRecord) -> None:
+        subscribers = self.server.subscribers
+        if not subscribers:
+            return
+        line = None
+        for subscriber in subscribers:
+            if not subscriber.matches(record):
+                continue
+            if line is None:
+                try:
+                    line = self.format(record).encode("utf-8") + b"\n"
+                except Exception:
+                    self.handleError(record)
+                    return
+            if not subscriber.offer(line):
+                self.server.drop(subscriber)
+
+
+class TailServer:
+    """
+    Live tail of the log pipeline on a Unix domain socket.
+    A viewer connects and sends one JSON line with its filter, e.g.
+    `{"level": "WARNING", "logger": "src.logging", "match": {"funcName": "main"}}`
+    (an empty line means everything), then receives the matching records as
+    NDJSON until it disconnects. Each viewer has its own bounded buffer and
+    writer thread, so a slow viewer is disconnected instead of slowing down
+    the QueueListener or the other viewers.
+    Usage:
+        server = TailServer("src/logging/tail.sock").start()
+        listener handlers += (server.handler,)
+        python -m src.logging.myTailServer src/logging/tail.sock --level WARNING
+    """
+
+    def __init__(self, path: str, buffer_size: int = 1000, max_subscribers: int = 64):
+        self.path = path
+        self.buffer_size = buffer_size
+        self.max_subscribers = max_subscribers
+        self.handler = TailHandler(self)
+        self.subscribers = ()  # Replaced, never mutated: the handler reads it without a lock
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._sock = None
+        self._thread = None
+
+    def start(self) -> "TailServer":
+        if os.path.exists(self.path):
+            os.unlink(self.path)  # Left behind by a previous run
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.bind(self.path)
+        self._sock.listen()
+        self._thread = threading.Thread(target=self._accept_loop, name="TailServer", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._sock is None:
+            return
+        self._sock.close()
+        self._sock = None
+        with self._lock:
+            subscribers, self.subscribers = self.subscribers, ()
+        for subscriber in subscribers:
+            # Let the writer send what is buffered, then close
+            if not subscriber.offer(_CLOSE):
+                subscriber.sock.close()
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+    def _accept_loop(self) -> None:
+        while self._sock is not None:
+            try:
+                sock, _ = self._sock.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._serve, args=(sock,), name="TailSubscriber", daemon=True).start()
+
+    def _serve(self, sock: socket.socket) -> None:
+        try:
+            subscriber = self._subscribe(sock)
+        except (OSError, ValueError) as error:
+            try:
+                sock.sendall(json.dumps({"error": str(error)}).encode("utf-8") + b"\n")
+            except OSError:
+                pass
+            sock.close()
+            return
+        try:
+            self._write_loop(subscriber)
+        finally:
+            self.drop(subscriber, slow=False)
+            sock.close()
+
+    def _subscribe(self, sock: socket.socket) -> Subscriber:
+        sock.settimeout(5.0)
+        request = sock.makefile("rb").readline(1 << 16)
+        sock.settimeout(None)
+        options = json.loads(request) if request.strip() else {}
+        level = options.get("level", logging.NOTSET)
+        level = logging._checkLevel(level.upper() if isinstance(level, str) else level)
+        subscriber = Subscriber(sock, level, options.get("logger"), options.get("match"), self.buffer_size)
+        with self._lock:
+            if len(self.subscribers) >= self.max_subscribers:
+                raise ValueError("too many subscribers")
+            self.subscribers = (*self.subscribers, subscriber)
+        return subscriber
+
+    def _write_loop(self, subscriber: Subscriber) -> None:
+        buffer = subscriber.buffer
+        while True:
+            lines = [buffer.get()]
+            # Send everything already buffered in one call
+            while len(lines) < 256:
+                try:
+                    lines.append(buffer.get_nowait())
+                except queue.Empty:
+                    break
+            closing = _CLOSE in lines
+            try:
+                subscriber.sock.sendall(b"".join(lines))
+            except OSError:
+                return
+            if closing or subscriber.dropped:
+                return
+
+    def drop(self, subscriber: Subscriber, slow: bool = True) -> None:
+        """Unsubscribe a viewer; a slow one also gets its connection shut down, which unblocks its writer."""
+        with self._lock:
+            if subscriber not in self.subscribers:
+                return
+            self.subscribers = tuple(s for s in self.subscribers if s is not subscriber)
+            if slow:
+                self.dropped += 1
+        if slow:
+            subscriber.dropped = True
+            try:
+                subscriber.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
+def tail(path: str, level=None, logger: str | None = None, match: dict | None = None):
+    """Connect to a `TailServer` and yield the matching records as dicts."""
+    options = {key: value for key, value in (("level", level), ("logger", logger), ("match", match)) if value}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(path)
+        sock.sendall(json.dumps(options).encode("utf-8") + b"\n")
+        for line in sock.makefile("rb"):
+            yield json.loads(line)
+
+
+def main(argv=None) -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Follow the live log pipeline through its tail socket.")
+    parser.add_argument("path", help="tail socket, e.g. src/logging/tail.sock")
+    parser.add_argument("--level", help="minimum level, e.g. WARNING")
+    parser.add_argument("--logger", help="only this logger and its children")
+    parser.add_argument("--match", action="append", default=[], metavar="KEY=VALUE", help="record attribute equal to VALUE (JSON, or a plain string), repeatable")
+    args = parser.parse_args(argv)
+    match = {}
+    for item in args.match:
+        key, _, value = item.partition("=")
+        try:
+            match[key] = json.loads(value)
+        except ValueError:
+            match[key] = value
+    try:
+        for record in tail(args.path, args.level, args.logger, match):
+            print(json.dumps(record), flush=True)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
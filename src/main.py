@@ -7,23 +7,85 @@
 # from tests.debugging_template import testing
 # from src.helper.employee import Employee
 # from lib.basics_of_python.syntax_and_structure import Employee, my_message
-from rich.console import Console
-
-from src.concepts.oop import *
+# NOTE: keep this module import-light, it is launched as a short-lived job
+# many times a day. Heavy modules (rich, the concept packages, the logging
+# pipelines) are imported inside `main()` only when they are used, see
+# `make startup` for the cold-start budget.
+#
+# from rich.console import Console
+# from src.concepts.oop import *
 
 # from src.logging.L01_myLoggerEngine import justLogging, logger
 # from src.logging.L02_loading_config_from_outside import testing_loading_config
 # from src.logging.L03_multi_config import testing_loading_config
 #from src.logging.L04_json_formatter_class import testing_loading_config
 #from src.logging.L05_queue_handler import testing_loading_config
-from src.logging.L06_final_prod import testing_loading_config
 
-console = Console()
 
+# name -> (module, function run --repeat times, setup function run once before or None)
+TARGETS = {
+    "logging": ("src.logging.L06_final_prod", "log_sample_records", "setup_logging"),
+    "oop": ("src.concepts.oop", "testing_super_method_concept", None),
+}
 
 
+def parse_args(argv=None):
+    import argparse
 
-if __name__ == "__main__":
-    testing_loading_config()
+    parser = argparse.ArgumentParser(prog="python -m src.main")
+    parser.add_argument("--target", choices=TARGETS, default="logging", help="function to run (default: logging)")
+    parser.add_argument("--repeat", type=int, default=1, help="run the target N times, to profile under load")
+    modes = parser.add_mutually_exclusive_group()
+    modes.add_argument("--profile", action="store_true", help="run under cProfile, stats saved to --output")
+    modes.add_argument("--tracemalloc", action="store_true", help="report the top allocation sites and the peak memory")
+    modes.add_argument("--sample", action="store_true", help="sample the stacks every --interval seconds, folded stacks saved to --output")
+    parser.add_argument("--output", help="output file (default: main.prof for --profile, main.folded for --sample)")
+    parser.add_argument("--sort", default="cumulative", help="cProfile sort key (default: cumulative)")
+    parser.add_argument("--top", type=int, default=20, help="number of functions / allocation sites reported")
+    parser.add_argument("--frames", type=int, default=1, help="tracemalloc traceback depth")
+    parser.add_argument("--interval", type=float, default=0.005, help="sampling interval in seconds")
+    return parser.parse_args(argv)
+
+
+def load_target(name: str, repeat: int = 1):
+    import importlib
+
+    module_name, function_name, setup_name = TARGETS[name]
+    module = importlib.import_module(module_name)
+    function = getattr(module, function_name)
+    setup = getattr(module, setup_name) if setup_name else None
+
+    def target():
+        # Set up once: e.g. a second setup_logging() would hot reload the running pipeline on every repeat
+        if setup is not None:
+            setup()
+        for _ in range(repeat):
+            function()
+
+    return target
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    target = load_target(args.target, args.repeat)
+    if args.profile:
+        from src.helper.profiling import run_cprofile
+
+        run_cprofile(target, args.output or "main.prof", sort=args.sort, limit=args.top)
+    elif args.tracemalloc:
+        from src.helper.profiling import run_tracemalloc
+
+        run_tracemalloc(target, top=args.top, frames=args.frames)
+    elif args.sample:
+        from src.helper.profiling import run_sampling
+
+        run_sampling(target, args.output or "main.folded", interval=args.interval)
+    else:
+        target()
+    # from src.concepts.oop import testing_super_method_concept, var_gh
     # testing_super_method_concept()
-    # console.log(var_gh)
+    # Console().log(var_gh)
+
+
+if __name__ == "__main__":
+    main()
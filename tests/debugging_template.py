@@ -7,12 +7,9 @@ from pathlib import Path
 
 # import debugpy
 # import ipdb
-from rich.console import Console
 
 logging.basicConfig(level=logging.INFO)
 
-console = Console()
-
 
 def testing():
     """
@@ -25,6 +22,11 @@ def testing():
 
     # pdb.set_trace()  # Set a breakpoint here
 
+    # Imported here so importing this template does not build a console
+    from rich.console import Console
+
+    console = Console()
+
     console.log(os.path.abspath(__file__))
 
     data_path = "/Users/gmbp/Desktop/devCode/pythonHub/pythonCheatSheet/src/data/famous_women_in_science.csv"
@@ -41,12 +43,13 @@ def testing():
     print(full_path)
 
     def my_context_manager(data_path: str) -> None:
+        # Stream the file in fixed-size chunks of typed rows, one log record per batch
+        from src.helper.csv_loader import load_batches
+
         try:
-            with open(file=data_path, mode="r", newline="", encoding="utf-8") as file:
-                lines = file.readlines()
-                for line in lines:
-                    # ipdb.set_trace()
-                    logging.info(line.strip())
+            for header, batch in load_batches(data_path):
+                # ipdb.set_trace()
+                logging.info("%s: %d rows\n%s", header, len(batch), "\n".join(map(str, batch)))
         except Exception as e:
             logging.info(f"[ MY INFO ]: {e}")
 
@@ -0,0 +1,97 @@
+"""
+Cold-start budget check for the `python -m src.main` entry point.
+
+Each run starts a fresh interpreter with `-X importtime`, imports the entry
+point and the logging pipeline it launches, and sums the cumulative import
+time of the top-level modules (the same numbers `python -X importtime`
+prints), leaving out the modules a bare `python -c pass` already imports
+(site, encodings, ...): interpreter startup is not something the project
+controls. The median over several runs is compared with the budget and the
+script exits with status 1 when it is exceeded, listing the most expensive
+imports so the offender is easy to find.
+
+Usage (from the project root):
+    python tests/startup_budget.py
+    python tests/startup_budget.py --budget-ms 40 --runs 7
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_TARGETS = ("src.main", "src.logging.L06_final_prod")
+# With margin over the 40-60 ms the tree takes, but below one eager numpy or rich import (100+ ms)
+DEFAULT_BUDGET_MS = float(os.environ.get("STARTUP_BUDGET_MS", 100))
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int]]:
+    """
+    Parse the `-X importtime` report.
+    Returns:
+        list[tuple[str, int, int]]: (module, self_us, cumulative_us) for the
+            top-level imports only, nested imports are already part of the
+            cumulative time of their parent.
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_part, cumulative_us, name = line.split("|")
+        self_us = self_part.split(":", 1)[1]
+        # Nested imports are indented by two extra spaces per level
+        if name.startswith("   "):
+            continue
+        entries.append((name.strip(), int(self_us), int(cumulative_us)))
+    return entries
+
+
+def run_importtime(code: str) -> tuple[float, str]:
+    """Wall time in milliseconds and `-X importtime` report of a fresh interpreter running `code`."""
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True)
+    return (time.perf_counter() - start) * 1000, result.stderr
+
+
+def baseline_modules() -> set[str]:
+    """Modules imported by the interpreter startup alone (`python -c pass`)."""
+    _, stderr = run_importtime("pass")
+    return {name for name, _, _ in parse_importtime(stderr)}
+
+
+def measure_once(targets, baseline=frozenset()) -> tuple[float, float, list[tuple[str, int, int]]]:
+    wall_ms, stderr = run_importtime("; ".join(f"import {target}" for target in targets))
+    entries = [entry for entry in parse_importtime(stderr) if entry[0] not in baseline]
+    import_ms = sum(cumulative for _, _, cumulative in entries) / 1000
+    return import_ms, wall_ms, entries
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="maximum median import time in milliseconds")
+    parser.add_argument("--runs", type=int, default=5, help="number of cold starts to measure")
+    parser.add_argument("--top", type=int, default=10, help="number of slowest imports to print on failure")
+    parser.add_argument("targets", nargs="*", default=DEFAULT_TARGETS, help="modules imported by the entry point")
+    args = parser.parse_args(argv)
+
+    baseline = baseline_modules()
+    runs = [measure_once(args.targets, baseline) for _ in range(args.runs)]
+    import_ms = statistics.median(run[0] for run in runs)
+    wall_ms = statistics.median(run[1] for run in runs)
+    print(f"[ INFO ] import time beyond `python -c pass`: {import_ms:.1f} ms (median of {args.runs}), interpreter wall time: {wall_ms:.1f} ms, budget: {args.budget_ms:.1f} ms")
+
+    if import_ms <= args.budget_ms:
+        return 0
+
+    # Report the slowest top-level imports of the last run
+    print(f"[ ERROR ] cold start over budget by {import_ms - args.budget_ms:.1f} ms, slowest imports:")
+    for name, _, cumulative in sorted(runs[-1][2], key=lambda entry: entry[2], reverse=True)[: args.top]:
+        print(f"    {cumulative / 1000:8.2f} ms  {name}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
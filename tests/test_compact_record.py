@@ -0,0 +1,57 @@
+import copy
+import json
+import logging
+import logging.handlers
+import queue
+
+import pytest
+
+from src.logging.myCompactRecord import CompactFormatter, CompactLogRecord, install_record_factory, prepare_handlers, uninstall_record_factory
+from src.logging.myCustomJsonClass01 import MyJSONFormatter
+
+
+@pytest.fixture
+def compact_logger():
+    log_queue = queue.SimpleQueue()
+    handler = logging.handlers.QueueHandler(log_queue)
+    # Not registered in the logging manager, so no capture handler (with a stock formatter) is attached to it
+    logger = logging.Logger("test_compact_record", logging.DEBUG)
+    logger.addHandler(handler)
+    logger.propagate = False
+    install_record_factory([handler])
+    try:
+        yield logger, log_queue
+    finally:
+        uninstall_record_factory()
+
+
+def test_records_keep_only_the_extras_in_their_dict(compact_logger):
+    logger, log_queue = compact_logger
+    logger.info("request %d served", 7, extra={"user_id": 7})
+    record = log_queue.get_nowait()
+    assert type(record) is CompactLogRecord
+    assert record.__dict__ == {"user_id": 7}
+    assert (record.getMessage(), record.levelname, record.funcName, record.module) == ("request 7 served", "INFO", "test_records_keep_only_the_extras_in_their_dict", "test_compact_record")
+    clone = copy.copy(record)
+    assert clone is not record and clone.__dict__ == {"user_id": 7} and clone.message == record.message
+
+
+def test_formatters_read_the_slots(compact_logger):
+    logger, log_queue = compact_logger
+    logger.warning("disk %s full", "sda", extra={"x": "hello"})
+    record = log_queue.get_nowait()
+    for style, fmt in (("%", "%(levelname)s:%(name)s:%(message)s"), ("{", "{levelname}:{name}:{message}"), ("$", "${levelname}:${name}:${message}")):
+        assert CompactFormatter(fmt, style=style).format(record) == "WARNING:test_compact_record:disk sda full"
+    line = json.loads(MyJSONFormatter(fmt_keys={"level": "levelname", "logger": "name"}).format(record))
+    assert (line["level"], line["message"], line["x"]) == ("WARNING", "disk sda full", "hello")
+
+
+def test_prepare_handlers_swaps_stock_formatters_and_rejects_unknown_ones():
+    stock = logging.StreamHandler()
+    stock.setFormatter(logging.Formatter("%(levelname)s %(message)s", datefmt="%H"))
+    prepare_handlers([stock])
+    assert type(stock.formatter) is CompactFormatter and stock.formatter._fmt == "%(levelname)s %(message)s" and stock.formatter.datefmt == "%H"
+    custom = logging.StreamHandler()
+    custom.setFormatter(type("CustomFormatter", (logging.Formatter,), {})())
+    with pytest.raises(TypeError):
+        prepare_handlers([custom])
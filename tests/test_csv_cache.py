@@ -0,0 +1,42 @@
+import numpy as np
+
+from src.helper.csv_cache import cache_path_for, load_cached
+from src.helper.csv_loader import load_batches
+from src.helper.csv_query import Dataset
+
+CSV = """Name,Field,Born,Nobel Prize?
+Marie Curie,Physics,1867,yes
+Ada Lovelace,,1815,no
+,Chemistry,,
+"""
+
+
+def test_cache_round_trip_keeps_types_and_missing_cells(tmp_path):
+    path = tmp_path / "women.csv"
+    path.write_text(CSV)
+    table = load_cached(path, cache_dir=tmp_path / "cache")
+    assert table.column("Born").dtype == np.int64 and table.column("Nobel Prize?").dtype == np.bool_
+    assert table.column("Born").tolist() == [1867, 1815, None]
+    assert table.column("Nobel Prize?").tolist() == [True, False, None]
+    assert table.column("Name").tolist() == ["Marie Curie", "Ada Lovelace", None]
+    assert table.column("Field")[1] is None
+
+    text_rows = [row for _, batch in load_batches(path) for row in batch]
+    cached = Dataset.from_csv(path, cache=True, cache_dir=tmp_path / "cache")
+    text = Dataset.from_csv(path)
+    everything = np.ones(3, dtype=bool)
+    assert cached.rows(everything) == text.rows(everything) == text_rows
+    assert text_rows[1] == ("Ada Lovelace", None, 1815, False)
+
+
+def test_cache_is_reused_until_the_content_changes(tmp_path):
+    path = tmp_path / "women.csv"
+    path.write_text(CSV)
+    load_cached(path)
+    meta_file = tmp_path / "women.csv.cache" / "meta.json"
+    assert cache_path_for(path) == str(meta_file.parent)
+    built = meta_file.stat().st_mtime_ns
+    load_cached(path)
+    assert meta_file.stat().st_mtime_ns == built
+    path.write_text(CSV + "Lise Meitner,Physics,1878,no\n")
+    assert load_cached(path).column("Born").tolist()[-1] == 1878
@@ -0,0 +1,49 @@
+import csv
+import io
+
+import pytest
+
+from src.helper.csv_loader import WOMEN_IN_SCIENCE_SCHEMA, iter_blocks, load_batches, parse_bool
+
+ROWS = [
+    ("Marie Curie", "Physics, Chemistry", "1867", "Yes"),
+    ("Ada Lovelace", 'Mathematics "and" computing\nover two lines', "1815", "no"),
+    ("Rosalind Franklin", "", "1920", "N"),
+]
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    text = io.StringIO(newline="")
+    writer = csv.writer(text, lineterminator="\n")
+    writer.writerow(["Name", "Field", "Born", "Nobel Prize?"])
+    writer.writerows(ROWS * 50)
+    path = tmp_path / "women.csv"
+    path.write_text(text.getvalue(), newline="")
+    return path
+
+
+def test_blocks_end_on_record_boundaries(csv_path):
+    with open(csv_path, "rb") as file:
+        file.readline()
+        blocks = list(iter_blocks(file, chunk_size=17))
+    assert all(block.endswith(b"\n") for block in blocks)
+    assert [row for block in blocks for row in csv.reader(io.StringIO(block.decode(), newline=""))] == [list(row) for row in ROWS * 50]
+
+
+@pytest.mark.parametrize("processes", [None, 2])
+def test_batches_are_typed_and_in_file_order(csv_path, processes):
+    batches = list(load_batches(csv_path, WOMEN_IN_SCIENCE_SCHEMA, chunk_size=64, processes=processes))
+    assert len(batches) > 1 and all(header == ["Name", "Field", "Born", "Nobel Prize?"] for header, _ in batches)
+    rows = [row for _, batch in batches for row in batch]
+    assert rows[:3] == [
+        ("Marie Curie", "Physics, Chemistry", 1867, True),
+        ("Ada Lovelace", 'Mathematics "and" computing\nover two lines', 1815, False),
+        ("Rosalind Franklin", None, 1920, False),
+    ]
+    assert len(rows) == 150
+
+
+def test_parse_bool_rejects_unknown_values():
+    with pytest.raises(ValueError):
+        parse_bool("maybe")
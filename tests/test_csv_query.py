@@ -0,0 +1,49 @@
+import os
+
+from src.helper.csv_query import Dataset, QueryEngine
+
+CSV = """Name,Field,Born,Nobel Prize?
+Marie Curie,Physics,1867,yes
+Ada Lovelace,,1815,no
+Anonymous,Chemistry,,
+Rosalind Franklin,Chemistry,1920,no
+Lise Meitner,Physics,1878,no
+"""
+
+
+def write_csv(tmp_path, text=CSV):
+    path = tmp_path / "women.csv"
+    path.write_text(text)
+    return path
+
+
+def test_blank_cells_load_as_their_own_category_and_sort_last(tmp_path):
+    dataset = Dataset.from_csv(write_csv(tmp_path))
+    assert dataset.categories["Field"] == ["Chemistry", "Physics", None]
+    assert dataset.categories["Nobel Prize?"] == [False, True, None]
+    assert dataset.arrays["Born"].dtype.kind == "i"
+    order, sorted_values = dataset.sorted_index["Born"]
+    assert sorted_values.tolist() == [1815, 1867, 1878, 1920]
+    assert dataset.column("Name", order) == ["Ada Lovelace", "Marie Curie", "Lise Meitner", "Rosalind Franklin", "Anonymous"]
+    assert dataset.rows(dataset.equals("Name", "Anonymous")) == [("Anonymous", "Chemistry", None, None)]
+    assert dataset.rows(dataset.equals("Name", "Ada Lovelace")) == [("Ada Lovelace", None, 1815, False)]
+
+
+def test_missing_values_never_match_a_range(tmp_path):
+    dataset = Dataset.from_csv(write_csv(tmp_path), sorted_on=())
+    indexed = Dataset.from_csv(write_csv(tmp_path))
+    for data in (dataset, indexed):
+        assert data.count(data.between("Born", None, None)) == 4
+        assert data.count(data.between("Born", 1850, None)) == 3
+        assert data.count(data.equals("Born", None)) == 1
+        assert data.count(data.equals("Born", 0)) == 0
+
+
+def test_query_engine_reloads_on_change(tmp_path):
+    path = write_csv(tmp_path)
+    engine = QueryEngine(path)
+    assert engine.group_count("Field", where={"Nobel Prize?": False}) == {"Chemistry": 1, "Physics": 1, None: 1}
+    assert engine.count(ranges={"Born": (1850, 1900)}) == 2
+    path.write_text(CSV + "Barbara McClintock,Biology,1902,yes\n")
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 10**9))
+    assert engine.group_count("Field", where={"Nobel Prize?": True}) == {"Biology": 1, "Chemistry": 0, "Physics": 1, None: 0}
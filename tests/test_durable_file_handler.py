@@ -0,0 +1,94 @@
+import logging
+import queue
+import threading
+import time
+
+import pytest
+
+from src.logging.myDurableFileHandler import DURABLE_COMMIT_ATTR, DurableCommit, DurableQueueHandler, DurableRotatingFileHandler
+from src.logging.myQueueListener import FormatOnceQueueListener
+
+
+def make_record(level, msg="message"):
+    return logging.LogRecord("app", level, __file__, 1, msg, None, None)
+
+
+def test_error_mode_fsyncs_critical_records_only(tmp_path):
+    handler = DurableRotatingFileHandler(str(tmp_path / "app.log"), durability="error")
+    for level in (logging.INFO, logging.ERROR, logging.DEBUG, logging.CRITICAL):
+        handler.handle(make_record(level))
+    assert handler.fsyncs == 2
+    handler.close()
+    assert (tmp_path / "app.log").read_text().count("message") == 4
+
+
+def test_group_commit_releases_the_producers(tmp_path):
+    handler = DurableRotatingFileHandler(str(tmp_path / "app.log"), durability="group", commit_timeout=5)
+    start = time.perf_counter()
+    workers = [threading.Thread(target=handler.handle, args=(make_record(logging.ERROR),)) for _ in range(8)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert time.perf_counter() - start < 5
+    assert 1 <= handler.fsyncs <= 8
+    handler.close()
+
+
+
+@pytest.mark.parametrize("durability", ["periodic", "group"])
+def test_close_under_the_handler_lock_does_not_hang(tmp_path, durability):
+    # logging.shutdown() closes the handler with its lock held, while the background thread has work to do
+    handler = DurableRotatingFileHandler(str(tmp_path / "app.log"), durability=durability, fsync_interval=0.01)
+    commit = DurableCommit(holds=1)
+    done = threading.Event()
+
+    def shutdown():
+        with handler.lock:
+            record = make_record(logging.ERROR)
+            setattr(record, DURABLE_COMMIT_ATTR, commit)
+            handler.emit(record)
+            time.sleep(0.1)  # The background thread wants to fsync meanwhile
+            handler.close()
+        done.set()
+
+    threading.Thread(target=shutdown, daemon=True).start()
+    assert done.wait(3)
+    assert handler.fsyncs >= 1 and (tmp_path / "app.log").read_text().count("message") == 1
+
+
+def test_unknown_durability_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        DurableRotatingFileHandler(str(tmp_path / "app.log"), durability="always")
+
+
+def test_queue_producer_waits_for_the_listener_and_the_fsync(tmp_path):
+    log_queue = queue.SimpleQueue()
+    file_handler = DurableRotatingFileHandler(str(tmp_path / "app.log"), durability="group")
+    listener = FormatOnceQueueListener(log_queue, file_handler)
+    listener.start()
+    producer = DurableQueueHandler(log_queue, timeout=5)
+    try:
+        start = time.perf_counter()
+        producer.handle(make_record(logging.ERROR, "critical"))
+        assert time.perf_counter() - start < 5
+        assert file_handler.fsyncs >= 1
+        producer.handle(make_record(logging.INFO, "routine"))
+    finally:
+        listener.stop()
+        file_handler.close()
+    assert "critical" in (tmp_path / "app.log").read_text()
+
+
+def test_listener_releases_the_commit_when_a_handler_raises():
+    class BrokenHandler(logging.Handler):
+        def handle(self, record):
+            raise RuntimeError("broken")
+
+    listener = FormatOnceQueueListener(queue.SimpleQueue(), BrokenHandler())
+    record = make_record(logging.ERROR)
+    commit = DurableCommit(holds=1)
+    setattr(record, DURABLE_COMMIT_ATTR, commit)
+    with pytest.raises(RuntimeError):
+        listener.handle(record)
+    assert commit.wait(0)
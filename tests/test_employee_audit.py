@@ -0,0 +1,73 @@
+import logging
+import os
+import time
+
+import pytest
+
+from src.helper import employee
+
+
+@pytest.fixture
+def audit_log(tmp_path, monkeypatch):
+    monkeypatch.setattr(employee, "LOG_FILE", str(tmp_path / "employee.log"))
+    monkeypatch.setattr(employee, "file_handler", None)
+    yield tmp_path / "employee.log"
+    if employee.file_handler is not None:
+        employee.logger.removeHandler(employee.file_handler)
+        employee.file_handler.close()
+
+
+def test_log_file_does_not_depend_on_the_working_directory():
+    if "EMPLOYEE_AUDIT_LOG" not in os.environ:
+        assert employee.LOG_FILE == os.path.join(os.path.dirname(os.path.abspath(employee.__file__)), "employee.log")
+
+
+def test_file_handler_is_created_on_first_record(audit_log):
+    assert employee.file_handler is None
+    employee.Employee("Ada", "Lovelace")
+    employee.file_handler.flush()
+    assert audit_log.read_text() == "INFO:src.helper.employee:Created Employee: Ada-Lovelace using class : Employee\n"
+
+
+def test_batched_audit_writes_one_summary_record(audit_log):
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    employee.logger.addHandler(handler)
+    try:
+        with employee.batched_audit():
+            for i in range(5):
+                employee.Employee("Jack", f"M{i}")
+            assert records == []
+    finally:
+        employee.logger.removeHandler(handler)
+    assert len(records) == 1
+    assert records[0].getMessage().startswith("Created 5 Employees:\n    Jack-M0 using class : Employee")
+    assert employee.audit_batch is None
+
+
+def test_audit_batch_flushes_at_max_size(audit_log, monkeypatch):
+    flushed = []
+    batch = employee.AuditBatch(max_size=3, interval=float("inf"))
+    monkeypatch.setattr(employee.logger, "info", lambda msg, count, lines: flushed.append(count))
+    for i in range(7):
+        batch.add("Jack", str(i), "Employee")
+    batch.flush()
+    assert flushed == [3, 3, 1]
+
+
+def test_partial_batch_is_flushed_by_the_timer(audit_log, monkeypatch):
+    flushed = []
+    monkeypatch.setattr(employee.logger, "info", lambda msg, count, lines: flushed.append(count))
+    batch = employee.enable_audit_batching(max_size=100, interval=0.05)
+    try:
+        batch.add("Jack", "0", "Employee")
+        batch.add("Jack", "1", "Employee")
+        deadline = time.monotonic() + 2
+        while not flushed and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert flushed == [2]
+        batch.add("Jack", "2", "Employee")
+    finally:
+        employee.disable_audit_batching()
+    assert flushed == [2, 1] and not batch._timer.is_alive()
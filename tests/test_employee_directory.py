@@ -0,0 +1,52 @@
+import pytest
+
+from src.helper.caller import Employee
+from src.helper.employee_directory import EmployeeDirectory
+
+
+class StrictEmployee(Employee):
+    """Employee whose gender setter rejects unknown values."""
+
+    def __setattr__(self, name, value):
+        if name == "gender" and value not in ("male", "female"):
+            raise ValueError(f"unknown gender {value!r}")
+        super().__setattr__(name, value)
+
+
+def make_directory():
+    employees = [
+        StrictEmployee("Jack", "Michael", 30, 5000.0, "male"),
+        StrictEmployee("Anna", "Smith", 41, 9000.0, "female"),
+        StrictEmployee("Jack", "Michael", 25, 3000.0, "male"),
+    ]
+    return EmployeeDirectory(employees), employees
+
+
+def test_update_refreshes_the_indexes():
+    directory, (jack, anna, other_jack) = make_directory()
+    assert {emp.emp_id for emp in directory.find_by_name("Jack Michael")} == {jack.emp_id, other_jack.emp_id}
+    directory.update(jack.emp_id, last_name="Brown", salary=12000.0)
+    assert directory.find_by_name("Jack Michael") == [other_jack]
+    assert directory.find_by_email("Jack_Brown@email.com") == [jack]
+    assert directory.top_k("salary", 1) == [jack]
+    assert directory.salary_range(4000, 10000) == [anna]
+
+
+@pytest.mark.parametrize(
+    "changes, error",
+    [
+        ({"last_name": "Brown", "nickname": "JM"}, AttributeError),
+        ({"salary": "a lot"}, TypeError),
+        ({"last_name": "Brown", "salary": 1.0, "gender": "robot"}, ValueError),
+    ],
+)
+def test_failed_update_leaves_the_employee_indexed(changes, error):
+    directory, (jack, anna, other_jack) = make_directory()
+    with pytest.raises(error):
+        directory.update(jack.emp_id, **changes)
+    assert (jack.last_name, jack.salary, jack.gender) == ("Michael", 5000.0, "male")
+    assert jack in directory.find_by_name("Jack Michael")
+    assert directory.find_by_email("Jack_Brown@email.com") == []
+    assert directory.salary_range(4000, 6000) == [jack]
+    directory.remove(jack.emp_id)
+    assert directory.find_by_name("Jack Michael") == [other_jack]
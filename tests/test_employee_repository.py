@@ -0,0 +1,53 @@
+import sqlite3
+
+import pytest
+
+from src.helper.caller import Employee
+from src.helper.employee_repository import EmployeeRepository
+from src.helper.employee_table import EmployeeTable
+
+
+def as_tuple(emp):
+    return (emp.emp_id, emp.first_name, emp.last_name, emp.age, emp.salary, emp.gender)
+
+
+@pytest.fixture
+def repository(tmp_path):
+    with EmployeeRepository(str(tmp_path / "employees.db"), readers=2, chunk_size=7) as repository:
+        yield repository
+
+
+def test_round_trip_keeps_ids_and_values(repository):
+    employees = [Employee("Jack", f"M{i}", 20 + i, 1000.0 * i, "male" if i % 2 else "female") for i in range(20)]
+    assert repository.add_many(employees, rebuild_indexes=True) == 20
+    assert len(repository) == 20
+    assert as_tuple(repository.get(employees[3].emp_id)) == as_tuple(employees[3])
+    assert repository.get(-1) is None
+    streamed = list(repository.iter_employees("salary >= ?", (10_000,), batch_size=4))
+    assert sorted(map(as_tuple, streamed)) == sorted(as_tuple(emp) for emp in employees if emp.salary >= 10_000)
+    tables = list(repository.iter_tables(batch_size=8))
+    assert [len(table) for table in tables] == [8, 8, 4] and all(isinstance(table, EmployeeTable) for table in tables)
+    indexes = {row[0] for row in sqlite3.connect(repository.path).execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {"ix_employees_name", "ix_employees_salary"} <= indexes
+
+
+def test_failed_chunk_is_rolled_back(repository):
+    good = [Employee("Jack", f"M{i}", 30, 1.0, "male") for i in range(10)]
+    repository.add_many(good[:7])
+    with pytest.raises(sqlite3.IntegrityError):
+        repository._write_rows([as_tuple(emp) for emp in good[7:]] + [(0, None, "x", 1, 1.0, "male")])
+    assert len(repository) == 7
+    repository.remove(good[0].emp_id)
+    assert len(repository) == 6
+
+
+def test_closed_iterators_return_their_reader(repository):
+    repository.add_many([Employee("Jack", f"M{i}", 30, 1.0, "male") for i in range(20)])
+    employees = repository.iter_employees(batch_size=4)
+    tables = repository.iter_tables(batch_size=4)
+    next(employees), next(tables)
+    assert repository._readers.qsize() == 0
+    employees.close()
+    tables.close()
+    assert repository._readers.qsize() == 2
+    assert len(repository) == 20
@@ -0,0 +1,39 @@
+import random
+
+from src.helper.employee_table import EmployeeTable, SlottedEmployee
+
+
+def make_employees(n=200):
+    rng = random.Random(0)
+    return [SlottedEmployee(rng.choice(["Jack", "Anna"]), rng.choice(["Michael", "Smith", "Brown"]), rng.randint(20, 55), round(rng.uniform(2000, 15000), 2), rng.choice(["male", "female"])) for _ in range(n)]
+
+
+def test_sort_by_matches_employee_ordering():
+    employees = make_employees()
+    table = EmployeeTable.from_employees(employees)
+    assert [emp.emp_id for emp in table.sort_by().to_employees()] == [emp.emp_id for emp in sorted(employees)]
+    assert table.sort_by("age", descending=True).age.tolist() == sorted((emp.age for emp in employees), reverse=True)
+
+
+def test_filters_and_gender_aggregates():
+    employees = make_employees()
+    table = EmployeeTable.from_employees(employees)
+    older = table[table.age > 30]
+    assert sorted(older.emp_id.tolist()) == sorted(emp.emp_id for emp in employees if emp.age > 30)
+    assert older.gender_categories.tolist() == table.gender_categories.tolist()
+
+    women = [emp.salary for emp in employees if emp.gender == "female"]
+    assert table.count_by_gender()["female"] == len(women) == int(table.gender_mask("female").sum())
+    assert abs(table.mean_by_gender("salary")["female"] - sum(women) / len(women)) < 1e-6
+    assert not table.gender_mask("unknown").any()
+
+
+def test_rows_round_trip_with_their_ids():
+    employees = make_employees(5)
+    table = EmployeeTable.from_employees(employees)
+    restored = table.to_employees()
+    assert [(emp.first_name, emp.last_name, emp.age, emp.salary, emp.gender, emp.emp_id) for emp in restored] == [
+        (emp.first_name, emp.last_name, emp.age, emp.salary, emp.gender, emp.emp_id) for emp in employees
+    ]
+    assert table[2].emp_id == employees[2].emp_id
+    assert not hasattr(restored[0], "__dict__")
@@ -0,0 +1,73 @@
+import json
+import logging
+import logging.handlers
+import queue
+import threading
+
+from src.logging.myHotReload import ConfigWatcher, apply_logger_levels, build_handlers
+from src.logging.myQueueListener import HotReloadQueueListener
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+        self.closed = False
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+    def close(self):
+        self.closed = True
+        super().close()
+
+
+def test_swap_splits_the_records_at_the_marker_without_loss():
+    log_queue = queue.Queue()
+    old, new = ListHandler(), ListHandler()
+    listener = HotReloadQueueListener(log_queue, old)
+    logger = logging.getLogger("test_hot_reload.swap")
+    logger.propagate = False
+    logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    listener.start()
+    try:
+        logger.warning("before")
+        listener.swap_handlers({"test_hot_reload_new": new})
+        logger.warning("after")
+    finally:
+        listener.stop()
+        logger.handlers = []
+
+    assert old.messages == ["before"]
+    assert new.messages == ["after"]
+    assert old.closed and not new.closed
+    assert logging._handlers.get("test_hot_reload_new") is new
+
+
+def test_build_handlers_leaves_the_running_configuration_alone():
+    config = {"version": 1, "handlers": {"queue_handler": {"class": "logging.NullHandler"}, "console": {"class": "logging.NullHandler", "level": "WARNING"}}}
+    registered = dict(logging._handlers)
+
+    handlers = build_handlers(config)
+
+    assert list(handlers) == ["console"]
+    assert handlers["console"].level == logging.WARNING
+    assert dict(logging._handlers) == registered
+
+
+def test_apply_logger_levels():
+    apply_logger_levels({"loggers": {"test_hot_reload.levels": {"level": "ERROR"}}})
+    assert logging.getLogger("test_hot_reload.levels").level == logging.ERROR
+
+
+def test_config_watcher_reports_a_change(tmp_path):
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps({"version": 1}))
+    changed = threading.Event()
+    watcher = ConfigWatcher(str(config_file), lambda _: changed.set(), interval=0.01)
+    watcher.start()
+    try:
+        config_file.write_text(json.dumps({"version": 1, "disable_existing_loggers": False}))
+        assert changed.wait(2)
+    finally:
+        watcher.stop()
@@ -0,0 +1,56 @@
+import multiprocessing
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.helper.caller import EMPLOYEE_IDS, Employee
+from src.helper.id_allocator import IdAllocator, SharedCounter
+
+
+def test_ids_are_unique_across_threads():
+    allocator = IdAllocator(block_size=16)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: [allocator.next_id() for _ in range(1000)], range(8)))
+    ids = [emp_id for result in results for emp_id in result]
+    assert len(set(ids)) == len(ids) == allocator.issued
+    assert all(result == sorted(result) for result in results)
+
+
+def test_share_keeps_the_ids_already_leased():
+    allocator = IdAllocator(block_size=8)
+    before = [allocator.next_id() for _ in range(3)]
+    counter = allocator.share()
+    assert isinstance(counter, SharedCounter) and allocator.share() is counter
+    after = allocator.next_id()
+    assert after > max(before) and allocator.issued == 4
+
+
+def _lease_in_child(allocator, conn):
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        conn.send((allocator.next_id(), [str(w.message) for w in caught if w.category is RuntimeWarning]))
+
+
+@pytest.mark.parametrize("shared", [False, True])
+def test_forked_child_warns_without_share(shared):
+    allocator = IdAllocator(block_size=8)
+    allocator.next_id()
+    if shared:
+        allocator.share()
+    context = multiprocessing.get_context("fork")
+    parent_conn, child_conn = context.Pipe()
+    child = context.Process(target=_lease_in_child, args=(allocator, child_conn))
+    child.start()
+    child_id, caught = parent_conn.recv()
+    child.join()
+    if shared:
+        assert caught == [] and child_id != allocator.next_id()
+    else:
+        assert len(caught) == 1 and "share()" in caught[0]
+
+
+def test_employee_config_alias_is_deprecated():
+    Employee("Jack", "Michael", 30, 5000.0, "male")
+    with pytest.warns(DeprecationWarning):
+        assert Employee.CONFIG["num_of_emp"] == EMPLOYEE_IDS.issued
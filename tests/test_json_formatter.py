@@ -0,0 +1,66 @@
+import json
+import logging
+
+import pytest
+
+from src.logging.myCustomJsonClass01 import MyJSONFormatter
+
+
+def format_extras(formatter, **extras):
+    record = logging.LogRecord("app", logging.INFO, __file__, 1, "message", None, None)
+    record.__dict__.update(extras)
+    line = json.loads(formatter.format(record))
+    return {key: line[key] for key in extras}
+
+
+@pytest.fixture
+def formatter():
+    schema = {"count": "int", "ratio": "float", "enabled": "bool", "payload": "json", "user": "str"}
+    return MyJSONFormatter(fmt_keys={"message": "message"}, extras_schema=schema, max_value_chars=20)
+
+
+def test_declared_extras_are_converted_without_loss(formatter):
+    assert format_extras(formatter, count="42", ratio=2, enabled="False", payload=(1, 2), user=7) == {"count": 42, "ratio": 2.0, "enabled": False, "payload": [1, 2], "user": "7"}
+    assert format_extras(formatter, count=3.0, enabled=1) == {"count": 3, "enabled": True}
+
+
+@pytest.mark.parametrize("extras", [{"count": 3.9}, {"count": "3.9"}, {"enabled": "no"}, {"enabled": 2}, {"enabled": "x" * 30}])
+def test_lossy_conversions_fall_back_to_the_capped_text(formatter, extras):
+    (key, value), = extras.items()
+    text = str(value)
+    assert format_extras(formatter, **extras) == {key: text if len(text) <= 20 else f"{text[:20]}...({len(text)} chars)"}
+
+
+def test_list_and_dict_extras_are_capped_by_their_serialized_size(formatter):
+    values = format_extras(formatter, items=list(range(2000)), small={"a": 1}, payload={"k": "v" * 50})
+    assert values["items"] == "[0, 1, 2, 3, 4, 5, 6...(10890 chars)"
+    assert values["small"] == {"a": 1}
+    assert values["payload"].startswith('{"k": "vvvvvvvvvvvvv...(')
+    record = logging.LogRecord("app", logging.INFO, __file__, 1, "message", None, None)
+    record.items = list(range(2000))
+    assert len(formatter.format(record)) < 200
+
+
+def test_none_and_unknown_objects(formatter):
+    assert format_extras(formatter, count=None, when=object) == {"count": None, "when": "<class 'object'>"}
+    with pytest.raises(ValueError):
+        MyJSONFormatter(extras_schema={"x": "decimal"})
+
+
+def test_large_objects_are_not_rendered_in_full(formatter):
+    class Rows:
+        rendered = False
+
+        def __len__(self):
+            return 1_000_000
+
+        def __str__(self):
+            Rows.rendered = True
+            return "row\n" * 1_000_000
+
+    class Name(str):
+        pass
+
+    values = format_extras(formatter, rows=Rows(), blob=b"\x00" * 100, label=Name("n" * 30), point=complex(1, 2))
+    assert values == {"rows": "<Rows instance, len 1,000,000>", "blob": repr(b"\x00" * 20) + "...(100 bytes)", "label": "n" * 20 + "...(30 chars)", "point": "(1+2j)"}
+    assert not Rows.rendered
@@ -0,0 +1,58 @@
+import logging
+import threading
+
+from src.concepts.oop.lifecycle import LifecycleTracer
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class Widget:
+    pass
+
+
+def make_tracer(level=logging.INFO, sample_every=3):
+    logger = logging.getLogger(f"test_lifecycle.{level}.{sample_every}")
+    logger.propagate = False
+    logger.setLevel(level)
+    handler = RecordingHandler()
+    logger.handlers = [handler]
+    return LifecycleTracer(logger, interval=3600, sample_every=sample_every), handler.records
+
+
+def test_counts_across_threads_and_summarizes_once():
+    tracer, records = make_tracer()
+    workers = [threading.Thread(target=lambda: [tracer.created(Widget()) for _ in range(500)]) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert tracer.totals() == {"Widget": 2000}
+    assert records == []
+    tracer.flush()
+    tracer.flush()
+    assert len(records) == 1
+    assert (records[0].class_name, records[0].count) == ("Widget", 2000)
+    tracer.created(Widget())
+    tracer.stop()
+    assert [record.count for record in records] == [2000, 1]
+
+
+def test_creation_records_are_sampled_at_debug_only():
+    tracer, records = make_tracer(logging.INFO)
+    for _ in range(10):
+        tracer.created(Widget(), "created %s", "widget")
+    assert records == []
+
+    tracer, records = make_tracer(logging.DEBUG)
+    for _ in range(10):
+        tracer.created(Widget(), "created %s", "widget")
+    assert [record.getMessage() for record in records] == ["created widget"] * 4
+    assert records[0].sampled_every == 3 and records[0].funcName == "test_creation_records_are_sampled_at_debug_only"
+    tracer.stop()
@@ -0,0 +1,17 @@
+import src.logging.L06_final_prod as L06
+from src.main import load_target, parse_args
+
+
+def test_logging_target_sets_up_once_per_run(monkeypatch):
+    calls = []
+    monkeypatch.setattr(L06, "setup_logging", lambda: calls.append("setup"))
+    monkeypatch.setattr(L06, "log_sample_records", lambda: calls.append("log"))
+    target = load_target("logging", repeat=3)
+    assert calls == []
+    target()
+    assert calls == ["setup", "log", "log", "log"]
+
+
+def test_parse_args_profiling_modes():
+    args = parse_args(["--target", "oop", "--repeat", "5", "--sample", "--interval", "0.01"])
+    assert (args.target, args.repeat, args.sample, args.profile, args.interval) == ("oop", 5, True, False, 0.01)
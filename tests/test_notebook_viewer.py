@@ -0,0 +1,66 @@
+import logging
+import os
+import shutil
+import subprocess
+import sys
+
+from src.logging.myNotebookViewer import NotebookLogHandler
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def make_record(name, level, msg, *args):
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+
+def test_emit_keeps_a_bounded_history_and_counts_levels():
+    viewer = NotebookLogHandler(capacity=3)
+    for i in range(5):
+        viewer.handle(make_record("app", logging.INFO if i % 2 else logging.WARNING, "step %d", i))
+    assert [record.getMessage() for record in viewer.records] == ["step 2", "step 3", "step 4"]
+    assert viewer.received == 5
+    assert viewer.level_counts == {"WARNING": 3, "INFO": 2}
+
+
+def test_filter_view_and_pages_select_the_rendered_rows():
+    viewer = NotebookLogHandler(page_size=2)
+    viewer.handle(make_record("app.db", logging.WARNING, "slow <query>"))
+    viewer.handle(make_record("app.dbx", logging.WARNING, "other logger"))
+    viewer.handle(make_record("app.db.pool", logging.ERROR, "pool exhausted"))
+    viewer.handle(make_record("app.db", logging.INFO, "connected"))
+    viewer.filter_view(level="WARNING", logger="app.db")
+    page = viewer.render_html()
+    assert "2 shown of 4 kept" in page
+    assert "slow &lt;query&gt;" in page and "pool exhausted" in page
+    assert "other logger" not in page and "connected" not in page
+
+    viewer.filter_view()
+    viewer.page(0)
+    page = viewer.render_html()
+    assert "page 1/2" in page and "slow &lt;query&gt;" in page and "connected" not in page
+    viewer.follow()
+    assert "connected" in viewer.render_html()
+
+
+def test_viewer_takes_the_stdout_filters_and_level(tmp_path):
+    # config06.json logs to a path relative to the working directory, keep the log file out of the tree
+    (tmp_path / "src" / "logging").mkdir(parents=True)
+    shutil.copy(os.path.join(PROJECT_ROOT, "src", "logging", "config06.json"), tmp_path / "src" / "logging")
+    code = (
+        "import logging, src.logging.L06_final_prod as L06\n"
+        "L06.setup_logging(notebook=True)\n"
+        "viewer = L06.notebook_viewer\n"
+        "print(logging.getLevelName(viewer.level), ','.join(type(f).__name__ for f in viewer.filters))\n"
+        "viewer.filters = []\n"
+        "L06.reload_logging()\n"
+        "L06.logger.info('card 4111 1111 1111 1111')\n"
+        "L06.queue_listener.stop()\n"
+        "print(logging.getLevelName(viewer.level), ','.join(type(f).__name__ for f in viewer.filters))\n"
+        "print(viewer.records[-1].getMessage())"
+    )
+    env = {**os.environ, "PYTHONPATH": PROJECT_ROOT}
+    result = subprocess.run([sys.executable, "-c", code], cwd=tmp_path, env=env, capture_output=True, text=True, check=True)
+    setup, reloaded, message = result.stdout.strip().splitlines()[-3:]
+    assert setup == reloaded
+    assert "RedactionFilter" in setup.split()[1]
+    assert "[REDACTED]" in message and "4111" not in message
@@ -0,0 +1,52 @@
+import json
+import logging
+import sys
+
+import pytest
+
+from src.logging.myCustomJsonClass01 import MyJSONFormatter
+from src.logging.myRedisStreamHandler import LocalRedisServer, RedisStreamHandler, get_client
+
+
+def make_records(n):
+    return [logging.LogRecord("app", logging.WARNING if i % 2 else logging.INFO, __file__, 1, "record %d", (i,), None) for i in range(n)]
+
+
+def make_handler(url, **options):
+    handler = RedisStreamHandler("logs", url, flush_interval=3600, timeout=0.2, **options)
+    handler.setFormatter(MyJSONFormatter(fmt_keys={"level": "levelname", "message": "message"}))
+    return handler
+
+
+def test_missing_client_names_the_optional_install(monkeypatch):
+    monkeypatch.setitem(sys.modules, "redis", None)
+    get_client.cache_clear()
+    with pytest.raises(ImportError, match="pip install redis"):
+        RedisStreamHandler("logs", "redis://127.0.0.1:1/0")
+
+
+def test_pipelined_batches_reach_the_stream():
+    pytest.importorskip("redis")
+    with LocalRedisServer() as server:
+        handler = make_handler(server.url, batch_size=10, maxlen=1000)
+        for record in make_records(25):
+            handler.handle(record)
+        assert handler.sent == 20
+        handler.close()
+    entries = server.streams[b"logs"]
+    assert handler.sent == len(entries) == 25
+    _, fields = entries[3]
+    assert fields[b"level"] == b"WARNING" and json.loads(fields[b"record"])["message"] == "record 3"
+
+
+def test_records_are_buffered_while_redis_is_down():
+    pytest.importorskip("redis")
+    server = LocalRedisServer().start()
+    url = server.url
+    server.stop()
+    handler = make_handler(url, batch_size=5, max_buffered=8, max_backoff=0.01)
+    for record in make_records(12):
+        handler.handle(record)
+    assert handler.sent == 0 and len(handler._buffer) == 8 and handler.dropped == 4
+    assert handler._backoff > 0
+    handler.close()
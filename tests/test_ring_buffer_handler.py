@@ -0,0 +1,61 @@
+import logging
+
+from src.logging.myRingBufferHandler import DebugOnErrorHandler
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+        self.closed = False
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+    def close(self):
+        self.closed = True
+        super().close()
+
+
+def make_record(level, msg, exc_info=None, **extras):
+    record = logging.LogRecord("app", level, __file__, 1, msg, None, exc_info)
+    record.__dict__.update(extras)
+    return record
+
+
+def test_context_is_written_only_when_an_error_follows():
+    target = ListHandler()
+    handler = DebugOnErrorHandler(capacity=3, target=target)
+    for i in range(5):
+        handler.handle(make_record(logging.DEBUG, f"debug {i}"))
+    handler.handle(make_record(logging.WARNING, "warning"))
+    assert target.messages == ["warning"]
+    handler.handle(make_record(logging.ERROR, "error"))
+    assert target.messages == ["warning", "debug 2", "debug 3", "debug 4", "error"]
+    assert handler.flushed == 3
+    handler.handle(make_record(logging.ERROR, "second error"))
+    assert target.messages[-1] == "second error" and handler.flushed == 3
+
+
+def test_rings_are_kept_per_context_and_exceptions_flush():
+    target = ListHandler()
+    handler = DebugOnErrorHandler(capacity=10, target=target, context="request_id", max_contexts=2, close_target=True)
+    for request_id in ("a", "b", "c"):
+        handler.handle(make_record(logging.INFO, f"start {request_id}", request_id=request_id))
+    handler.handle(make_record(logging.ERROR, "a failed", request_id="a"))
+    assert target.messages == ["a failed"]  # The ring of "a" was forgotten beyond max_contexts
+    handler.handle(make_record(logging.INFO, "b failed", exc_info=(ValueError, ValueError("x"), None), request_id="b"))
+    assert target.messages == ["a failed", "start b", "b failed"]
+    handler.close()
+    assert target.closed
+
+
+def test_least_recently_used_context_is_forgotten_first():
+    target = ListHandler()
+    handler = DebugOnErrorHandler(capacity=10, target=target, context="request_id", max_contexts=2)
+    handler.handle(make_record(logging.INFO, "main 1", request_id="main"))
+    handler.handle(make_record(logging.INFO, "short-lived", request_id="a"))
+    handler.handle(make_record(logging.INFO, "main 2", request_id="main"))
+    handler.handle(make_record(logging.INFO, "other", request_id="b"))
+    handler.handle(make_record(logging.ERROR, "main failed", request_id="main"))
+    assert target.messages == ["main 1", "main 2", "main failed"]
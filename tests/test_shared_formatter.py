@@ -0,0 +1,66 @@
+import logging
+import queue
+
+from src.logging.myQueueListener import FormatOnceQueueListener
+from src.logging.mySharedFormatter import FORMAT_CACHE_ATTR, SharedFormatter, share_formatters
+
+
+class CountingFormatter(logging.Formatter):
+    def __init__(self):
+        super().__init__("%(levelname)s %(message)s")
+        self.calls = 0
+
+    def format(self, record):
+        self.calls += 1
+        return super().format(record)
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.lines = []
+
+    def emit(self, record):
+        self.lines.append(self.format(record))
+
+
+def test_handlers_sharing_a_formatter_format_each_record_once():
+    formatter = CountingFormatter()
+    first, second = ListHandler(), ListHandler()
+    first.setFormatter(formatter)
+    second.setFormatter(formatter)
+    log_queue = queue.SimpleQueue()
+    listener = FormatOnceQueueListener(log_queue, first, second)
+
+    listener.handle(logging.LogRecord("test", logging.INFO, __file__, 1, "hello %s", ("world",), None))
+
+    assert formatter.calls == 1
+    assert first.lines == second.lines == ["INFO hello world"]
+
+
+def test_share_formatters_is_idempotent():
+    formatter = CountingFormatter()
+    handlers = [ListHandler(), ListHandler()]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    share_formatters(handlers)
+    proxy = handlers[0].formatter
+    share_formatters(handlers)
+
+    assert isinstance(proxy, SharedFormatter)
+    assert handlers[0].formatter is handlers[1].formatter is proxy
+    assert proxy.formatter is formatter
+
+
+def test_a_copied_record_starts_with_an_empty_cache():
+    formatter = CountingFormatter()
+    handler = ListHandler()
+    handler.setFormatter(formatter)
+    listener = FormatOnceQueueListener(queue.SimpleQueue(), handler)
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "hello", None, None)
+    setattr(record, FORMAT_CACHE_ATTR, {handler.formatter: "stale"})
+
+    listener.handle(record)
+
+    assert handler.lines == ["INFO hello"]
@@ -0,0 +1,117 @@
+import logging
+import socket
+import threading
+import time
+
+import pytest
+
+from src.logging.myCustomJsonClass01 import MyJSONFormatter
+from src.logging.myShippingHandler import DiskSpill, LocalCollector, ShippingHandler, close_pools, parse_address
+
+
+def make_record(i):
+    return logging.LogRecord("ship", logging.INFO, __file__, i, "record %d", (i,), None)
+
+
+def make_handler(address, **options):
+    handler = ShippingHandler(address, **options)
+    handler.setFormatter(MyJSONFormatter(fmt_keys={"level": "levelname", "message": "message"}))
+    return handler
+
+
+@pytest.fixture(autouse=True)
+def pools():
+    yield
+    close_pools()
+
+
+def test_parse_address():
+    assert parse_address("tcp://localhost:5170") == (socket.AF_INET, ("localhost", 5170))
+    assert parse_address(["127.0.0.1", "9"]) == (socket.AF_INET, ("127.0.0.1", 9))
+    assert parse_address("unix:///tmp/collector.sock") == (socket.AF_UNIX, "/tmp/collector.sock")
+
+
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_batches_reach_the_collector_in_order(compression):
+    with LocalCollector(compression=compression) as collector:
+        handler = make_handler(collector.address, batch_size=7, compression=compression)
+        for i in range(50):
+            handler.handle(make_record(i))
+        handler.close()
+        assert collector.wait_for(50, timeout=5)
+    assert [record["message"] for record in collector.records] == [f"record {i}" for i in range(50)]
+    assert handler.shipped == 50 and handler.dropped == 0
+
+
+def test_spill_while_down_then_replay_on_reconnect(tmp_path):
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    spill_path = tmp_path / "spill.jsonl"
+    handler = make_handler(f"127.0.0.1:{port}", batch_size=5, flush_interval=0.05, spill_path=str(spill_path), max_backoff=0.1)
+    for i in range(20):
+        handler.handle(make_record(i))
+    handler.flush()
+    assert handler.shipped == 0 and spill_path.read_bytes().count(b"\n") == 20
+
+    with LocalCollector(f"127.0.0.1:{port}") as collector:
+        handler.handle(make_record(20))
+        assert collector.wait_for(21, timeout=5)
+        deadline = time.monotonic() + 5
+        while handler.spill.size and time.monotonic() < deadline:
+            time.sleep(0.01)
+        handler.close()
+    assert [record["message"] for record in collector.records] == [f"record {i}" for i in range(21)]
+    assert handler.spill.size == 0 and spill_path.read_bytes() == b""
+
+
+def test_disk_spill_is_bounded(tmp_path):
+    spill = DiskSpill(str(tmp_path / "spill.jsonl"), max_bytes=10)
+    assert spill.append(b"abc\ndef\n", 2)
+    assert not spill.append(b"ghi\n", 1)
+    assert spill.dropped == 1 and spill.read() == b"abc\ndef\n"
+    spill.discard(4)
+    assert spill.read() == b"def\n" and spill.size == 4
+
+
+def test_full_queue_keeps_the_order_and_bounds_the_held_records():
+    handler = make_handler("127.0.0.1:9", batch_size=5, max_pending=2, flush_interval=60)
+    sending, release, payloads = threading.Event(), threading.Event(), []
+
+    def slow_send(payload):
+        sending.set()
+        release.wait(5)
+        payloads.append(payload)
+        return True
+
+    handler._send = slow_send
+    for i in range(5):
+        handler.handle(make_record(i))
+    assert sending.wait(5)
+    # Two batches queued, then ten records held in the current batch, then drops
+    for i in range(5, 26):
+        handler.handle(make_record(i))
+    assert handler.dropped == 1
+    release.set()
+    handler.close()
+    assert [line.split(b'"message": "')[1].split(b'"')[0] for line in b"".join(payloads).splitlines()] == [f"record {i}".encode() for i in range(25)]
+
+
+def test_flush_under_the_handler_lock_does_not_wait_on_the_sender():
+    # logging.shutdown() holds the handler lock while it flushes, the sender's timer tick must not need it
+    handler = make_handler("127.0.0.1:9", batch_size=100, flush_interval=0.01, max_backoff=0.01)
+    handler._send = lambda payload: True
+    done = threading.Event()
+
+    def shutdown():
+        with handler.lock:
+            for i in range(3):
+                handler.handle(make_record(i))
+            time.sleep(0.1)  # Timer ticks fire meanwhile
+            handler.flush()
+            handler.close()
+        done.set()
+
+    threading.Thread(target=shutdown, daemon=True).start()
+    assert done.wait(3)
+    assert handler.shipped == 3
@@ -0,0 +1,79 @@
+import logging
+import threading
+import time
+
+from src.logging.myFilters import NoSpanFilter
+from src.logging.mySpans import SpanRecorder
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def make_recorder(name, level=logging.DEBUG, **options):
+    logger = logging.getLogger(name)
+    logger.propagate = False
+    logger.setLevel(level)
+    handler = RecordingHandler()
+    logger.handlers = [handler]
+    return SpanRecorder(name, **options), handler.records
+
+
+def test_nested_spans_are_buffered_then_emitted_with_their_parent():
+    recorder, records = make_recorder("test_spans.nested", flush_interval=3600)
+    with recorder.span("outer"):
+        with recorder.span("inner"):
+            time.sleep(0.001)
+    assert records == []
+    recorder.flush()
+    inner, outer = records
+    assert (inner.span_name, outer.span_name) == ("inner", "outer")
+    assert inner.parent_id == outer.span_id and outer.parent_id is None
+    assert outer.duration_ns >= inner.duration_ns >= 1_000_000
+    assert inner.getMessage() == f"span inner took {inner.duration_ns} ns"
+    assert abs(outer.created - outer.start_ns / 1e9) < 1e-6
+    assert not NoSpanFilter().filter(logging.makeLogRecord({"name": "spans"}))
+
+
+def test_full_buffer_flushes_and_sampling_skips_whole_trees():
+    recorder, records = make_recorder("test_spans.sampled", capacity=4, sample_every=2, flush_interval=3600)
+
+    @recorder.timed()
+    def work():
+        with recorder.span("child"):
+            pass
+
+    for _ in range(4):
+        work()
+    assert [record.span_name for record in records] == ["child", "test_full_buffer_flushes_and_sampling_skips_whole_trees.<locals>.work"] * 2
+
+
+def test_disabled_and_below_level_record_nothing():
+    recorder, records = make_recorder("test_spans.disabled", level=logging.INFO, enabled=False)
+    with recorder.span("ignored") as span:
+        assert span is None
+    recorder.enable()
+    with recorder.span("recorded"):
+        pass
+    recorder.flush_all()
+    assert records == []
+
+
+def test_buffer_of_an_exited_thread_is_flushed_and_dropped():
+    recorder, records = make_recorder("test_spans.threads", flush_interval=3600)
+
+    def work(i):
+        with recorder.span(f"task {i}"):
+            pass
+
+    for i in range(20):
+        worker = threading.Thread(target=work, args=(i,), name=f"worker-{i}")
+        worker.start()
+        worker.join()
+    assert recorder._buffers == []
+    assert [(record.span_name, record.threadName) for record in records] == [(f"task {i}", f"worker-{i}") for i in range(20)]
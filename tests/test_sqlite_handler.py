@@ -0,0 +1,63 @@
+import json
+import logging
+import sqlite3
+
+from src.logging.myCustomJsonClass01 import MyJSONFormatter
+from src.logging.mySQLiteHandler import SQLiteHandler
+
+
+def make_record(level, msg, exc_info=None, **extras):
+    record = logging.LogRecord("app.db", level, __file__, 12, msg, None, exc_info, func="query")
+    record.__dict__.update(extras)
+    return record
+
+
+def test_rows_are_batched_and_queryable(tmp_path):
+    database = str(tmp_path / "logs.db")
+    handler = SQLiteHandler(database, batch_size=3, flush_interval=3600)
+    handler.setFormatter(MyJSONFormatter(fmt_keys={"level": "levelname", "message": "message", "timestamp": "timestamp", "logger": "name", "line": "lineno"}))
+    for i in range(4):
+        handler.handle(make_record(logging.ERROR if i % 2 else logging.INFO, f"query {i}", user_id=i))
+    with sqlite3.connect(database) as reader:
+        assert reader.execute("SELECT COUNT(*) FROM logs").fetchone()[0] == 3
+        handler.flush()
+        rows = reader.execute("SELECT message, line FROM logs WHERE level = 'ERROR' AND json_extract(extras, '$.user_id') = 3").fetchall()
+        assert rows == [("query 3", 12)]
+        indexes = {row[0] for row in reader.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        assert indexes == {"ix_logs_level", "ix_logs_timestamp", "ix_logs_logger"}
+    handler.close()
+
+
+def test_default_columns_and_exceptions(tmp_path):
+    database = str(tmp_path / "logs.db")
+    handler = SQLiteHandler(database, table="incidents", flush_interval=3600)
+    try:
+        1 / 0
+    except ZeroDivisionError as error:
+        handler.handle(make_record(logging.ERROR, "failed", (type(error), error, error.__traceback__), payload={"a": [1, 2]}))
+    handler.close()
+    with sqlite3.connect(database) as reader:
+        reader.row_factory = sqlite3.Row
+        row = reader.execute("SELECT * FROM incidents").fetchone()
+    assert (row["level"], row["function"], row["message"]) == ("ERROR", "query", "failed")
+    assert "ZeroDivisionError" in row["exc_info"]
+    assert json.loads(row["extras"]) == {"payload": {"a": [1, 2]}}
+
+
+def test_failed_inserts_keep_a_bounded_buffer(tmp_path, monkeypatch):
+    monkeypatch.setattr(logging, "raiseExceptions", False)  # handleError stays quiet
+    database = str(tmp_path / "logs.db")
+    handler = SQLiteHandler(database, batch_size=2, flush_interval=0.01, max_buffered=5, timeout=0.01)
+    handler.handle(make_record(logging.INFO, "before"))
+    handler.flush()
+    locker = sqlite3.connect(database, isolation_level=None)
+    locker.execute("BEGIN EXCLUSIVE")
+    for i in range(7):
+        handler.handle(make_record(logging.INFO, f"while locked {i}"))
+    assert len(handler._rows) == 5 and handler.dropped == 2
+    locker.execute("ROLLBACK")
+    handler.flush()
+    messages = [row[0] for row in locker.execute("SELECT message FROM logs ORDER BY id")]
+    assert messages == ["before"] + [f"while locked {i}" for i in range(5)]
+    locker.close()
+    handler.close()
@@ -0,0 +1,33 @@
+import os
+import shutil
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OPT_IN_MODULES = (
+    "src.logging.myTailServer",
+    "src.logging.myNotebookViewer",
+    "src.logging.myRingBufferHandler",
+    "src.logging.myHotReload",
+)
+
+
+def test_l06_import_leaves_opt_in_modules_unloaded():
+    code = f"import sys, src.logging.L06_final_prod; print(','.join(m for m in {OPT_IN_MODULES!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ""
+
+
+def test_setup_branch_imports_its_module(tmp_path):
+    # config06.json logs to a path relative to the working directory, keep the log file out of the tree
+    (tmp_path / "src" / "logging").mkdir(parents=True)
+    shutil.copy(os.path.join(PROJECT_ROOT, "src", "logging", "config06.json"), tmp_path / "src" / "logging")
+    code = (
+        "import sys, src.logging.L06_final_prod as L06\n"
+        "L06.setup_logging(debug_on_error=10)\n"
+        "print(','.join(sorted(m for m in " + repr(OPT_IN_MODULES) + " if m in sys.modules)))\n"
+        "L06.queue_listener.stop()"
+    )
+    env = {**os.environ, "PYTHONPATH": PROJECT_ROOT}
+    result = subprocess.run([sys.executable, "-c", code], cwd=tmp_path, env=env, capture_output=True, text=True, check=True)
+    assert result.stdout.strip().splitlines()[-1] == "src.logging.myRingBufferHandler"
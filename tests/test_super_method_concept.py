@@ -0,0 +1,22 @@
+import pytest
+
+from src.concepts.oop.super_method_understanding import SuperMethodConcept
+
+
+def test_classes_are_built_once_per_variant():
+    Employee, Animal, Dog = SuperMethodConcept()
+    assert SuperMethodConcept() == (Employee, Animal, Dog)
+    assert isinstance(SuperMethodConcept()[2]("Jack", 12, "Bouldog", 1), Dog)
+    assert SuperMethodConcept(slots=True)[2] is not Dog
+    assert SuperMethodConcept(slots=1) == SuperMethodConcept(slots=True)
+
+
+def test_slotted_hierarchy_has_no_instance_dict():
+    _, Animal, Dog = SuperMethodConcept(slots=True)
+    dog = Dog("Jack", 12, "Bouldog", 1)
+    assert not hasattr(dog, "__dict__")
+    assert (dog.dog_name, dog.breed, dog.sex) == ("Jack", "Bouldog", 1)
+    assert str(dog) == "This is an Object created using Dog, with: Bouldog with gender: 1"
+    with pytest.raises(AttributeError):
+        dog.nickname = "J"
+    assert hasattr(SuperMethodConcept()[2]("Jack"), "__dict__")
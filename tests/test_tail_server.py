@@ -0,0 +1,65 @@
+import json
+import logging
+import socket
+import time
+
+from src.logging.myCustomJsonClass01 import MyJSONFormatter
+from src.logging.myTailServer import Subscriber, TailServer
+
+
+def make_record(name, level, msg, **extras):
+    record = logging.LogRecord(name, level, __file__, 1, msg, None, None, func="main")
+    record.__dict__.update(extras)
+    return record
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return condition()
+
+
+def test_subscriber_filter():
+    subscriber = Subscriber(None, logging.WARNING, "src.logging", {"user": "ada"})
+    assert subscriber.matches(make_record("src.logging.L06", logging.ERROR, "x", user="ada"))
+    assert not subscriber.matches(make_record("src.logging.L06", logging.INFO, "x", user="ada"))
+    assert not subscriber.matches(make_record("src.loggingx", logging.ERROR, "x", user="ada"))
+    assert not subscriber.matches(make_record("src.logging", logging.ERROR, "x"))
+
+
+def test_viewer_receives_only_matching_records(tmp_path):
+    server = TailServer(str(tmp_path / "tail.sock")).start()
+    server.handler.setFormatter(MyJSONFormatter(fmt_keys={"level": "levelname", "logger": "name", "message": "message"}))
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as viewer:
+            viewer.connect(server.path)
+            viewer.sendall(b'{"level": "warning", "logger": "app"}\n')
+            assert wait_until(lambda: len(server.subscribers) == 1)
+            for name, level, msg in (("app", logging.INFO, "quiet"), ("app.db", logging.ERROR, "db down"), ("other", logging.ERROR, "elsewhere"), ("app", logging.WARNING, "slow")):
+                server.handler.handle(make_record(name, level, msg))
+            stream = viewer.makefile("rb")
+            lines = [json.loads(stream.readline()) for _ in range(2)]
+            assert [(line["logger"], line["message"]) for line in lines] == [("app.db", "db down"), ("app", "slow")]
+            server.stop()
+            assert stream.readline() == b""
+    finally:
+        server.stop()
+
+
+def test_slow_viewer_is_dropped(tmp_path):
+    server = TailServer(str(tmp_path / "tail.sock"), buffer_size=2).start()
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as viewer:
+            viewer.connect(server.path)
+            viewer.sendall(b"\n")
+            assert wait_until(lambda: len(server.subscribers) == 1)
+            # The viewer never reads: its buffer fills up once the socket buffers are full
+            payload = "x" * 65536
+            for _ in range(200):
+                server.handler.handle(make_record("app", logging.INFO, payload))
+                if server.dropped:
+                    break
+            assert server.dropped == 1 and server.subscribers == ()
+    finally:
+        server.stop()